@@ -1,6 +1,7 @@
 """Sentence boundary detection for professional video editing"""
 from typing import List, Dict, Tuple, Optional
 import re
+import numpy as np
 
 
 class SentenceBoundaryDetector:
@@ -23,6 +24,9 @@ class SentenceBoundaryDetector:
         """
         self.min_pause_threshold = min_pause_threshold
 
+        # (boundaries list, times array) from the last find_sentence_boundaries()
+        self._boundary_cache: Optional[Tuple[List[Dict], np.ndarray]] = None
+
         # Sentence ending punctuation
         self.sentence_endings = {'.', '!', '?', '...'}
 
@@ -97,34 +101,38 @@ class SentenceBoundaryDetector:
         # Sort by time
         boundaries.sort(key=lambda x: x['time'])
 
+        # Every clip aligned against these boundaries reuses one times array
+        self._boundary_cache = (boundaries, self._times_array(boundaries))
+
         return boundaries
 
     def find_nearest_boundary_before(
         self,
         timestamp: float,
         boundaries: List[Dict],
-        max_distance: Optional[float] = None
+        max_distance: Optional[float] = None,
+        boundary_times: Optional[np.ndarray] = None
     ) -> Optional[Dict]:
         """
         Find the nearest sentence boundary before a given timestamp
 
         Args:
             timestamp: Target timestamp
-            boundaries: List of boundaries from find_sentence_boundaries()
+            boundaries: Time-sorted boundaries from find_sentence_boundaries()
             max_distance: Maximum allowed distance (seconds) to search back
+            boundary_times: Optional precomputed array of boundary times
 
         Returns:
             Nearest boundary before timestamp, or None if none found within max_distance
         """
-        candidates = [b for b in boundaries if b['time'] <= timestamp]
+        if boundary_times is None:
+            boundary_times = self.boundary_times(boundaries)
 
-        if not candidates:
+        idx = int(np.searchsorted(boundary_times, timestamp, side='right')) - 1
+        if idx < 0:
             return None
 
-        # Sort by distance to timestamp (closest first)
-        candidates.sort(key=lambda b: timestamp - b['time'])
-
-        nearest = candidates[0]
+        nearest = boundaries[idx]
 
         # Check distance constraint
         if max_distance is not None:
@@ -138,28 +146,29 @@ class SentenceBoundaryDetector:
         self,
         timestamp: float,
         boundaries: List[Dict],
-        max_distance: Optional[float] = None
+        max_distance: Optional[float] = None,
+        boundary_times: Optional[np.ndarray] = None
     ) -> Optional[Dict]:
         """
         Find the nearest sentence boundary after a given timestamp
 
         Args:
             timestamp: Target timestamp
-            boundaries: List of boundaries from find_sentence_boundaries()
+            boundaries: Time-sorted boundaries from find_sentence_boundaries()
             max_distance: Maximum allowed distance (seconds) to search forward
+            boundary_times: Optional precomputed array of boundary times
 
         Returns:
             Nearest boundary after timestamp, or None if none found within max_distance
         """
-        candidates = [b for b in boundaries if b['time'] >= timestamp]
+        if boundary_times is None:
+            boundary_times = self.boundary_times(boundaries)
 
-        if not candidates:
+        idx = int(np.searchsorted(boundary_times, timestamp, side='left'))
+        if idx >= len(boundaries):
             return None
 
-        # Sort by distance to timestamp (closest first)
-        candidates.sort(key=lambda b: b['time'] - timestamp)
-
-        nearest = candidates[0]
+        nearest = boundaries[idx]
 
         # Check distance constraint
         if max_distance is not None:
@@ -169,6 +178,30 @@ class SentenceBoundaryDetector:
 
         return nearest
 
+    def boundary_times(self, boundaries: List[Dict]) -> np.ndarray:
+        """
+        Sorted float64 array of boundary times for binary search
+
+        The array for the list last returned by find_sentence_boundaries()
+        is cached, so repeated calls for the same boundaries are free.
+
+        Args:
+            boundaries: Time-sorted boundaries from find_sentence_boundaries()
+
+        Returns:
+            Array of boundary times aligned with the boundaries list
+        """
+        cache = self._boundary_cache
+        if cache is not None and cache[0] is boundaries and len(cache[1]) == len(boundaries):
+            return cache[1]
+        return self._times_array(boundaries)
+
+    @staticmethod
+    def _times_array(boundaries: List[Dict]) -> np.ndarray:
+        """Boundary times as a float64 array"""
+        return np.fromiter((b['time'] for b in boundaries), dtype=np.float64,
+                           count=len(boundaries))
+
     def align_clip_to_boundaries(
         self,
         start_time: float,
@@ -176,7 +209,8 @@ class SentenceBoundaryDetector:
         boundaries: List[Dict],
         max_adjustment: float = 10.0,
         min_clip_duration: Optional[float] = None,
-        max_clip_duration: Optional[float] = None
+        max_clip_duration: Optional[float] = None,
+        boundary_times: Optional[np.ndarray] = None
     ) -> Tuple[float, float, Dict]:
         """
         Align clip start/end to nearest sentence boundaries for clean cuts
@@ -184,20 +218,26 @@ class SentenceBoundaryDetector:
         Args:
             start_time: Original clip start time
             end_time: Original clip end time
-            boundaries: List of sentence boundaries
+            boundaries: Time-sorted list of sentence boundaries
             max_adjustment: Maximum seconds to adjust start/end (default: 10s)
             min_clip_duration: Optional minimum clip duration constraint
             max_clip_duration: Optional maximum clip duration constraint
+            boundary_times: Optional precomputed array from boundary_times()
 
         Returns:
             Tuple of (adjusted_start, adjusted_end, metadata)
         """
+        if boundary_times is None:
+            boundary_times = self.boundary_times(boundaries)
+
         # Find nearest boundaries
         start_boundary = self.find_nearest_boundary_before(
-            start_time, boundaries, max_distance=max_adjustment
+            start_time, boundaries, max_distance=max_adjustment,
+            boundary_times=boundary_times
         )
         end_boundary = self.find_nearest_boundary_after(
-            end_time, boundaries, max_distance=max_adjustment
+            end_time, boundaries, max_distance=max_adjustment,
+            boundary_times=boundary_times
         )
 
         # Use boundaries if found, otherwise use original times
@@ -225,7 +265,8 @@ class SentenceBoundaryDetector:
             # Clip too short - try to extend end
             extended_end = adjusted_start + min_clip_duration
             end_extension = self.find_nearest_boundary_after(
-                extended_end, boundaries, max_distance=5.0
+                extended_end, boundaries, max_distance=5.0,
+                boundary_times=boundary_times
             )
             if end_extension:
                 adjusted_end = end_extension['time']
@@ -234,7 +275,8 @@ class SentenceBoundaryDetector:
             # Clip too long - try to trim end
             trimmed_end = adjusted_start + max_clip_duration
             end_trim = self.find_nearest_boundary_before(
-                trimmed_end, boundaries, max_distance=5.0
+                trimmed_end, boundaries, max_distance=5.0,
+                boundary_times=boundary_times
             )
             if end_trim:
                 adjusted_end = end_trim['time']
@@ -1,5 +1,6 @@
 """Arena CLI - Main entry point"""
 
+import os
 import sys
 import argparse
 from pathlib import Path
@@ -32,6 +33,7 @@ Examples:
 Environment:
   OPENAI_API_KEY    Required for transcription and analysis
                     Get from: https://platform.openai.com/api-keys
+  ARENA_DEBUG       Print full tracebacks on error (same as --debug)
 
 Documentation:
   See README.md and QUICKSTART.md for detailed usage
@@ -43,6 +45,21 @@ Documentation:
         action='version',
         version=f'Arena {__version__}'
     )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Print full tracebacks on error'
+    )
+
+    # Also accepted after the subcommand (arena process video.mp4 --debug).
+    # SUPPRESS keeps a subcommand from resetting a top-level --debug to False.
+    debug_parser = argparse.ArgumentParser(add_help=False)
+    debug_parser.add_argument(
+        '--debug',
+        action='store_true',
+        default=argparse.SUPPRESS,
+        help='Print full tracebacks on error'
+    )
 
     subparsers = parser.add_subparsers(
         title='commands',
@@ -55,6 +72,7 @@ Documentation:
     # =========================================================================
     extract_parser = subparsers.add_parser(
         'extract-audio',
+        parents=[debug_parser],
         help='Extract audio from video',
         description='Extract audio track from video file'
     )
@@ -91,6 +109,7 @@ Documentation:
     # =========================================================================
     process_parser = subparsers.add_parser(
         'process',
+        parents=[debug_parser],
         help='Run full pipeline: transcribe → analyze → generate clips',
         description='Process video and generate clips automatically'
     )
@@ -180,6 +199,7 @@ Documentation:
     # =========================================================================
     transcribe_parser = subparsers.add_parser(
         'transcribe',
+        parents=[debug_parser],
         help='Transcribe video audio with OpenAI Whisper',
         description='Transcribe video using OpenAI Whisper API'
     )
@@ -205,6 +225,7 @@ Documentation:
     # =========================================================================
     analyze_parser = subparsers.add_parser(
         'analyze',
+        parents=[debug_parser],
         help='Analyze video with AI + energy detection',
         description='Analyze video using hybrid AI + audio energy'
     )
@@ -256,6 +277,7 @@ Documentation:
     # =========================================================================
     generate_parser = subparsers.add_parser(
         'generate',
+        parents=[debug_parser],
         help='Generate video clips from analysis results',
         description='Generate clips from analysis JSON'
     )
@@ -293,6 +315,7 @@ Documentation:
     # =========================================================================
     demo_parser = subparsers.add_parser(
         'demo',
+        parents=[debug_parser],
         help='Run demo with test data (no API key needed)',
         description='Run Arena demo using existing test data'
     )
@@ -307,6 +330,7 @@ Documentation:
     # =========================================================================
     info_parser = subparsers.add_parser(
         'info',
+        parents=[debug_parser],
         help='Show video metadata and information',
         description='Display video file information'
     )
@@ -322,6 +346,7 @@ Documentation:
     # =========================================================================
     format_parser = subparsers.add_parser(
         'format',
+        parents=[debug_parser],
         help='Format clips for specific social media platforms',
         description='Convert clips to optimal format for TikTok, Instagram, YouTube, etc.'
     )
@@ -368,6 +393,7 @@ Documentation:
     # =========================================================================
     detect_scenes_parser = subparsers.add_parser(
         'detect-scenes',
+        parents=[debug_parser],
         help='Detect scene changes in video',
         description='Analyze video to find scene boundaries for better clip alignment'
     )
@@ -444,8 +470,9 @@ Documentation:
         return 130
     except Exception as e:
         print(f"\n❌ Error: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+        if args.debug or os.environ.get('ARENA_DEBUG'):
+            import traceback
+            traceback.print_exc()
         return 1
 
 
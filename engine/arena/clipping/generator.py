@@ -1,10 +1,358 @@
 """Video clip extraction and generation"""
+import asyncio
+import bisect
+import contextlib
+import functools
+import hashlib
+import os
+import queue
+import threading
+from collections import deque
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 import subprocess
 import json
 import shutil
 import re
+import tarfile
+import tempfile
+import urllib.request
+from urllib.parse import urljoin, urlparse
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import av
+    HAS_AV = True
+except ImportError:
+    HAS_AV = False
+
+# Fetch both timing fields of a segment dict in one C-level call
+_SEG_TIMES = itemgetter('start_time', 'end_time')
+
+# Filename sanitizing: drop unsafe chars, then collapse runs of spaces/hyphens
+_SAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+_COLLAPSE_RE = re.compile(r'[-\s]+')
+
+# HLS master playlist variant bitrate (#EXT-X-STREAM-INF attribute)
+_BANDWIDTH_RE = re.compile(r'BANDWIDTH=(\d+)')
+
+# Persistent ffprobe results, keyed by (path, mtime, size) of the source
+FFPROBE_CACHE_DIR = Path(
+    os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+) / 'arena' / 'ffprobe'
+
+# Protocols FFmpeg may open when reading a local, trimmed HLS playlist
+_HLS_PROTOCOLS = "file,http,https,tcp,tls,crypto"
+
+# FFmpeg stderr is read in chunks and only the last few are kept for errors
+_STDERR_CHUNK_BYTES = 4096
+_STDERR_TAIL_CHUNKS = 2
+
+# Encoder threads given to each FFmpeg job when several run in parallel
+THREADS_PER_JOB = 2
+
+# Hardware H.264 encoders, in order of preference, used when codec="auto"
+HW_ENCODERS = ("h264_nvenc", "h264_videotoolbox", "h264_qsv")
+
+# Hardware encoders that failed at runtime (listed by FFmpeg but no device)
+_failed_hw_encoders = set()
+
+
+def _temp_output_path(path: Path) -> Path:
+    """Sibling temp path that keeps the extension FFmpeg picks the muxer from"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.tmp{path.suffix}")
+
+
+def _redirect_outputs(
+    command: List[str],
+    outputs: Sequence[Path]
+) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Point a command's output arguments at temp files next to them
+
+    Returns:
+        Tuple of (new command, {temp path: final path})
+    """
+    command = list(command)
+    renames = {}
+    for final in map(str, outputs):
+        tmp = str(_temp_output_path(final))
+        # Outputs follow the inputs, so replace the last occurrence
+        command[len(command) - 1 - command[::-1].index(final)] = tmp
+        renames[tmp] = final
+    return command, renames
+
+
+def _finish_outputs(renames: Dict[str, str], success: bool) -> None:
+    """Move temp outputs into place on success, delete them otherwise"""
+    for tmp, final in renames.items():
+        if success:
+            os.replace(tmp, final)
+        else:
+            Path(tmp).unlink(missing_ok=True)
+
+
+def _run_ffmpeg(
+    command: List[str],
+    error_prefix: str,
+    outputs: Sequence[Path] = ()
+) -> None:
+    """
+    Run an FFmpeg command, keeping only the tail of its stderr
+
+    stdout is discarded and stderr is drained in fixed-size chunks into a
+    bounded deque, so verbose logs from long encodes never accumulate in
+    memory. On a non-zero exit, raises RuntimeError with the stderr tail.
+
+    Files listed in `outputs` are written to temp names and renamed into
+    place only if FFmpeg succeeds, so a failed or interrupted run never
+    leaves a truncated file at the final path.
+    """
+    command, renames = _redirect_outputs(command, outputs)
+    tail = deque(maxlen=_STDERR_TAIL_CHUNKS)
+    try:
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=1 << 20
+        ) as proc:
+            try:
+                tail.extend(iter(lambda: proc.stderr.read(_STDERR_CHUNK_BYTES), b''))
+                returncode = proc.wait()
+            except BaseException:
+                proc.kill()
+                raise
+
+        if returncode != 0:
+            raise RuntimeError(f"{error_prefix}: {b''.join(tail).decode('utf-8', 'replace')}")
+    except BaseException:
+        _finish_outputs(renames, success=False)
+        raise
+
+    _finish_outputs(renames, success=True)
+
+
+def _dumps_json(data, indent: bool) -> bytes:
+    """Serialize to JSON bytes (orjson when installed)"""
+    if HAS_ORJSON:
+        try:
+            option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass  # Types orjson can't handle; let the stdlib try
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+
+def _write_json(path: Path, data, lines: bool = False) -> None:
+    """
+    Write JSON atomically in a single write (orjson when installed)
+
+    Pretty-printed by default; with lines=True, `data` is a list of records
+    written as JSON Lines (one compact object per line).
+    """
+    if lines:
+        payload = b''.join(_dumps_json(record, indent=False) + b'\n' for record in data)
+    else:
+        payload = _dumps_json(data, indent=True)
+
+    tmp_path = _temp_output_path(path)
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def detect_hw_encoder() -> Optional[str]:
+    """
+    Return the first hardware H.264 encoder this FFmpeg build provides
+
+    Runs `ffmpeg -encoders` once per process; None if there is none (or
+    FFmpeg can't be queried).
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    available = {
+        fields[1] for fields in (line.split() for line in result.stdout.splitlines())
+        if len(fields) > 1
+    }
+    return next((enc for enc in HW_ENCODERS if enc in available), None)
+
+
+def resolve_codec(codec: str) -> str:
+    """Map codec="auto" to a working hardware encoder, else libx264"""
+    if codec != "auto":
+        return codec
+    hw = detect_hw_encoder()
+    return hw if hw and hw not in _failed_hw_encoders else "libx264"
+
+
+def video_codec_args(codec: str, crf: int, preset: str) -> List[str]:
+    """
+    FFmpeg video encoder arguments with crf/preset mapped per encoder
+
+    Args:
+        codec: Concrete encoder name (see resolve_codec)
+        crf: libx264-style quality (lower=better)
+        preset: libx264-style preset
+
+    Returns:
+        Argument list starting with -c:v
+    """
+    if codec == "h264_nvenc":
+        return ["-c:v", codec, "-preset", "p4", "-cq", str(crf)]
+    if codec == "h264_videotoolbox":
+        # -q:v runs 1-100 (higher=better); crf 23 lands around 65
+        quality = max(1, min(100, round(100 - crf * 1.5)))
+        return ["-c:v", codec, "-q:v", str(quality)]
+    if codec == "h264_qsv":
+        return ["-c:v", codec, "-preset", preset, "-global_quality", str(crf)]
+    return ["-c:v", codec, "-crf", str(crf), "-preset", preset]
+
+
+@contextlib.contextmanager
+def _progress_dispatcher(callback: Optional[callable]):
+    """
+    Run progress callbacks on a background thread
+
+    Yields a notify(*args) function that queues a callback call and returns
+    immediately (None if there is no callback), so slow UI or logging work
+    overlaps with encoding. The queue is unbounded (one entry per clip), so
+    notify never blocks, including when called from an event loop. On exit,
+    waits for queued calls to finish and re-raises the first exception a
+    callback raised.
+    """
+    if callback is None:
+        yield None
+        return
+
+    calls = queue.SimpleQueue()
+    errors = []
+
+    def drain() -> None:
+        while (args := calls.get()) is not None:
+            if not errors:
+                try:
+                    callback(*args)
+                except Exception as e:
+                    errors.append(e)
+
+    thread = threading.Thread(target=drain, name='arena-progress', daemon=True)
+    thread.start()
+    try:
+        yield lambda *args: calls.put(args)
+    finally:
+        calls.put(None)
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def default_concurrency(threads_per_job: int = THREADS_PER_JOB) -> int:
+    """Number of parallel FFmpeg jobs that fills the CPU without oversubscribing"""
+    return max(1, (os.cpu_count() or 1) // threads_per_job)
+
+
+class PersistentClipWorker:
+    """
+    Stream-copies clips out of a source container that stays open
+
+    generate_clip_fast pays FFmpeg process startup, input probing and
+    demuxer setup for every clip. This keeps one PyAV InputContainer open
+    for the whole batch; each cut() is a seek plus a packet remux into a
+    new MP4, with the same keyframe-aligned precision as stream copy.
+
+    Usage:
+        with PersistentClipWorker(video_path) as worker:
+            worker.cut(12.0, 40.5, Path("clip.mp4"))
+    """
+
+    def __init__(self, video_path: Path):
+        if not HAS_AV:
+            raise RuntimeError("PyAV is not installed. Install with: pip install av")
+        self.video_path = str(video_path)
+        self._container = None
+
+    def __enter__(self) -> 'PersistentClipWorker':
+        self._container = av.open(self.video_path)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the source container"""
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+
+    def cut(self, start: float, end: float, output_path: Path) -> None:
+        """
+        Remux [start, end) of the source into output_path without re-encoding
+
+        Args:
+            start: Start time in seconds (snaps back to the previous keyframe)
+            end: End time in seconds
+            output_path: Where to write the MP4
+        """
+        container = self._container
+        if container is None:
+            raise RuntimeError("PersistentClipWorker used outside its context")
+
+        streams = [s for s in container.streams if s.type in ('video', 'audio')]
+        # Seek positions are absolute; clip times are relative to the first frame
+        base = (container.start_time or 0) / av.time_base
+        container.seek(int((start + base) * av.time_base), backward=True, any_frame=False)
+
+        with av.open(str(output_path), 'w', format='mp4') as output:
+            add_stream = getattr(output, 'add_stream_from_template', None)
+            out_streams = {
+                s.index: add_stream(s) if add_stream else output.add_stream(template=s)
+                for s in streams
+            }
+
+            offset = None
+            finished = set()
+            for packet in container.demux(streams):
+                if packet.dts is None:
+                    continue  # Demuxer flush packet
+
+                tb = packet.time_base
+                t = float((packet.pts if packet.pts is not None else packet.dts) * tb)
+                if t >= end + base:
+                    finished.add(packet.stream.index)
+                    if len(finished) == len(streams):
+                        break
+                    continue
+
+                if offset is None:
+                    offset = t
+                shift = int(round(offset / tb))
+                if packet.dts - shift < 0:
+                    continue  # Before the first written packet (e.g. audio ahead of the keyframe)
+
+                packet.dts -= shift
+                if packet.pts is not None:
+                    packet.pts -= shift
+                packet.stream = out_streams[packet.stream.index]
+                output.mux(packet)
 
 
 class ClipGenerator:
@@ -15,12 +363,20 @@ class ClipGenerator:
         Initialize clip generator
 
         Args:
-            video_path: Path to source video file
+            video_path: Path to source video file, or an http(s) URL
+                (progressive file or HLS .m3u8 playlist)
             enhanced_audio_path: Optional path to enhanced audio file (used instead of video's audio)
         """
-        self.video_path = Path(video_path)
+        self.is_remote = urlparse(str(video_path)).scheme in ('http', 'https')
+        # Remote sources keep the URL string; Path() would mangle '//'
+        self.video_path = str(video_path) if self.is_remote else Path(video_path)
+        # FFmpeg/ffprobe commands need the string form; build it once
+        self._video_path_str = str(self.video_path)
         self.enhanced_audio_path = Path(enhanced_audio_path) if enhanced_audio_path else None
         self._video_info = None
+        self._keyframes = None
+        self._hls_segments = None
+        self._hls_tmpdir = None
         self._validate_video()
         self._check_ffmpeg()
 
@@ -31,7 +387,7 @@ class ClipGenerator:
 
     def _validate_video(self) -> None:
         """Validate that video file exists"""
-        if not self.video_path.exists():
+        if not self.is_remote and not self.video_path.exists():
             raise FileNotFoundError(f"Video file not found: {self.video_path}")
 
     def _check_ffmpeg(self) -> None:
@@ -52,15 +408,22 @@ class ClipGenerator:
         if self._video_info:
             return self._video_info
 
+        cached = self._load_cached_info()
+        if cached:
+            self._video_info = cached
+            return cached
+
         try:
-            # Use ffprobe to get video info
+            # Use ffprobe to get video info: only the fields we read, one
+            # "section|key=value|..." line per stream/format (no JSON)
             command = [
                 "ffprobe",
                 "-v", "quiet",
-                "-print_format", "json",
-                "-show_format",
-                "-show_streams",
-                str(self.video_path)
+                "-show_entries",
+                "format=duration,size,bit_rate"
+                ":stream=codec_type,codec_name,width,height,r_frame_rate",
+                "-of", "compact",
+                self._video_path_str
             ]
 
             result = subprocess.run(
@@ -70,18 +433,23 @@ class ClipGenerator:
                 check=True
             )
 
-            data = json.loads(result.stdout.decode('utf-8'))
-
-            # Extract relevant info
-            format_info = data.get('format', {})
-            video_stream = next(
-                (s for s in data.get('streams', []) if s['codec_type'] == 'video'),
-                {}
-            )
-            audio_stream = next(
-                (s for s in data.get('streams', []) if s['codec_type'] == 'audio'),
-                {}
-            )
+            format_info, video_stream, audio_stream = {}, {}, {}
+            for line in result.stdout.decode('utf-8').splitlines():
+                section, *fields = line.split('|')
+                entries = {}
+                for field in fields:
+                    key, _, value = field.partition('=')
+                    if value and value != 'N/A':
+                        entries[key] = value
+
+                if section == 'format':
+                    format_info = entries
+                elif section == 'stream':
+                    codec_type = entries.get('codec_type')
+                    if codec_type == 'video' and not video_stream:
+                        video_stream = entries
+                    elif codec_type == 'audio' and not audio_stream:
+                        audio_stream = entries
 
             self._video_info = {
                 'duration': float(format_info.get('duration', 0)),
@@ -95,6 +463,7 @@ class ClipGenerator:
                 'has_audio': bool(audio_stream)
             }
 
+            self._store_cached_info(self._video_info)
             return self._video_info
 
         except subprocess.CalledProcessError as e:
@@ -102,6 +471,147 @@ class ClipGenerator:
         except Exception as e:
             raise RuntimeError(f"Failed to parse video info: {str(e)}")
 
+    def _info_cache_path(self) -> Path:
+        """Cache file for this video's ffprobe results"""
+        stat = self.video_path.stat()
+        key = f"{self.video_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}"
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return FFPROBE_CACHE_DIR / f"{digest}.json"
+
+    def _load_cached_info(self) -> Optional[Dict]:
+        """Return cached video info, or None on a miss or unreadable cache"""
+        if self.is_remote:
+            return None
+        try:
+            with open(self._info_cache_path()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store_cached_info(self, info: Dict) -> None:
+        """Atomically write video info to the cache (best effort)"""
+        if self.is_remote:
+            return
+        try:
+            cache_path = self._info_cache_path()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(info, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+    def _video_input_args(self, start: float, end: float, *input_opts: str) -> List[str]:
+        """
+        FFmpeg input arguments that open the source video seeked to `start`
+
+        Args:
+            start: Seek position in seconds
+            end: End of the range that will be read (used for remote HLS)
+            input_opts: Extra input options placed before -i (e.g. "-t", "5")
+
+        Returns:
+            Argument list ending in "-i <source>"
+        """
+        source, seek = self._prepare_source_for_range(start, end)
+        args = ["-ss", str(seek), *input_opts, "-i", source]
+        if source != self._video_path_str:
+            args = ["-protocol_whitelist", _HLS_PROTOCOLS] + args
+        return args
+
+    def _prepare_source_for_range(self, start: float, end: float) -> Tuple[str, float]:
+        """
+        Resolve the FFmpeg input for a time range of the source
+
+        Local files and progressive remote files are returned as-is. For a
+        remote HLS playlist, a trimmed local .m3u8 listing only the segments
+        covering [start, end] is written, so FFmpeg fetches just those
+        instead of streaming from the beginning to reach the seek point.
+
+        Returns:
+            Tuple of (input path or URL, seek offset within that input)
+        """
+        source = self._video_path_str
+        if not self.is_remote or not urlparse(source).path.endswith('.m3u8'):
+            return source, start
+
+        segments = self._load_hls_segments()
+        if not segments:
+            return source, start
+
+        first = max(0, bisect.bisect_right([s[0] for s in segments], start) - 1)
+        last = first
+        while last + 1 < len(segments) and segments[last + 1][0] < end:
+            last += 1
+
+        covering = segments[first:last + 1]
+        target = max(1, int(max(seg[1] for seg in covering) + 0.999))
+
+        lines = [
+            "#EXTM3U",
+            "#EXT-X-VERSION:3",
+            f"#EXT-X-TARGETDURATION:{target}",
+            "#EXT-X-MEDIA-SEQUENCE:0",
+            "#EXT-X-PLAYLIST-TYPE:VOD",
+        ]
+        for _, seg_duration, uri in covering:
+            lines.append(f"#EXTINF:{seg_duration:.6f},")
+            lines.append(uri)
+        lines.append("#EXT-X-ENDLIST")
+
+        if self._hls_tmpdir is None:
+            self._hls_tmpdir = tempfile.TemporaryDirectory(prefix='arena-hls-')
+        playlist_path = Path(self._hls_tmpdir.name) / f"range_{first}_{last}.m3u8"
+        playlist_path.write_text("\n".join(lines) + "\n")
+
+        return str(playlist_path), start - covering[0][0]
+
+    def _load_hls_segments(self) -> List[Tuple[float, float, str]]:
+        """
+        Download and parse the remote HLS media playlist (cached)
+
+        A master playlist is resolved to its highest-bandwidth variant.
+
+        Returns:
+            List of (segment start, segment duration, absolute URI)
+        """
+        if self._hls_segments is not None:
+            return self._hls_segments
+
+        url = self._video_path_str
+        with urllib.request.urlopen(url) as response:
+            text = response.read().decode('utf-8')
+
+        if '#EXT-X-STREAM-INF' in text:
+            best_bandwidth, best_uri = -1, None
+            lines = text.splitlines()
+            for i, line in enumerate(lines):
+                if line.startswith('#EXT-X-STREAM-INF') and i + 1 < len(lines):
+                    match = _BANDWIDTH_RE.search(line)
+                    bandwidth = int(match.group(1)) if match else 0
+                    if bandwidth > best_bandwidth:
+                        best_bandwidth, best_uri = bandwidth, lines[i + 1].strip()
+            if best_uri:
+                url = urljoin(url, best_uri)
+                with urllib.request.urlopen(url) as response:
+                    text = response.read().decode('utf-8')
+
+        segments = []
+        position = 0.0
+        seg_duration = None
+        for line in text.splitlines():
+            line = line.strip()
+            if line.startswith('#EXTINF:'):
+                seg_duration = float(line[len('#EXTINF:'):].split(',', 1)[0])
+            elif line and not line.startswith('#') and seg_duration is not None:
+                segments.append((position, seg_duration, urljoin(url, line)))
+                position += seg_duration
+                seg_duration = None
+
+        self._hls_segments = segments
+        return segments
+
     def _parse_fps(self, fps_string: str) -> float:
         """Parse FPS from ffprobe format (e.g., '30/1')"""
         try:
@@ -125,8 +635,8 @@ class ClipGenerator:
         text = text.lower()
 
         # Replace spaces and special chars with hyphens
-        text = re.sub(r'[^\w\s-]', '', text)
-        text = re.sub(r'[-\s]+', '-', text)
+        text = _SAFE_CHARS_RE.sub('', text)
+        text = _COLLAPSE_RE.sub('-', text)
 
         # Remove leading/trailing hyphens
         text = text.strip('-')
@@ -139,8 +649,7 @@ class ClipGenerator:
 
     def _format_timestamp_short(self, seconds: float) -> str:
         """Format seconds as MMmSSs (e.g., 02m05s)"""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
         return f"{minutes:02d}m{secs:02d}s"
 
     def generate_clip_filename(
@@ -197,10 +706,12 @@ class ClipGenerator:
         end_time: float,
         output_path: Path,
         padding: float = 0.0,
-        codec: str = "libx264",
+        codec: str = "auto",
         crf: int = 23,
         preset: str = "medium",
-        audio_codec: str = "aac"
+        audio_codec: str = "aac",
+        threads: Optional[int] = None,
+        fragmented: bool = False
     ) -> Dict:
         """
         Extract a clip from the video using FFmpeg
@@ -210,14 +721,66 @@ class ClipGenerator:
             end_time: End time in seconds
             output_path: Where to save the clip
             padding: Seconds to add before/after for context
-            codec: Video codec (default: libx264)
+            codec: Video codec; "auto" (default) uses a hardware H.264
+                encoder when FFmpeg has one, else libx264
             crf: Constant Rate Factor for quality (default: 23, lower=better)
             preset: Encoding preset (ultrafast, fast, medium, slow, veryslow)
             audio_codec: Audio codec (default: aac)
+            threads: Encoder threads; 0/None lets FFmpeg use every core.
+                Pass cpu_count // jobs when running several clips at once.
+            fragmented: Write fragmented MP4 (moov up front, single pass)
+                instead of +faststart, which rewrites the whole file after
+                encoding. Faster for large clips and fine for browsers/HLS,
+                but some older players and editors only handle regular MP4.
 
         Returns:
             Dict with clip metadata
         """
+        command, clip_info = self._build_clip_command(
+            start_time, end_time, output_path, padding,
+            codec, crf, preset, audio_codec, threads, fragmented
+        )
+
+        # Run FFmpeg
+        try:
+            _run_ffmpeg(
+                command, "FFmpeg failed to generate clip", [clip_info['output_path']]
+            )
+        except RuntimeError:
+            if clip_info['codec'] not in HW_ENCODERS or codec != "auto":
+                raise
+            # Encoder is compiled in but has no usable device; stop trying it
+            _failed_hw_encoders.add(clip_info['codec'])
+            return self.generate_clip(
+                start_time, end_time, output_path, padding,
+                codec, crf, preset, audio_codec, threads, fragmented
+            )
+
+        return self._add_output_size(clip_info)
+
+    def _build_clip_command(
+        self,
+        start_time: float,
+        end_time: float,
+        output_path: Path,
+        padding: float = 0.0,
+        codec: str = "auto",
+        crf: int = 23,
+        preset: str = "medium",
+        audio_codec: str = "aac",
+        threads: Optional[int] = None,
+        fragmented: bool = False
+    ) -> Tuple[List[str], Dict]:
+        """
+        Build the re-encoding FFmpeg command used by generate_clip
+
+        Args:
+            threads: Encoder thread count (-threads); 0 or None uses all cores
+            fragmented: Use fragmented MP4 movflags instead of +faststart
+
+        Returns:
+            Tuple of (command, clip metadata without output size)
+        """
         # Get video info to validate bounds
         video_info = self.get_video_info()
         duration = video_info['duration']
@@ -236,25 +799,31 @@ class ClipGenerator:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        thread_args = ["-threads", str(threads or 0)]
+        movflags = "+frag_keyframe+empty_moov+default_base_moof" if fragmented else "+faststart"
+        codec = resolve_codec(codec)
+        codec_args = video_codec_args(codec, crf, preset)
+        if codec == "libx264" and actual_duration < 2.0:
+            # Too few frames for frame threading to help; split each frame instead
+            codec_args += ["-x264-params", f"sliced-threads=1:threads={threads or 'auto'}"]
+
         # Build FFmpeg command
         # Using -ss before -i for fast seeking
         if self.enhanced_audio_path:
             # Dual input: video from original, audio from enhanced file
             command = [
                 "ffmpeg",
-                "-ss", str(actual_start),           # Seek to start in video
-                "-i", str(self.video_path),         # Input video file
+                *self._video_input_args(actual_start, actual_end),  # Seek + input video
                 "-ss", str(actual_start),           # Seek to same position in audio
                 "-i", str(self.enhanced_audio_path), # Input enhanced audio file
                 "-t", str(actual_duration),         # Duration
                 "-map", "0:v",                      # Use video from first input
                 "-map", "1:a",                      # Use audio from second input (enhanced)
-                "-c:v", codec,                      # Video codec
-                "-crf", str(crf),                   # Quality
-                "-preset", preset,                  # Encoding speed
+                *thread_args,                       # Encoder threads
+                *codec_args,                        # Video codec, quality, speed
                 "-c:a", audio_codec,                # Audio codec
                 "-b:a", "128k",                     # Audio bitrate
-                "-movflags", "+faststart",          # Enable fast start for web
+                "-movflags", movflags,              # Fast start (or fragmented) for web
                 "-y",                               # Overwrite output
                 str(output_path)
             ]
@@ -262,50 +831,37 @@ class ClipGenerator:
             # Single input: both video and audio from original
             command = [
                 "ffmpeg",
-                "-ss", str(actual_start),           # Seek to start (fast seek)
-                "-i", str(self.video_path),         # Input file
+                *self._video_input_args(actual_start, actual_end),  # Fast seek + input
                 "-t", str(actual_duration),         # Duration
-                "-c:v", codec,                      # Video codec
-                "-crf", str(crf),                   # Quality
-                "-preset", preset,                  # Encoding speed
+                *thread_args,                       # Encoder threads
+                *codec_args,                        # Video codec, quality, speed
                 "-c:a", audio_codec,                # Audio codec
                 "-b:a", "128k",                     # Audio bitrate
-                "-movflags", "+faststart",          # Enable fast start for web
+                "-movflags", movflags,              # Fast start (or fragmented) for web
                 "-y",                               # Overwrite output
                 str(output_path)
             ]
 
-        try:
-            # Run FFmpeg
-            result = subprocess.run(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True
-            )
-
-            # Get output file size
-            output_size = output_path.stat().st_size
-
-            # Return metadata
-            return {
-                'output_path': str(output_path),
-                'start_time': actual_start,
-                'end_time': actual_end,
-                'duration': actual_duration,
-                'requested_start': start_time,
-                'requested_end': end_time,
-                'padding': padding,
-                'size_bytes': output_size,
-                'size_mb': round(output_size / (1024 * 1024), 2),
-                'codec': codec,
-                'crf': crf,
-                'success': True
-            }
-
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.decode('utf-8')
-            raise RuntimeError(f"FFmpeg failed to generate clip: {error_msg}")
+        return command, {
+            'output_path': str(output_path),
+            'start_time': actual_start,
+            'end_time': actual_end,
+            'duration': actual_duration,
+            'requested_start': start_time,
+            'requested_end': end_time,
+            'padding': padding,
+            'codec': codec,
+            'crf': crf,
+            'success': True
+        }
+
+    @staticmethod
+    def _add_output_size(clip_info: Dict) -> Dict:
+        """Fill in size fields once FFmpeg has written clip_info['output_path']"""
+        output_size = Path(clip_info['output_path']).stat().st_size
+        clip_info['size_bytes'] = output_size
+        clip_info['size_mb'] = round(output_size / (1024 * 1024), 2)
+        return clip_info
 
     def generate_clip_fast(
         self,
@@ -329,6 +885,27 @@ class ClipGenerator:
         Note: This is much faster but less precise than re-encoding.
         Use for quick previews or when timing precision isn't critical.
         """
+        command, clip_info = self._build_fast_clip_command(
+            start_time, end_time, output_path, padding
+        )
+
+        _run_ffmpeg(command, "FFmpeg failed", [clip_info['output_path']])
+
+        return self._add_output_size(clip_info)
+
+    def _build_fast_clip_command(
+        self,
+        start_time: float,
+        end_time: float,
+        output_path: Path,
+        padding: float = 0.0
+    ) -> Tuple[List[str], Dict]:
+        """
+        Build the stream-copy FFmpeg command used by generate_clip_fast
+
+        Returns:
+            Tuple of (command, clip metadata without output size)
+        """
         video_info = self.get_video_info()
         duration = video_info['duration']
 
@@ -343,8 +920,7 @@ class ClipGenerator:
             # Fast mode with enhanced audio: copy video, encode audio
             command = [
                 "ffmpeg",
-                "-ss", str(actual_start),
-                "-i", str(self.video_path),
+                *self._video_input_args(actual_start, actual_end),
                 "-ss", str(actual_start),
                 "-i", str(self.enhanced_audio_path),
                 "-t", str(actual_duration),
@@ -361,8 +937,7 @@ class ClipGenerator:
             # Pure fast mode: copy both streams
             command = [
                 "ffmpeg",
-                "-ss", str(actual_start),
-                "-i", str(self.video_path),
+                *self._video_input_args(actual_start, actual_end),
                 "-t", str(actual_duration),
                 "-c", "copy",                       # Copy streams (no re-encode)
                 "-avoid_negative_ts", "1",          # Handle timing issues
@@ -370,125 +945,827 @@ class ClipGenerator:
                 str(output_path)
             ]
 
+        return command, {
+            'output_path': str(output_path),
+            'start_time': actual_start,
+            'end_time': actual_end,
+            'duration': actual_duration,
+            'method': 'stream_copy',
+            'success': True
+        }
+
+    def get_keyframes(self) -> List[float]:
+        """
+        Get keyframe timestamps of the first video stream
+
+        Reads packet flags rather than decoding frames, so this is a
+        demux-only pass over the file. The result is cached per instance.
+
+        Returns:
+            Sorted list of keyframe times in seconds
+        """
+        if self._keyframes is not None:
+            return self._keyframes
+
+        command = [
+            "ffprobe",
+            "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries", "packet=pts_time,flags",
+            "-of", "csv=p=0",
+            self._video_path_str
+        ]
+
         try:
-            subprocess.run(
+            result = subprocess.run(
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 check=True
             )
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Failed to read keyframes: {e.stderr.decode('utf-8')}")
+
+        keyframes = []
+        for line in result.stdout.decode('utf-8').splitlines():
+            pts_time, _, flags = line.partition(',')
+            if 'K' in flags and pts_time not in ('', 'N/A'):
+                keyframes.append(float(pts_time))
+
+        keyframes.sort()
+        self._keyframes = keyframes
+        return keyframes
+
+    def generate_clip_smart(
+        self,
+        start_time: float,
+        end_time: float,
+        output_path: Path,
+        padding: float = 0.0,
+        keyframe_tolerance: float = 0.5,
+        codec: str = "libx264",
+        crf: int = 23,
+        preset: str = "medium"
+    ) -> Dict:
+        """
+        Keyframe-aware clip extraction ("smart cut")
+
+        If the start lands within keyframe_tolerance of the preceding
+        keyframe, the clip is stream-copied from that keyframe. Otherwise
+        only the head up to the next keyframe is re-encoded, the rest is
+        stream-copied, and the two parts are joined with the concat demuxer.
+
+        Args:
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            output_path: Where to save the clip
+            padding: Seconds to add before/after
+            keyframe_tolerance: Max seconds to start early to snap to a keyframe
+            codec: Video codec for the re-encoded head
+            crf: Constant Rate Factor for the re-encoded head
+            preset: Encoding preset for the re-encoded head
+
+        Returns:
+            Dict with clip metadata
+
+        Note: The re-encoded head must be concat-compatible with the source
+        stream, so this suits H.264 sources encoded with libx264. Remote
+        sources, clips with enhanced audio, and clips shorter than one GOP
+        fall back to generate_clip.
+        """
+        if self.enhanced_audio_path or self.is_remote:
+            return self.generate_clip(
+                start_time, end_time, output_path, padding=padding,
+                codec=codec, crf=crf, preset=preset
+            )
+
+        duration = self.get_video_info()['duration']
+        actual_start = max(0, start_time - padding)
+        actual_end = min(duration, end_time + padding)
+
+        keyframes = self.get_keyframes()
+        idx = bisect.bisect_right(keyframes, actual_start)
+        prev_kf = keyframes[idx - 1] if idx > 0 else None
+        next_kf = keyframes[idx] if idx < len(keyframes) else None
 
-            output_size = output_path.stat().st_size
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            return {
+        if prev_kf is not None and actual_start - prev_kf <= keyframe_tolerance:
+            # Close enough: copy everything from the preceding keyframe
+            command = [
+                "ffmpeg",
+                "-ss", str(prev_kf),
+                "-i", self._video_path_str,
+                "-t", str(actual_end - prev_kf),
+                "-c", "copy",
+                "-avoid_negative_ts", "1",
+                "-y",
+                str(output_path)
+            ]
+            self._run_smart_cut_step(command, [output_path])
+            actual_start = prev_kf
+            method = 'smart_copy'
+
+        elif next_kf is None or next_kf >= actual_end:
+            # Clip is shorter than the remaining GOP: nothing to copy
+            return self.generate_clip(
+                start_time, end_time, output_path, padding=padding,
+                codec=codec, crf=crf, preset=preset
+            )
+
+        else:
+            with tempfile.TemporaryDirectory(dir=output_path.parent) as tmp:
+                tmp_dir = Path(tmp)
+                head_path = tmp_dir / f"head{output_path.suffix}"
+                tail_path = tmp_dir / f"tail{output_path.suffix}"
+                list_path = tmp_dir / "concat.txt"
+
+                # Re-encode from the requested start up to the next keyframe
+                self._run_smart_cut_step([
+                    "ffmpeg",
+                    "-ss", str(actual_start),
+                    "-i", self._video_path_str,
+                    "-t", str(next_kf - actual_start),
+                    "-c:v", codec,
+                    "-crf", str(crf),
+                    "-preset", preset,
+                    "-c:a", "aac",
+                    "-b:a", "128k",
+                    "-y",
+                    str(head_path)
+                ])
+
+                # Stream-copy from that keyframe to the end
+                self._run_smart_cut_step([
+                    "ffmpeg",
+                    "-ss", str(next_kf),
+                    "-i", self._video_path_str,
+                    "-t", str(actual_end - next_kf),
+                    "-c", "copy",
+                    "-avoid_negative_ts", "1",
+                    "-y",
+                    str(tail_path)
+                ])
+
+                list_path.write_text(
+                    f"file '{head_path.name}'\nfile '{tail_path.name}'\n"
+                )
+                self._run_smart_cut_step([
+                    "ffmpeg",
+                    "-f", "concat",
+                    "-safe", "0",
+                    "-i", str(list_path),
+                    "-c", "copy",
+                    "-movflags", "+faststart",
+                    "-y",
+                    str(output_path)
+                ], [output_path])
+            method = 'smart_cut'
+
+        return self._add_output_size({
+            'output_path': str(output_path),
+            'start_time': actual_start,
+            'end_time': actual_end,
+            'duration': actual_end - actual_start,
+            'requested_start': start_time,
+            'requested_end': end_time,
+            'padding': padding,
+            'method': method,
+            'success': True
+        })
+
+    @staticmethod
+    def _run_smart_cut_step(command: List[str], outputs: Sequence[Path] = ()) -> None:
+        """Run one FFmpeg step of generate_clip_smart"""
+        _run_ffmpeg(command, "FFmpeg smart cut failed", outputs)
+
+    def generate_multiple_clips(
+        self,
+        segments: List[Dict],
+        output_dir: Path,
+        padding: float = 0.0,
+        fast_mode: bool = False,
+        progress_callback: Optional[callable] = None,
+        include_timestamps: bool = True,
+        shard_size: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Generate multiple clips from a list of segments
+
+        Args:
+            segments: List of segment dicts with start_time, end_time, id
+            output_dir: Directory to save clips
+            padding: Seconds to add before/after each clip
+            fast_mode: Use stream copy (faster but less precise). With PyAV
+                installed, clips are remuxed in-process from one open
+                container (PersistentClipWorker) and concurrency is ignored
+            progress_callback: Optional callback(current, total, clip_info),
+                run on a background thread so a slow callback never delays
+                the next clip; all calls finish before this returns
+            include_timestamps: Include timestamp range in filename
+            shard_size: If set, pack every N clips into shard-NNNNN.tar
+                (with a shard-NNNNN.jsonl sidecar) instead of loose .mp4 files
+            concurrency: Number of FFmpeg processes to run at once (default:
+                CPU count / THREADS_PER_JOB). With more than one,
+                progress_callback fires in completion order and `current`
+                counts finished clips.
+
+        Returns:
+            List of clip metadata dicts (in segment order)
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        if concurrency is None:
+            concurrency = default_concurrency()
+
+        # Probe once before any clip work starts; every clip reuses the result.
+        # On failure each clip probes again and records its own error.
+        try:
+            self.get_video_info()
+        except Exception:
+            pass
+
+        # Generate shards' clips into a scratch dir on the same filesystem, then pack
+        clips_dir = (
+            Path(tempfile.mkdtemp(prefix='.clips-', dir=output_dir))
+            if shard_size else output_dir
+        )
+        try:
+            with _progress_dispatcher(progress_callback) as notify:
+                results = self._generate_batch(
+                    segments, clips_dir, padding, fast_mode,
+                    notify, include_timestamps, concurrency
+                )
+            if shard_size:
+                self._write_shards(results, output_dir, shard_size)
+        finally:
+            if shard_size:
+                shutil.rmtree(clips_dir, ignore_errors=True)
+
+        return results
+
+    def _generate_batch(
+        self,
+        segments: List[Dict],
+        output_dir: Path,
+        padding: float,
+        fast_mode: bool,
+        progress_callback: Optional[callable],
+        include_timestamps: bool,
+        concurrency: int
+    ) -> List[Dict]:
+        """Generate loose clip files into output_dir (see generate_multiple_clips)"""
+        # Stream copy is cheap per clip, so one open container beats many processes
+        use_worker = (
+            fast_mode and HAS_AV and not self.is_remote and not self.enhanced_audio_path
+        )
+
+        if concurrency > 1 and len(segments) > 1 and not use_worker:
+            return asyncio.run(self.generate_multiple_clips_async(
+                segments, output_dir, padding, fast_mode,
+                progress_callback, include_timestamps, concurrency
+            ))
+
+        results = []
+        total = len(segments)
+
+        with contextlib.ExitStack() as stack:
+            worker = None
+            if use_worker:
+                try:
+                    worker = stack.enter_context(PersistentClipWorker(self.video_path))
+                except Exception:
+                    worker = None  # PyAV can't open it; use FFmpeg per clip
+
+            for i, segment in enumerate(segments, 1):
+                start_time, end_time = _SEG_TIMES(segment)
+                clip_basename, clip_filename = self._clip_names(
+                    i, segment, start_time, end_time, include_timestamps
+                )
+                clip_path = output_dir / clip_filename
+
+                try:
+                    # Generate clip
+                    if worker:
+                        clip_info = self._cut_with_worker(
+                            worker, start_time, end_time, clip_path, padding
+                        )
+                    elif fast_mode:
+                        clip_info = self.generate_clip_fast(
+                            start_time,
+                            end_time,
+                            clip_path,
+                            padding=padding
+                        )
+                    else:
+                        clip_info = self.generate_clip(
+                            start_time,
+                            end_time,
+                            clip_path,
+                            padding=padding
+                        )
+
+                    clip_info = self._with_segment_metadata(
+                        clip_info, clip_basename, clip_filename, i, segment
+                    )
+                except Exception as e:
+                    # Log error but continue with other clips
+                    clip_info = self._error_info(clip_basename, clip_filename, i, e)
+
+                results.append(clip_info)
+
+                # Call progress callback
+                if progress_callback:
+                    progress_callback(i, total, clip_info)
+
+        return results
+
+    def _cut_with_worker(
+        self,
+        worker: PersistentClipWorker,
+        start_time: float,
+        end_time: float,
+        output_path: Path,
+        padding: float = 0.0
+    ) -> Dict:
+        """Stream-copy a clip through an open PersistentClipWorker (FFmpeg on failure)"""
+        _, clip_info = self._build_fast_clip_command(
+            start_time, end_time, output_path, padding
+        )
+        tmp_path = _temp_output_path(clip_info['output_path'])
+        try:
+            worker.cut(clip_info['start_time'], clip_info['end_time'], tmp_path)
+            os.replace(tmp_path, clip_info['output_path'])
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            return self.generate_clip_fast(start_time, end_time, output_path, padding)
+        return self._add_output_size(clip_info)
+
+    def generate_clips_batched(
+        self,
+        segments: List[Dict],
+        output_dir: Path,
+        padding: float = 0.0,
+        progress_callback: Optional[callable] = None,
+        include_timestamps: bool = True,
+        max_gap: float = 30.0,
+        max_outputs: int = 8,
+        codec: str = "auto",
+        crf: int = 23,
+        preset: str = "medium",
+        audio_codec: str = "aac"
+    ) -> List[Dict]:
+        """
+        Generate clips with one FFmpeg process per group of nearby segments
+
+        Segments are sorted by start time and grouped while each next clip
+        starts within `max_gap` seconds of the group's end. Each group seeks
+        the source once, decodes it once, and writes every clip in the group
+        as a separate output (output-side -ss/-t), so process startup and
+        decoder setup are paid per group instead of per clip. If a group's
+        FFmpeg run fails, its clips are regenerated one by one with
+        generate_clip so errors are reported per clip.
+
+        Args:
+            segments: List of segment dicts with start_time, end_time
+            output_dir: Directory to save clips
+            padding: Seconds to add before/after each clip
+            progress_callback: Optional callback(completed, total, clip_info),
+                run on a background thread (see generate_multiple_clips)
+            include_timestamps: Include timestamp range in filename
+            max_gap: Largest gap (seconds) decoded through to join two clips
+            max_outputs: Maximum clips (encoders) per FFmpeg process
+            codec: Video codec (default: "auto", see generate_clip)
+            crf: Constant Rate Factor for quality
+            preset: Encoding preset
+            audio_codec: Audio codec (default: aac)
+
+        Returns:
+            List of clip metadata dicts (in segment order)
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        duration = self.get_video_info()['duration']
+        total = len(segments)
+        results: List[Optional[Dict]] = [None] * total
+        completed = 0
+
+        # (index, segment, actual_start, actual_end) sorted by start
+        jobs = []
+        for i, segment in enumerate(segments, 1):
+            start_time, end_time = _SEG_TIMES(segment)
+            actual_start = max(0, start_time - padding)
+            actual_end = min(duration, end_time + padding)
+            jobs.append((i, segment, actual_start, actual_end))
+        jobs.sort(key=itemgetter(2))
+
+        groups = []
+        for job in jobs:
+            if (groups and len(groups[-1]) < max_outputs
+                    and job[2] - max(j[3] for j in groups[-1]) <= max_gap):
+                groups[-1].append(job)
+            else:
+                groups.append([job])
+
+        with _progress_dispatcher(progress_callback) as notify:
+            for group in groups:
+                try:
+                    infos = self._run_clip_group(
+                        group, output_dir, padding, include_timestamps,
+                        codec, crf, preset, audio_codec
+                    )
+                except (RuntimeError, ValueError):
+                    infos = None
+
+                for n, (i, segment, _, _) in enumerate(group):
+                    start_time, end_time = _SEG_TIMES(segment)
+                    clip_basename, clip_filename = self._clip_names(
+                        i, segment, start_time, end_time, include_timestamps
+                    )
+                    try:
+                        if infos is None:
+                            clip_info = self.generate_clip(
+                                start_time, end_time, output_dir / clip_filename,
+                                padding, codec, crf, preset, audio_codec
+                            )
+                        else:
+                            clip_info = self._add_output_size(infos[n])
+                        clip_info = self._with_segment_metadata(
+                            clip_info, clip_basename, clip_filename, i, segment
+                        )
+                    except Exception as e:
+                        clip_info = self._error_info(clip_basename, clip_filename, i, e)
+
+                    results[i - 1] = clip_info
+                    completed += 1
+                    if notify:
+                        notify(completed, total, clip_info)
+
+        return results
+
+    def _run_clip_group(
+        self,
+        group: List[Tuple[int, Dict, float, float]],
+        output_dir: Path,
+        padding: float,
+        include_timestamps: bool,
+        codec: str,
+        crf: int,
+        preset: str,
+        audio_codec: str
+    ) -> List[Dict]:
+        """
+        Encode a group of clips from one seek of the source (see generate_clips_batched)
+
+        Returns:
+            Clip metadata dicts (without output size) in group order
+        """
+        group_start = min(job[2] for job in group)
+        group_end = max(job[3] for job in group)
+        codec = resolve_codec(codec)
+
+        command = [
+            "ffmpeg", "-y",
+            *self._video_input_args(
+                group_start, group_end, "-t", str(group_end - group_start)
+            ),
+        ]
+        if self.enhanced_audio_path:
+            command += [
+                "-ss", str(group_start),
+                "-t", str(group_end - group_start),
+                "-i", str(self.enhanced_audio_path),
+            ]
+        audio_map = "1:a" if self.enhanced_audio_path else "0:a?"
+
+        infos = []
+        for i, segment, actual_start, actual_end in group:
+            start_time, end_time = _SEG_TIMES(segment)
+            _, clip_filename = self._clip_names(
+                i, segment, start_time, end_time, include_timestamps
+            )
+            output_path = output_dir / clip_filename
+            actual_duration = actual_end - actual_start
+            if actual_duration <= 0:
+                raise ValueError(
+                    f"Invalid clip duration: start={actual_start}, end={actual_end}"
+                )
+
+            # Input timestamps restart at 0 from group_start, so offsets are relative
+            command += [
+                "-ss", str(actual_start - group_start),
+                "-t", str(actual_duration),
+                "-map", "0:v",
+                "-map", audio_map,
+                *video_codec_args(codec, crf, preset),
+                "-c:a", audio_codec,
+                "-b:a", "128k",
+                "-movflags", "+faststart",
+                str(output_path)
+            ]
+            infos.append({
                 'output_path': str(output_path),
                 'start_time': actual_start,
                 'end_time': actual_end,
                 'duration': actual_duration,
-                'size_bytes': output_size,
-                'size_mb': round(output_size / (1024 * 1024), 2),
-                'method': 'stream_copy',
+                'requested_start': start_time,
+                'requested_end': end_time,
+                'padding': padding,
+                'codec': codec,
+                'crf': crf,
                 'success': True
-            }
+            })
 
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"FFmpeg failed: {e.stderr.decode('utf-8')}")
+        _run_ffmpeg(
+            command, "FFmpeg failed to generate clip group",
+            [info['output_path'] for info in infos]
+        )
+        return infos
 
-    def generate_multiple_clips(
+    async def generate_clip_async(
+        self,
+        start_time: float,
+        end_time: float,
+        output_path: Path,
+        padding: float = 0.0,
+        fast_mode: bool = False,
+        threads: Optional[int] = None
+    ) -> Dict:
+        """
+        Async version of generate_clip / generate_clip_fast
+
+        FFmpeg runs as an asyncio subprocess, so the event loop stays free
+        for other work (progress reporting, other clips) while it encodes.
+
+        Args:
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            output_path: Where to save the clip
+            padding: Seconds to add before/after
+            fast_mode: Use stream copy instead of re-encoding
+            threads: Encoder thread count for re-encoding
+
+        Returns:
+            Dict with clip metadata
+        """
+        if fast_mode:
+            command, clip_info = self._build_fast_clip_command(
+                start_time, end_time, output_path, padding
+            )
+        else:
+            command, clip_info = self._build_clip_command(
+                start_time, end_time, output_path, padding, threads=threads
+            )
+
+        try:
+            await self._run_ffmpeg_async(command, [clip_info['output_path']])
+        except RuntimeError:
+            # Stream copy has no encoder to swap; re-encodes always use codec="auto"
+            if fast_mode or clip_info.get('codec') not in HW_ENCODERS:
+                raise
+            # Hardware encoder unusable here; retry (and continue) with libx264
+            _failed_hw_encoders.add(clip_info['codec'])
+            return await self.generate_clip_async(
+                start_time, end_time, output_path, padding, fast_mode, threads
+            )
+        return self._add_output_size(clip_info)
+
+    async def generate_multiple_clips_async(
         self,
         segments: List[Dict],
         output_dir: Path,
         padding: float = 0.0,
         fast_mode: bool = False,
         progress_callback: Optional[callable] = None,
-        include_timestamps: bool = True
+        include_timestamps: bool = True,
+        concurrency: Optional[int] = None,
+        with_metadata: bool = False
     ) -> List[Dict]:
         """
-        Generate multiple clips from a list of segments
+        Async version of generate_multiple_clips
+
+        Runs up to `concurrency` FFmpeg processes at once from a single event
+        loop. Cancelling the coroutine (e.g. Ctrl+C under asyncio.run)
+        terminates any FFmpeg children that are still running.
 
         Args:
-            segments: List of segment dicts with start_time, end_time, id
+            segments: List of segment dicts with start_time, end_time
             output_dir: Directory to save clips
             padding: Seconds to add before/after each clip
             fast_mode: Use stream copy (faster but less precise)
-            progress_callback: Optional callback(current, total, clip_info)
+            progress_callback: Optional callback(completed, total, clip_info)
             include_timestamps: Include timestamp range in filename
+            concurrency: Max parallel FFmpeg jobs (default: default_concurrency())
+            with_metadata: Also write a thumbnail and metadata JSON per clip
+                (as generate_clip_with_metadata does), in a worker thread so
+                the next FFmpeg job isn't held up
 
         Returns:
-            List of clip metadata dicts
+            List of clip metadata dicts (in segment order)
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        results = []
+        if concurrency is None:
+            concurrency = default_concurrency()
+
+        # Probe once up front so concurrent jobs don't each run ffprobe.
+        # On failure each clip probes again and records its own error.
+        try:
+            self.get_video_info()
+        except Exception:
+            pass
+
+        # Split cores between jobs instead of letting each encoder grab them all
+        threads = max(1, (os.cpu_count() or 1) // concurrency)
+        sem = asyncio.Semaphore(concurrency)
         total = len(segments)
+        completed = 0
 
-        for i, segment in enumerate(segments, 1):
-            # Generate professional clip filename
-            clip_basename = self.generate_clip_filename(
-                index=i,
-                title=segment.get('title', ''),
-                start_time=segment['start_time'],
-                end_time=segment['end_time'],
-                include_timestamps=include_timestamps
+        async def one(i: int, segment: Dict) -> Dict:
+            nonlocal completed
+            start_time, end_time = _SEG_TIMES(segment)
+            clip_basename, clip_filename = self._clip_names(
+                i, segment, start_time, end_time, include_timestamps
             )
-            clip_filename = f"{clip_basename}.mp4"
             clip_path = output_dir / clip_filename
 
             try:
-                # Generate clip
-                if fast_mode:
-                    clip_info = self.generate_clip_fast(
-                        segment['start_time'],
-                        segment['end_time'],
-                        clip_path,
-                        padding=padding
+                async with sem:
+                    clip_info = await self.generate_clip_async(
+                        start_time, end_time, clip_path, padding,
+                        fast_mode=fast_mode, threads=threads
                     )
-                else:
-                    clip_info = self.generate_clip(
-                        segment['start_time'],
-                        segment['end_time'],
-                        clip_path,
-                        padding=padding
+
+                clip_info = self._with_segment_metadata(
+                    clip_info, clip_basename, clip_filename, i, segment
+                )
+                if with_metadata:
+                    await asyncio.to_thread(
+                        self._add_clip_extras,
+                        clip_info, segment, output_dir, clip_basename
                     )
+            except Exception as e:
+                clip_info = self._error_info(clip_basename, clip_filename, i, e)
 
-                # Add segment metadata
-                clip_info.update({
-                    'clip_id': clip_basename,
-                    'clip_filename': clip_filename,
-                    'title': segment.get('title', 'Untitled'),
-                    'index': i,
-                    'segment': segment
-                })
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, clip_info)
+            return clip_info
 
-                results.append(clip_info)
+        return await asyncio.gather(
+            *(one(i, segment) for i, segment in enumerate(segments, 1))
+        )
 
-                # Call progress callback
-                if progress_callback:
-                    progress_callback(i, total, clip_info)
+    @staticmethod
+    async def _run_ffmpeg_async(command: List[str], outputs: Sequence[Path] = ()) -> None:
+        """Async counterpart of _run_ffmpeg (same bounded stderr tail and temp outputs)"""
+        command, renames = _redirect_outputs(command, outputs)
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            tail = deque(maxlen=_STDERR_TAIL_CHUNKS)
+            try:
+                while chunk := await proc.stderr.read(_STDERR_CHUNK_BYTES):
+                    tail.append(chunk)
+                await proc.wait()
+            except asyncio.CancelledError:
+                if proc.returncode is None:
+                    proc.terminate()
+                    await proc.wait()
+                raise
+
+            if proc.returncode != 0:
+                raise RuntimeError(
+                    f"FFmpeg failed to generate clip: {b''.join(tail).decode('utf-8', 'replace')}"
+                )
+        except BaseException:
+            _finish_outputs(renames, success=False)
+            raise
+
+        _finish_outputs(renames, success=True)
+
+    def _clip_names(
+        self,
+        index: int,
+        segment: Dict,
+        start_time: float,
+        end_time: float,
+        include_timestamps: bool
+    ) -> Tuple[str, str]:
+        """Return (clip_basename, clip_filename) for a segment"""
+        clip_basename = self.generate_clip_filename(
+            index=index,
+            title=segment.get('title', ''),
+            start_time=start_time,
+            end_time=end_time,
+            include_timestamps=include_timestamps
+        )
+        return clip_basename, f"{clip_basename}.mp4"
 
-            except Exception as e:
-                # Log error but continue with other clips
-                error_info = {
-                    'clip_id': clip_basename,
-                    'clip_filename': clip_filename,
-                    'error': str(e),
-                    'success': False,
-                    'index': i
-                }
-                results.append(error_info)
+    @staticmethod
+    def _with_segment_metadata(
+        clip_info: Dict,
+        clip_basename: str,
+        clip_filename: str,
+        index: int,
+        segment: Dict
+    ) -> Dict:
+        """Attach segment metadata to a generated clip's info dict"""
+        clip_info.update({
+            'clip_id': clip_basename,
+            'clip_filename': clip_filename,
+            'title': segment.get('title', 'Untitled'),
+            'index': index,
+            'segment': segment
+        })
+        return clip_info
 
-                if progress_callback:
-                    progress_callback(i, total, error_info)
+    @staticmethod
+    def _error_info(
+        clip_basename: str,
+        clip_filename: str,
+        index: int,
+        error: Exception
+    ) -> Dict:
+        """Info dict recorded for a clip that failed to generate"""
+        return {
+            'clip_id': clip_basename,
+            'clip_filename': clip_filename,
+            'error': str(error),
+            'success': False,
+            'index': index
+        }
 
-        return results
+    def _write_shards(
+        self,
+        results: List[Dict],
+        output_dir: Path,
+        shard_size: int
+    ) -> None:
+        """
+        Pack generated clips into WebDataset-style tar shards
+
+        Each shard-NNNNN.tar gets a shard-NNNNN.jsonl sidecar with one line of
+        metadata per clip, in archive order. Both are written to temp files
+        and renamed into place, so a crash never leaves a truncated shard.
+        Clip dicts are updated in place with the shard they were written to.
+
+        Args:
+            results: Clip metadata dicts from generate_multiple_clips
+            output_dir: Directory to write shards into
+            shard_size: Maximum clips per shard
+        """
+        clips = [r for r in results if r.get('success')]
+
+        for shard_idx, offset in enumerate(range(0, len(clips), shard_size)):
+            batch = clips[offset:offset + shard_size]
+            shard_name = f"shard-{shard_idx:05d}"
+            tar_path = output_dir / f"{shard_name}.tar"
+
+            tmp_path = _temp_output_path(tar_path)
+            renames = {str(tmp_path): str(tar_path)}
+            try:
+                with tarfile.open(tmp_path, 'w') as tf:
+                    for clip in batch:
+                        tf.add(clip['output_path'], arcname=clip['clip_filename'])
+            except BaseException:
+                _finish_outputs(renames, success=False)
+                raise
+            _finish_outputs(renames, success=True)
+
+            _write_json(output_dir / f"{shard_name}.jsonl", [
+                {
+                    'id': clip['clip_id'],
+                    'filename': clip['clip_filename'],
+                    'title': clip['title'],
+                    'start_time': clip['start_time'],
+                    'end_time': clip['end_time'],
+                    'duration': clip['duration'],
+                    'size_bytes': clip['size_bytes']
+                }
+                for clip in batch
+            ], lines=True)
+
+            for clip in batch:
+                Path(clip['output_path']).unlink()
+                clip['shard'] = str(tar_path)
+                clip['output_path'] = f"{tar_path}#{clip['clip_filename']}"
 
     def generate_thumbnail(
         self,
         timestamp: float,
         output_path: Path,
         width: Optional[int] = None,
-        height: Optional[int] = None
+        height: Optional[int] = None,
+        exact: bool = False
     ) -> Path:
         """
         Generate a thumbnail image from video at specific timestamp
@@ -498,6 +1775,8 @@ class ClipGenerator:
             output_path: Where to save thumbnail
             width: Optional width (maintains aspect ratio if only width given)
             height: Optional height (maintains aspect ratio if only height given)
+            exact: Decode up to the exact timestamp. By default the keyframe
+                at or before it is used, which only decodes that one frame.
 
         Returns:
             Path to generated thumbnail
@@ -505,11 +1784,15 @@ class ClipGenerator:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Keyframe-only decode: skip every B/P frame and take the keyframe we land on
+        input_opts = () if exact else ("-skip_frame", "nokey", "-noaccurate_seek")
+
         command = [
             "ffmpeg",
-            "-ss", str(timestamp),
-            "-i", str(self.video_path),
+            *self._video_input_args(timestamp, timestamp + 1, *input_opts),
+            "-vsync", "vfr",                    # Don't duplicate frames to fill gaps
             "-frames:v", "1",                   # Extract 1 frame
+            "-q:v", "2",                        # High-quality JPEG
         ]
 
         # Add scaling if specified
@@ -528,19 +1811,8 @@ class ClipGenerator:
             str(output_path)
         ])
 
-        try:
-            subprocess.run(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True
-            )
-            return output_path
-
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(
-                f"Failed to generate thumbnail: {e.stderr.decode('utf-8')}"
-            )
+        _run_ffmpeg(command, "Failed to generate thumbnail", [output_path])
+        return output_path
 
     def generate_clip_with_metadata(
         self,
@@ -577,8 +1849,29 @@ class ClipGenerator:
             include_timestamps=include_timestamps
         )
 
-        # Generate clip
         clip_path = output_dir / f"{clip_basename}.mp4"
+
+        if generate_thumb:
+            # One decode pass for both the clip and its midpoint thumbnail
+            thumb_path = output_dir / f"{clip_basename}_thumb.jpg"
+            try:
+                clip_info = self.generate_clip_with_thumbnail(
+                    segment['start_time'],
+                    segment['end_time'],
+                    clip_path,
+                    thumb_path,
+                    padding=padding
+                )
+                return self._add_clip_extras(
+                    clip_info, segment, output_dir, clip_basename,
+                    generate_thumb=False
+                )
+            except RuntimeError:
+                # Fall back to separate passes, which report thumbnail
+                # failures without failing the clip
+                pass
+
+        # Generate clip
         clip_info = self.generate_clip(
             segment['start_time'],
             segment['end_time'],
@@ -586,6 +1879,125 @@ class ClipGenerator:
             padding=padding
         )
 
+        return self._add_clip_extras(
+            clip_info, segment, output_dir, clip_basename, generate_thumb
+        )
+
+    def generate_clip_with_thumbnail(
+        self,
+        start_time: float,
+        end_time: float,
+        output_path: Path,
+        thumb_path: Path,
+        padding: float = 0.0,
+        thumb_width: int = 640,
+        codec: str = "auto",
+        crf: int = 23,
+        preset: str = "medium",
+        audio_codec: str = "aac"
+    ) -> Dict:
+        """
+        Encode a clip and grab its midpoint thumbnail in a single FFmpeg run
+
+        The source is decoded once and split into the clip encoder and a
+        one-frame JPEG output, instead of a second seek+decode per thumbnail.
+
+        Args:
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            output_path: Where to save the clip
+            thumb_path: Where to save the thumbnail
+            padding: Seconds to add before/after for context
+            thumb_width: Thumbnail width (height keeps aspect ratio)
+            codec: Video codec (default: "auto", see generate_clip)
+            crf: Constant Rate Factor for quality
+            preset: Encoding preset
+            audio_codec: Audio codec (default: aac)
+
+        Returns:
+            Dict with clip metadata, including 'thumbnail'
+        """
+        duration = self.get_video_info()['duration']
+
+        actual_start = max(0, start_time - padding)
+        actual_end = min(duration, end_time + padding)
+        actual_duration = actual_end - actual_start
+
+        if actual_duration <= 0:
+            raise ValueError(
+                f"Invalid clip duration: start={actual_start}, end={actual_end}"
+            )
+
+        output_path = Path(output_path)
+        thumb_path = Path(thumb_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        thumb_path.parent.mkdir(parents=True, exist_ok=True)
+
+        codec = resolve_codec(codec)
+
+        # Midpoint of the requested segment, relative to the clip start
+        thumb_offset = max(0.0, (start_time + end_time) / 2 - actual_start)
+
+        command = [
+            "ffmpeg", "-y",
+            *self._video_input_args(
+                actual_start, actual_end, "-t", str(actual_duration)
+            ),
+        ]
+        if self.enhanced_audio_path:
+            command += [
+                "-ss", str(actual_start),
+                "-t", str(actual_duration),
+                "-i", str(self.enhanced_audio_path),
+            ]
+        audio_map = "1:a" if self.enhanced_audio_path else "0:a?"
+
+        command += [
+            "-filter_complex",
+            f"[0:v]split=2[vclip][vthumb];"
+            f"[vthumb]select='gte(t,{thumb_offset})',scale={thumb_width}:-1[thumb]",
+            # Output 1: the clip
+            "-map", "[vclip]",
+            "-map", audio_map,
+            *video_codec_args(codec, crf, preset),
+            "-c:a", audio_codec,
+            "-b:a", "128k",
+            "-movflags", "+faststart",
+            str(output_path),
+            # Output 2: a single thumbnail frame
+            "-map", "[thumb]",
+            "-frames:v", "1",
+            str(thumb_path)
+        ]
+
+        _run_ffmpeg(
+            command, "FFmpeg failed to generate clip with thumbnail",
+            [output_path, thumb_path]
+        )
+
+        return self._add_output_size({
+            'output_path': str(output_path),
+            'start_time': actual_start,
+            'end_time': actual_end,
+            'duration': actual_duration,
+            'requested_start': start_time,
+            'requested_end': end_time,
+            'padding': padding,
+            'codec': codec,
+            'crf': crf,
+            'thumbnail': str(thumb_path),
+            'success': True
+        })
+
+    def _add_clip_extras(
+        self,
+        clip_info: Dict,
+        segment: Dict,
+        output_dir: Path,
+        clip_basename: str,
+        generate_thumb: bool = True
+    ) -> Dict:
+        """Add thumbnail, segment metadata and a metadata JSON file to a generated clip"""
         # Generate thumbnail at midpoint
         if generate_thumb:
             try:
@@ -612,8 +2024,7 @@ class ClipGenerator:
 
         # Save metadata JSON
         metadata_path = output_dir / f"{clip_basename}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(clip_info, f, indent=2)
+        _write_json(metadata_path, clip_info)
 
         clip_info['metadata_file'] = str(metadata_path)
 
@@ -1,12 +1,45 @@
 """Professional clip alignment for A-list editing quality"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+import numpy as np
 from arena.ai.sentence_detector import SentenceBoundaryDetector
 from arena.video.scene_detector import SceneDetector
 
 if TYPE_CHECKING:
     from arena.ai.analyzer import TranscriptAnalyzer
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8192)
+def _format_whole_seconds(seconds: int) -> str:
+    """MM:SS for a whole number of seconds (reports only show 1s resolution)"""
+    minutes, secs = divmod(seconds, 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+
+class TranscriptIndex(NamedTuple):
+    """Transcript segments as start-sorted arrays for overlap lookups"""
+    starts: np.ndarray
+    ends: np.ndarray
+    max_ends: np.ndarray
+    order: np.ndarray
+    texts: List[str]
+
+
+class AlignmentTotals(NamedTuple):
+    """Summary counters shared by the alignment report and stats"""
+    total: int
+    aligned: int
+    sum_start: float
+    sum_end: float
+    max_start: float
+    max_end: float
+    zero_count: int
+
 
 class ProfessionalClipAligner:
     """
@@ -36,10 +69,26 @@ class ProfessionalClipAligner:
             use_scene_detection: Enable scene detection for cut point optimization
         """
         self.detector = sentence_detector or SentenceBoundaryDetector()
-        self.scene_detector = scene_detector or SceneDetector(threshold=0.4)
+        self._scene_detector = scene_detector
         self.max_adjustment = max_adjustment
         self.use_scene_detection = use_scene_detection
 
+        # |start|/|end| adjustments of the last align_clips result, for stats
+        self._aligned_clips: Optional[List[Dict]] = None
+        self._start_adj = np.empty(0)
+        self._end_adj = np.empty(0)
+
+    @property
+    def scene_detector(self) -> SceneDetector:
+        """Scene detector, created on first use (default: threshold 0.4)"""
+        if self._scene_detector is None:
+            self._scene_detector = SceneDetector(threshold=0.4)
+        return self._scene_detector
+
+    @scene_detector.setter
+    def scene_detector(self, detector: Optional[SceneDetector]) -> None:
+        self._scene_detector = detector
+
     def align_clips(
         self,
         clips: List[Dict],
@@ -67,87 +116,178 @@ class ProfessionalClipAligner:
         boundaries = self.detector.find_sentence_boundaries(transcript_segments)
 
         if not boundaries:
-            print("⚠️  Warning: No sentence boundaries found, using original timestamps")
+            logger.warning("No sentence boundaries found, using original timestamps")
             return clips
 
-        print(f"🔍 Found {len(boundaries)} sentence boundaries")
+        logger.info("Found %d sentence boundaries", len(boundaries))
 
         # Optionally detect scene changes
         scene_boundaries = []
         if self.use_scene_detection and video_path:
             try:
-                print(f"🎬 Detecting scene changes...")
                 scenes = self.scene_detector.detect_scenes(video_path, min_scene_duration=2.0)
                 scene_boundaries = [{'time': s['time'], 'type': 'scene_change'} for s in scenes]
-                print(f"   Found {len(scene_boundaries)} scene changes")
+                logger.info("Found %d scene changes", len(scene_boundaries))
 
                 # Mark boundaries that align with both sentences AND scenes
-                for boundary in boundaries:
-                    for scene in scene_boundaries:
-                        if abs(boundary['time'] - scene['time']) < 1.0:  # Within 1 second
-                            boundary['double_boundary'] = True
-                            break
+                self._mark_double_boundaries(boundaries, scene_boundaries)
 
             except Exception as e:
-                print(f"⚠️  Scene detection failed: {e}")
-                print(f"   Continuing with sentence boundaries only")
-
-        aligned_clips = []
-        adjustments_made = 0
-
-        for i, clip in enumerate(clips, 1):
-            # Align this clip to sentence boundaries
-            aligned_start, aligned_end, metadata = self.detector.align_clip_to_boundaries(
-                start_time=clip['start_time'],
-                end_time=clip['end_time'],
-                boundaries=boundaries,
-                max_adjustment=self.max_adjustment,
-                min_clip_duration=min_duration,
-                max_clip_duration=max_duration
+                logger.warning(
+                    "Scene detection failed (%s); continuing with sentence boundaries only", e
+                )
+
+        # Boundaries are time-sorted, so each clip can binary-search them
+        boundary_times = self.detector.boundary_times(boundaries)
+
+        # Titles are regenerated from the aligned text, so index the transcript once
+        transcript_index = self._index_transcript(transcript_segments) if analyzer else None
+
+        def align(item) -> Dict:
+            i, clip = item
+            return self._align_one(
+                i, clip, boundaries, boundary_times, transcript_index,
+                min_duration, max_duration, analyzer
             )
 
-            # Create aligned clip
-            aligned_clip = clip.copy()
-            aligned_clip.update({
-                'original_start': clip['start_time'],
-                'original_end': clip['end_time'],
-                'original_duration': clip['end_time'] - clip['start_time'],
-                'start_time': aligned_start,
-                'end_time': aligned_end,
-                'duration': aligned_end - aligned_start,
-                'alignment': metadata,
-                'professionally_aligned': metadata['start_aligned'] or metadata['end_aligned']
-            })
-
-            # Regenerate title based on aligned content if analyzer provided
-            if analyzer and (metadata['start_aligned'] or metadata['end_aligned']):
-                try:
-                    # Extract transcript text for the aligned time range
-                    aligned_text = analyzer.extract_transcript_text(
-                        transcript_segments,
-                        aligned_start,
-                        aligned_end
-                    )
-
-                    # Generate new title based on actual aligned content
-                    if aligned_text:
-                        new_title = analyzer.generate_clip_title(aligned_text)
-                        aligned_clip['title'] = new_title
-                        aligned_clip['original_title'] = clip.get('title', '')
-                except Exception as e:
-                    # If title regeneration fails, keep original
-                    print(f"   ⚠️  Failed to regenerate title for clip {i}: {e}")
-
-            aligned_clips.append(aligned_clip)
-
-            # Track adjustments
-            if metadata['start_aligned'] or metadata['end_aligned']:
-                adjustments_made += 1
-
-        print(f"   ✓ Aligned {adjustments_made}/{len(clips)} clips to sentence boundaries\n")
+        # Title regeneration waits on the LLM, so overlap it across clips
+        if analyzer and len(clips) >= 4:
+            with ThreadPoolExecutor(max_workers=min(16, len(clips))) as executor:
+                aligned_clips = list(executor.map(align, enumerate(clips, 1)))
+        else:
+            aligned_clips = [align(item) for item in enumerate(clips, 1)]
+
+        # Track adjustments
+        adjustments_made = sum(1 for c in aligned_clips if c['professionally_aligned'])
+        self._start_adj, self._end_adj = self._build_adjustment_arrays(aligned_clips)
+        self._aligned_clips = aligned_clips
+
+        logger.info("Aligned %d/%d clips to sentence boundaries", adjustments_made, len(clips))
 
         return aligned_clips
 
+    def _align_one(
+        self,
+        i: int,
+        clip: Dict,
+        boundaries: List[Dict],
+        boundary_times: np.ndarray,
+        transcript_index: Optional[TranscriptIndex],
+        min_duration: Optional[float],
+        max_duration: Optional[float],
+        analyzer: Optional['TranscriptAnalyzer']
+    ) -> Dict:
+        """Align one clip (and regenerate its title) for align_clips"""
+        # Align this clip to sentence boundaries
+        aligned_start, aligned_end, metadata = self.detector.align_clip_to_boundaries(
+            start_time=clip['start_time'],
+            end_time=clip['end_time'],
+            boundaries=boundaries,
+            max_adjustment=self.max_adjustment,
+            min_clip_duration=min_duration,
+            max_clip_duration=max_duration,
+            boundary_times=boundary_times
+        )
+
+        # Create aligned clip
+        original_start = clip['start_time']
+        original_end = clip['end_time']
+        aligned_clip = {
+            **clip,
+            'original_start': original_start,
+            'original_end': original_end,
+            'original_duration': original_end - original_start,
+            'start_time': aligned_start,
+            'end_time': aligned_end,
+            'duration': aligned_end - aligned_start,
+            'alignment': metadata,
+            'professionally_aligned': metadata['start_aligned'] or metadata['end_aligned']
+        }
+
+        # Regenerate title based on aligned content if analyzer provided
+        if analyzer and (metadata['start_aligned'] or metadata['end_aligned']):
+            try:
+                # Extract transcript text for the aligned time range
+                aligned_text = self._transcript_text(
+                    transcript_index, aligned_start, aligned_end
+                )
+
+                # Generate new title based on actual aligned content, unless
+                # the adjustment didn't change which text the clip covers
+                original_text = self._transcript_text(
+                    transcript_index, original_start, original_end
+                )
+                if aligned_text and aligned_text != original_text:
+                    new_title = analyzer.generate_clip_title(aligned_text)
+                    aligned_clip['title'] = new_title
+                    aligned_clip['original_title'] = clip.get('title', '')
+            except Exception as e:
+                # If title regeneration fails, keep original
+                logger.warning("Failed to regenerate title for clip %d: %s", i, e)
+
+        return aligned_clip
+
+    @staticmethod
+    def _index_transcript(transcript_segments: List[Dict]) -> TranscriptIndex:
+        """Build the arrays _transcript_text searches over"""
+        count = len(transcript_segments)
+        starts = np.fromiter((s.get('start', 0) for s in transcript_segments),
+                             dtype=np.float64, count=count)
+        ends = np.fromiter((s.get('end', 0) for s in transcript_segments),
+                           dtype=np.float64, count=count)
+        order = np.argsort(starts, kind='stable')
+        ends = ends[order]
+
+        return TranscriptIndex(
+            starts=starts[order],
+            ends=ends,
+            max_ends=np.maximum.accumulate(ends) if count else ends,
+            order=order,
+            texts=[s.get('text', '').strip() for s in transcript_segments]
+        )
+
+    @staticmethod
+    def _transcript_text(index: TranscriptIndex, start_time: float, end_time: float) -> str:
+        """
+        Transcript text overlapping a time range
+
+        Same result as TranscriptAnalyzer.extract_transcript_text, but only
+        segments in the binary-searched window [lo, hi) are examined.
+        """
+        lo = np.searchsorted(index.max_ends, start_time, side='right')
+        hi = np.searchsorted(index.starts, end_time, side='left')
+        matches = np.sort(index.order[lo:hi][index.ends[lo:hi] > start_time])
+
+        texts = index.texts
+        return ' '.join([texts[i] for i in matches.tolist()])
+
+    def _mark_double_boundaries(
+        self,
+        boundaries: List[Dict],
+        scene_boundaries: List[Dict],
+        tolerance: float = 1.0
+    ) -> None:
+        """
+        Flag sentence boundaries within `tolerance` seconds of a scene change
+
+        Each boundary is compared only with its nearest scene change on
+        either side, found by binary search over the sorted scene times.
+        """
+        if not scene_boundaries:
+            return
+
+        scene_times = np.sort(np.fromiter((s['time'] for s in scene_boundaries),
+                                          dtype=np.float64, count=len(scene_boundaries)))
+        times = self.detector.boundary_times(boundaries)
+
+        idx = np.searchsorted(scene_times, times)
+        before = scene_times[np.maximum(idx - 1, 0)]
+        after = scene_times[np.minimum(idx, len(scene_times) - 1)]
+        nearest = np.minimum(np.abs(times - before), np.abs(after - times))
+
+        for i in np.flatnonzero(nearest < tolerance):
+            boundaries[i]['double_boundary'] = True
+
     def generate_alignment_report(
         self,
         aligned_clips: List[Dict],
@@ -163,76 +303,75 @@ class ProfessionalClipAligner:
         Returns:
             Formatted alignment report string
         """
-        report = []
-        report.append("=" * 70)
-        report.append("📊 Professional Editing Report")
-        report.append("=" * 70)
-        report.append("")
+        rule = "=" * 70
+        report = [f"{rule}\n📊 Professional Editing Report\n{rule}\n"]
 
+        format_time = self._format_time
         for i, clip in enumerate(aligned_clips[:top_n], 1):
             title = clip.get('title', 'Untitled')[:60]
             alignment = clip.get('alignment', {})
-
-            report.append(f"Clip {i}: {title}")
-            report.append(f"  Original:  {self._format_time(clip['original_start'])} → "
-                         f"{self._format_time(clip['original_end'])} "
-                         f"({clip['original_duration']:.1f}s)")
-            report.append(f"  Aligned:   {self._format_time(clip['start_time'])} → "
-                         f"{self._format_time(clip['end_time'])} "
-                         f"({clip['duration']:.1f}s)")
-
-            # Show adjustments
             start_adj = alignment.get('start_adjustment', 0)
             end_adj = alignment.get('end_adjustment', 0)
+            start_type = alignment.get('start_boundary_type')
+            end_type = alignment.get('end_boundary_type')
 
+            # Show adjustments
             if start_adj != 0 or end_adj != 0:
-                report.append(f"  Adjustment: Start {start_adj:+.1f}s, End {end_adj:+.1f}s")
+                adjustment = f"Start {start_adj:+.1f}s, End {end_adj:+.1f}s"
             else:
-                report.append(f"  Adjustment: None (already aligned)")
+                adjustment = "None (already aligned)"
 
             # Show boundary types
-            start_type = alignment.get('start_boundary_type')
-            end_type = alignment.get('end_boundary_type')
-
+            boundaries = ""
             if start_type or end_type:
-                boundaries = []
+                types = []
                 if start_type:
-                    boundaries.append(f"start={start_type}")
+                    types.append(f"start={start_type}")
                 if end_type:
-                    boundaries.append(f"end={end_type}")
-                report.append(f"  Boundaries: {', '.join(boundaries)}")
+                    types.append(f"end={end_type}")
+                boundaries = f"  Boundaries: {', '.join(types)}\n"
 
             # Quality indicator
             if clip.get('professionally_aligned'):
-                report.append(f"  Quality:    ✓ Sentence aligned")
+                quality = "✓ Sentence aligned"
             else:
-                report.append(f"  Quality:    ⚠ No boundaries nearby")
-
-            report.append("")
+                quality = "⚠ No boundaries nearby"
+
+            report.append(
+                f"Clip {i}: {title}\n"
+                f"  Original:  {format_time(clip['original_start'])} → "
+                f"{format_time(clip['original_end'])} "
+                f"({clip['original_duration']:.1f}s)\n"
+                f"  Aligned:   {format_time(clip['start_time'])} → "
+                f"{format_time(clip['end_time'])} "
+                f"({clip['duration']:.1f}s)\n"
+                f"  Adjustment: {adjustment}\n"
+                f"{boundaries}"
+                f"  Quality:    {quality}\n"
+            )
 
         # Summary statistics
-        total = len(aligned_clips)
-        aligned = sum(1 for c in aligned_clips if c.get('professionally_aligned'))
-        avg_start_adj = sum(abs(c.get('alignment', {}).get('start_adjustment', 0))
-                           for c in aligned_clips) / total if total > 0 else 0
-        avg_end_adj = sum(abs(c.get('alignment', {}).get('end_adjustment', 0))
-                         for c in aligned_clips) / total if total > 0 else 0
-
-        report.append("=" * 70)
-        report.append("Summary:")
-        report.append(f"  Total clips:          {total}")
-        report.append(f"  Professionally aligned: {aligned} ({aligned/total*100:.0f}%)")
-        report.append(f"  Avg start adjustment: {avg_start_adj:.2f}s")
-        report.append(f"  Avg end adjustment:   {avg_end_adj:.2f}s")
-        report.append("=" * 70)
+        totals = self._compute_stats(aligned_clips)
+        total = totals.total
+        aligned = totals.aligned
+        avg_start_adj = totals.sum_start / total if total > 0 else 0
+        avg_end_adj = totals.sum_end / total if total > 0 else 0
+
+        report.append(
+            f"{rule}\n"
+            f"Summary:\n"
+            f"  Total clips:          {total}\n"
+            f"  Professionally aligned: {aligned} ({aligned/total*100:.0f}%)\n"
+            f"  Avg start adjustment: {avg_start_adj:.2f}s\n"
+            f"  Avg end adjustment:   {avg_end_adj:.2f}s\n"
+            f"{rule}"
+        )
 
         return "\n".join(report)
 
     def _format_time(self, seconds: float) -> str:
         """Format seconds as MM:SS"""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes:02d}:{secs:02d}"
+        return _format_whole_seconds(int(seconds))
 
     def get_alignment_stats(self, aligned_clips: List[Dict]) -> Dict:
         """
@@ -247,23 +386,48 @@ class ProfessionalClipAligner:
         if not aligned_clips:
             return {}
 
-        total = len(aligned_clips)
-        aligned = sum(1 for c in aligned_clips if c.get('professionally_aligned'))
-
-        start_adjustments = [c.get('alignment', {}).get('start_adjustment', 0)
-                            for c in aligned_clips]
-        end_adjustments = [c.get('alignment', {}).get('end_adjustment', 0)
-                          for c in aligned_clips]
+        totals = self._compute_stats(aligned_clips)
+        total = totals.total
 
         return {
             'total_clips': total,
-            'professionally_aligned': aligned,
-            'alignment_rate': aligned / total if total > 0 else 0,
-            'avg_start_adjustment': sum(abs(a) for a in start_adjustments) / total if total > 0 else 0,
-            'avg_end_adjustment': sum(abs(a) for a in end_adjustments) / total if total > 0 else 0,
-            'max_start_adjustment': max(abs(a) for a in start_adjustments) if start_adjustments else 0,
-            'max_end_adjustment': max(abs(a) for a in end_adjustments) if end_adjustments else 0,
-            'zero_adjustment_count': sum(1 for c in aligned_clips
-                                        if c.get('alignment', {}).get('start_adjustment', 0) == 0
-                                        and c.get('alignment', {}).get('end_adjustment', 0) == 0)
+            'professionally_aligned': totals.aligned,
+            'alignment_rate': totals.aligned / total,
+            'avg_start_adjustment': totals.sum_start / total,
+            'avg_end_adjustment': totals.sum_end / total,
+            'max_start_adjustment': totals.max_start,
+            'max_end_adjustment': totals.max_end,
+            'zero_adjustment_count': totals.zero_count
         }
+
+    def _compute_stats(self, aligned_clips: List[Dict]) -> AlignmentTotals:
+        """Compute every alignment summary counter from the adjustment arrays"""
+        start_adj, end_adj = self._adjustment_arrays(aligned_clips)
+        has_clips = len(aligned_clips) > 0
+
+        return AlignmentTotals(
+            total=len(aligned_clips),
+            aligned=sum(1 for c in aligned_clips if c.get('professionally_aligned')),
+            sum_start=float(start_adj.sum()),
+            sum_end=float(end_adj.sum()),
+            max_start=float(start_adj.max()) if has_clips else 0.0,
+            max_end=float(end_adj.max()) if has_clips else 0.0,
+            zero_count=int(((start_adj == 0) & (end_adj == 0)).sum())
+        )
+
+    def _adjustment_arrays(self, aligned_clips: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """Absolute adjustments, reusing those stored by align_clips when they match"""
+        if aligned_clips is self._aligned_clips and len(aligned_clips) == len(self._start_adj):
+            return self._start_adj, self._end_adj
+        return self._build_adjustment_arrays(aligned_clips)
+
+    @staticmethod
+    def _build_adjustment_arrays(aligned_clips: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """Collect absolute start/end adjustments into float64 arrays"""
+        count = len(aligned_clips)
+        alignments = [clip.get('alignment') or {} for clip in aligned_clips]
+        start_adj = np.fromiter((a.get('start_adjustment') or 0 for a in alignments),
+                                dtype=np.float64, count=count)
+        end_adj = np.fromiter((a.get('end_adjustment') or 0 for a in alignments),
+                              dtype=np.float64, count=count)
+        return np.abs(start_adj), np.abs(end_adj)
@@ -1,5 +1,85 @@
 """Scoring algorithm for ranking and filtering video segments"""
-from typing import List, Dict, Optional
+import bisect
+from typing import Callable, List, Dict, Optional, Tuple
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Visual score for 0, 1-2 and 3+ scene changes
+_VISUAL_BUCKETS = np.array([0.3, 0.6, 0.9])
+
+def _score_kernel(
+    ai_starts: np.ndarray,
+    ai_ends: np.ndarray,
+    ai_scores: np.ndarray,
+    a_starts: np.ndarray,
+    a_ends: np.ndarray,
+    a_energy: np.ndarray,
+    a_max_ends: np.ndarray,
+    v_times: np.ndarray,
+    weights: np.ndarray
+) -> np.ndarray:
+    """
+    Score every AI segment against start-sorted audio and visual arrays
+
+    a_max_ends is the running maximum of a_ends, so a binary search finds
+    the first audio segment that can still reach a segment's start.
+    Empty audio/visual arrays mean "no data" and give the neutral 0.5.
+
+    Returns:
+        (N, 3) array of audio score, visual score and combined score
+    """
+    n = ai_starts.shape[0]
+    out = np.empty((n, 3))
+
+    for i in range(n):
+        start = ai_starts[i]
+        end = ai_ends[i]
+
+        audio_score = 0.5
+        if a_starts.shape[0] > 0:
+            total = 0.0
+            hits = 0
+            first = np.searchsorted(a_max_ends, start, side='right')
+            for j in range(first, a_starts.shape[0]):
+                if a_starts[j] >= end:
+                    break  # Sorted by start: nothing later can overlap
+                if a_ends[j] > start:
+                    total += a_energy[j]
+                    hits += 1
+            if hits > 0:
+                audio_score = total / hits
+
+        visual_score = 0.5
+        if v_times.shape[0] > 0:
+            changes = (
+                np.searchsorted(v_times, end, side='right') -
+                np.searchsorted(v_times, start, side='left')
+            )
+            if changes == 0:
+                visual_score = 0.3
+            elif changes <= 2:
+                visual_score = 0.6
+            else:
+                visual_score = 0.9
+
+        out[i, 0] = audio_score
+        out[i, 1] = visual_score
+        out[i, 2] = (
+            weights[0] * ai_scores[i] +
+            weights[1] * audio_score +
+            weights[2] * visual_score
+        )
+
+    return out
+
+
+if HAS_NUMBA:
+    _score_kernel = njit(cache=True)(_score_kernel)
 
 
 class SegmentScorer:
@@ -42,30 +122,51 @@ class SegmentScorer:
         Returns:
             Scored and ranked segments
         """
-        scored_segments = []
+        if HAS_NUMBA:
+            scored_segments = self._score_segments_jit(
+                ai_segments, audio_segments, visual_segments
+            )
+        else:
+            scored_segments = self._score_segments_vec(
+                ai_segments, audio_segments, visual_segments
+            )
 
-        for segment in ai_segments:
-            # Start with AI score
-            ai_score = segment.get("interest_score", 0.5)
+        # Sort by combined score (highest first)
+        scored_segments.sort(key=lambda s: s["scores"]["combined"], reverse=True)
 
-            # Find overlapping audio segments
-            audio_score = self._get_audio_score(
-                segment, audio_segments or []
-            )
+        return scored_segments
 
-            # Find overlapping visual segments
-            visual_score = self._get_visual_score(
-                segment, visual_segments or []
-            )
+    def _score_segments_jit(
+        self,
+        ai_segments: List[Dict],
+        audio_segments: Optional[List[Dict]],
+        visual_segments: Optional[List[Dict]]
+    ) -> List[Dict]:
+        """Attach scores to segments using the compiled _score_kernel"""
+        count = len(ai_segments)
+        ai_starts = np.fromiter((s["start_time"] for s in ai_segments),
+                                dtype=np.float64, count=count)
+        ai_ends = np.fromiter((s["end_time"] for s in ai_segments),
+                              dtype=np.float64, count=count)
+        ai_scores = np.fromiter((s.get("interest_score", 0.5) for s in ai_segments),
+                                dtype=np.float64, count=count)
+
+        empty = np.empty(0, dtype=np.float64)
+        a_starts, a_ends, a_energy, a_max_ends = (
+            self._audio_arrays(audio_segments) if audio_segments
+            else (empty, empty, empty, empty)
+        )
+        v_times = self._visual_times(visual_segments) if visual_segments else empty
+        weights = np.array([self.ai_weight, self.audio_weight, self.visual_weight])
 
-            # Calculate combined score
-            combined_score = (
-                self.ai_weight * ai_score +
-                self.audio_weight * audio_score +
-                self.visual_weight * visual_score
-            )
+        results = _score_kernel(
+            ai_starts, ai_ends, ai_scores,
+            a_starts, a_ends, a_energy, a_max_ends, v_times, weights
+        )
 
-            # Add scores to segment
+        for segment, ai_score, (audio_score, visual_score, combined_score) in zip(
+            ai_segments, ai_scores.tolist(), results.tolist()
+        ):
             segment["scores"] = {
                 "ai_interest": round(ai_score, 2),
                 "audio_energy": round(audio_score, 2),
@@ -73,20 +174,58 @@ class SegmentScorer:
                 "combined": round(combined_score, 2)
             }
 
-            scored_segments.append(segment)
+        return list(ai_segments)
 
-        # Sort by combined score (highest first)
-        scored_segments.sort(
-            key=lambda x: x["scores"]["combined"],
-            reverse=True
+    def _score_segments_vec(
+        self,
+        ai_segments: List[Dict],
+        audio_segments: Optional[List[Dict]],
+        visual_segments: Optional[List[Dict]]
+    ) -> List[Dict]:
+        """Attach scores to segments with per-segment NumPy lookups (no numba)"""
+        # Build signal arrays once; each segment then does a vectorized lookup
+        get_audio_score = self._make_audio_getter(audio_segments)
+        visual_times = self._visual_times(visual_segments) if visual_segments else None
+
+        count = len(ai_segments)
+        starts = np.fromiter((s["start_time"] for s in ai_segments),
+                             dtype=np.float64, count=count)
+        ends = np.fromiter((s["end_time"] for s in ai_segments),
+                           dtype=np.float64, count=count)
+        ai_scores = np.fromiter((s.get("interest_score", 0.5) for s in ai_segments),
+                                dtype=np.float64, count=count)
+
+        # Find overlapping audio segments
+        audio_scores = np.fromiter(
+            (get_audio_score(start, end)
+             for start, end in zip(starts.tolist(), ends.tolist())),
+            dtype=np.float64, count=count
         )
+        visual_scores = self._visual_scores(starts, ends, visual_times)
 
-        return scored_segments
+        # Calculate combined scores for the whole batch in one product
+        weights = np.array([self.ai_weight, self.audio_weight, self.visual_weight])
+        signals = np.stack([ai_scores, audio_scores, visual_scores], axis=1)
+        combined_scores = signals @ weights
+
+        for segment, (ai_score, audio_score, visual_score), combined_score in zip(
+            ai_segments, signals.tolist(), combined_scores.tolist()
+        ):
+            # Add scores to segment
+            segment["scores"] = {
+                "ai_interest": round(ai_score, 2),
+                "audio_energy": round(audio_score, 2),
+                "visual_change": round(visual_score, 2),
+                "combined": round(combined_score, 2)
+            }
+
+        return list(ai_segments)
 
     def filter_overlapping(
         self,
         segments: List[Dict],
-        overlap_threshold: float = 0.3
+        overlap_threshold: float = 0.3,
+        limit: Optional[int] = None
     ) -> List[Dict]:
         """
         Remove overlapping segments, keeping highest scored ones
@@ -94,6 +233,7 @@ class SegmentScorer:
         Args:
             segments: List of segments (must be sorted by score)
             overlap_threshold: Max allowed overlap ratio (0-1)
+            limit: Stop once this many segments have been kept
 
         Returns:
             Filtered list with no significant overlaps
@@ -101,20 +241,39 @@ class SegmentScorer:
         if not segments:
             return []
 
-        filtered = [segments[0]]  # Keep highest scored
+        filtered = []
+        # Accepted intervals kept sorted by start, so only neighbours are checked
+        starts: List[float] = []
+        ends: List[float] = []
+        max_length = 0.0
 
-        for segment in segments[1:]:
-            # Check if it overlaps with any already selected segment
-            has_overlap = False
+        for segment in segments:
+            start = segment["start_time"]
+            end = segment["end_time"]
+            length = end - start
 
-            for selected in filtered:
-                overlap_ratio = self._calculate_overlap(segment, selected)
-                if overlap_ratio > overlap_threshold:
-                    has_overlap = True
-                    break
+            # Check if it overlaps with any already selected segment. Only
+            # intervals starting before `end` can overlap, and none starting
+            # at or before start - max_length can reach past `start`.
+            has_overlap = False
+            i = bisect.bisect_left(starts, end) - 1
+            while i >= 0 and starts[i] + max_length > start:
+                overlap = min(end, ends[i]) - max(start, starts[i])
+                if overlap > 0:
+                    min_length = min(length, ends[i] - starts[i])
+                    if min_length > 0 and overlap / min_length > overlap_threshold:
+                        has_overlap = True
+                        break
+                i -= 1
 
             if not has_overlap:
                 filtered.append(segment)
+                if limit and len(filtered) >= limit:
+                    break
+                pos = bisect.bisect_right(starts, start)
+                starts.insert(pos, start)
+                ends.insert(pos, end)
+                max_length = max(max_length, length)
 
         return filtered
 
@@ -144,106 +303,87 @@ class SegmentScorer:
         ]
 
         # Remove overlaps
-        non_overlapping = self.filter_overlapping(valid_segments)
+        non_overlapping = self.filter_overlapping(valid_segments, limit=target_count)
 
         # Return top N
         return non_overlapping[:target_count]
 
-    def _get_audio_score(
-        self,
-        segment: Dict,
+    @staticmethod
+    def _audio_arrays(
         audio_segments: List[Dict]
-    ) -> float:
-        """Calculate audio energy score for segment"""
-        if not audio_segments:
-            return 0.5  # Neutral score if no audio data
-
-        start = segment["start_time"]
-        end = segment["end_time"]
-        overlapping_scores = []
-
-        for audio_seg in audio_segments:
-            # Check for overlap
-            audio_start = audio_seg.get("start", 0)
-            audio_end = audio_seg.get("end", 0)
-
-            if self._has_overlap(start, end, audio_start, audio_end):
-                overlapping_scores.append(
-                    audio_seg.get("energy_score", 0.5)
-                )
-
-        # Return average of overlapping audio scores
-        if overlapping_scores:
-            return sum(overlapping_scores) / len(overlapping_scores)
-
-        return 0.5
-
-    def _get_visual_score(
-        self,
-        segment: Dict,
-        visual_segments: List[Dict]
-    ) -> float:
-        """Calculate visual change score for segment"""
-        if not visual_segments:
-            return 0.5  # Neutral score if no visual data
-
-        start = segment["start_time"]
-        end = segment["end_time"]
-        scene_changes = 0
-
-        for visual_seg in visual_segments:
-            # Check if scene change occurs within segment
-            change_time = visual_seg.get("time", 0)
-            if start <= change_time <= end:
-                scene_changes += 1
-
-        # Normalize: more scene changes = higher score (but cap it)
-        # 0 changes = 0.3, 1-2 changes = 0.6, 3+ changes = 0.9
-        if scene_changes == 0:
-            return 0.3
-        elif scene_changes <= 2:
-            return 0.6
-        else:
-            return 0.9
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Split audio segments into start-sorted float64 arrays
 
-    def _has_overlap(
-        self,
-        start1: float,
-        end1: float,
-        start2: float,
-        end2: float
-    ) -> bool:
-        """Check if two time ranges overlap"""
-        return start1 < end2 and start2 < end1
-
-    def _calculate_overlap(
+        Returns:
+            Tuple of (starts, ends, energy, running max of ends)
+        """
+        count = len(audio_segments)
+        starts = np.fromiter((a.get("start", 0) for a in audio_segments),
+                             dtype=np.float64, count=count)
+        ends = np.fromiter((a.get("end", 0) for a in audio_segments),
+                           dtype=np.float64, count=count)
+        energy = np.fromiter((a.get("energy_score", 0.5) for a in audio_segments),
+                             dtype=np.float64, count=count)
+        order = np.argsort(starts, kind='stable')
+        ends = ends[order]
+        return starts[order], ends, energy[order], np.maximum.accumulate(ends)
+
+    @staticmethod
+    def _visual_times(visual_segments: List[Dict]) -> np.ndarray:
+        """Sorted scene change times as a float64 array"""
+        times = np.fromiter((v.get("time", 0) for v in visual_segments),
+                            dtype=np.float64, count=len(visual_segments))
+        times.sort()
+        return times
+
+    def _make_audio_getter(
         self,
-        segment1: Dict,
-        segment2: Dict
-    ) -> float:
+        audio_segments: Optional[List[Dict]]
+    ) -> Callable[[float, float], float]:
         """
-        Calculate overlap ratio between two segments
+        Build an audio energy scorer with the signal arrays bound in
 
         Returns:
-            Overlap ratio (0-1), where 1 means complete overlap
+            Function mapping (start, end) to the segment's audio score
         """
-        start1 = segment1["start_time"]
-        end1 = segment1["end_time"]
-        start2 = segment2["start_time"]
-        end2 = segment2["end_time"]
-
-        # Calculate overlap
-        overlap_start = max(start1, start2)
-        overlap_end = min(end1, end2)
-
-        if overlap_start >= overlap_end:
-            return 0.0  # No overlap
-
-        overlap_duration = overlap_end - overlap_start
-
-        # Calculate ratio relative to shorter segment
-        duration1 = end1 - start1
-        duration2 = end2 - start2
-        min_duration = min(duration1, duration2)
+        if not audio_segments:
+            return lambda start, end: 0.5  # Neutral score if no audio data
+
+        starts, ends, energy, max_ends = self._audio_arrays(audio_segments)
+        searchsorted = np.searchsorted
+
+        def get_audio_score(start: float, end: float) -> float:
+            # Only [lo, hi) can overlap: earlier ones all end by `start`,
+            # later ones all begin at or after `end`
+            lo = searchsorted(max_ends, start, side='right')
+            hi = searchsorted(starts, end, side='left')
+            mask = ends[lo:hi] > start
+
+            # Return average of overlapping audio scores
+            if mask.any():
+                return float(energy[lo:hi][mask].mean())
+
+            return 0.5
+
+        return get_audio_score
+
+    @staticmethod
+    def _visual_scores(
+        starts: np.ndarray,
+        ends: np.ndarray,
+        visual_times: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """Calculate visual change scores for all segments at once"""
+        if visual_times is None:
+            return np.full(len(starts), 0.5)  # Neutral score if no visual data
+
+        # Count scene changes that occur within each segment (times are sorted)
+        scene_changes = (
+            np.searchsorted(visual_times, ends, side='right') -
+            np.searchsorted(visual_times, starts, side='left')
+        )
 
-        return overlap_duration / min_duration if min_duration > 0 else 0.0
+        # Normalize: more scene changes = higher score (but cap it)
+        # 0 changes = 0.3, 1-2 changes = 0.6, 3+ changes = 0.9
+        return _VISUAL_BUCKETS[np.digitize(scene_changes, [1, 3])]
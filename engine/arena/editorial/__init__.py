@@ -16,7 +16,7 @@ Usage:
     clips = analyzer.analyze_transcript(transcript_data, target_clips=10)
 """
 
-from .adapter import FourLayerAdapter
+from .adapter import FourLayerAdapter, setup_cli_logging
 from .layer1_moment_detector import MomentDetector
 from .layer2_boundary_analyzer import ThoughtBoundaryAnalyzer
 from .layer3_context_refiner import StandaloneContextRefiner
@@ -27,5 +27,6 @@ __all__ = [
     'MomentDetector',
     'ThoughtBoundaryAnalyzer',
     'StandaloneContextRefiner',
-    'PackagingLayer'
+    'PackagingLayer',
+    'setup_cli_logging'
 ]
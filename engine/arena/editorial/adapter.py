@@ -5,9 +5,98 @@ This adapter maintains the same interface as TranscriptAnalyzer but uses
 the 4-layer editorial architecture internally for higher quality clips.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
+import asyncio
+import dataclasses
+import functools
+import heapq
+import io
 import json
+import logging
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter, itemgetter
+from .utils import (
+    RateLimiter,
+    _import_openai,
+    TranscriptIndex,
+    create_openai_client,
+    fits_token_budget,
+    format_transcript_with_timestamps
+)
+
+if TYPE_CHECKING:
+    from .layer4_packaging import PackagedClip
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+
+def setup_cli_logging(stream=None, name: str = __name__) -> logging.Logger:
+    """
+    Show a module's logged progress output on a console stream
+
+    Attaches a message-only handler, so output looks like the old print()
+    progress lines. Safe to call more than once.
+
+    Args:
+        stream: Stream to write to (default: sys.stdout)
+        name: Logger to configure (default: the adapter's); a package
+            name such as "arena.clipping" covers all of its modules
+
+    Returns:
+        The configured logger
+    """
+    target = logging.getLogger(name)
+    if not any(getattr(h, '_arena_cli', False) for h in target.handlers):
+        handler = logging.StreamHandler(stream or sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        handler._arena_cli = True
+        target.addHandler(handler)
+        target.propagate = False  # Don't print twice if the root logger is configured too
+    target.setLevel(logging.INFO)
+    return target
+
+
+def _to_json(obj):
+    """json.dumps fallback for layer records (e.g. PackagedClip dataclasses)"""
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@functools.cache
+def _get_export_executor() -> ThreadPoolExecutor:
+    """Thread pool for layer exports, shared by every adapter"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix='arena-editorial-export')
+
+
+@functools.cache
+def _get_layer_classes() -> Tuple[type, type, type, type]:
+    """
+    Import the four layer classes (and the OpenAI SDK they call) once
+
+    Returns:
+        Tuple of (MomentDetector, ThoughtBoundaryAnalyzer,
+        StandaloneContextRefiner, PackagingLayer)
+    """
+    from .layer1_moment_detector import MomentDetector
+    from .layer2_boundary_analyzer import ThoughtBoundaryAnalyzer
+    from .layer3_context_refiner import StandaloneContextRefiner
+    from .layer4_packaging import PackagingLayer
+
+    # The layers import openai lazily; pull it in now so the first API call
+    # doesn't pay for it (a missing SDK is reported when a client is created)
+    _import_openai()
+
+    return MomentDetector, ThoughtBoundaryAnalyzer, StandaloneContextRefiner, PackagingLayer
 
 
 class FourLayerAdapter:
@@ -24,32 +113,91 @@ class FourLayerAdapter:
         Layer 3: Validate standalone context (12 pass, quality gate)
         Layer 4: Package with titles/descriptions/metadata
 
+    Layers 2-3 run as a pipeline: moments are analyzed and then validated
+    in small batches sharing one prompt, and thoughts move on to validation
+    as soon as their boundary analysis finishes, with at most
+    `max_concurrency` API calls in flight per model. Layer 2
+    (the base model) and Layers 1, 3-4 (gpt-4o-mini) draw on separate OpenAI
+    rate-limit pools, so each model gets its own worker pool and, optionally,
+    its own RPM/TPM limiter. Layer 4 then packages only the top
+    `target_clips` clips that passed.
+
     Example:
         >>> from arena.editorial import FourLayerAdapter
         >>> analyzer = FourLayerAdapter(api_key="sk-...")
         >>> clips = analyzer.analyze_transcript(transcript_data, target_clips=10)
     """
 
+    DEFAULT_MAX_CONCURRENCY = 5  # Parallel API calls across Layers 2-4
+
+    # Longest transcript sent whole ahead of every Layer 2/3 prompt. Past this,
+    # even at the cached-input rate it costs more than the per-clip windows alone.
+    PROMPT_CACHE_MAX_TOKENS = 4000
+
+    # Attributes holding each layer instance (set as the layers are created)
+    LAYER_ATTRS = ('moment_detector', 'boundary_analyzer', 'context_refiner', 'packager')
+
     def __init__(
         self,
         api_key: str,
         model: str = "gpt-4o",
         export_layers: bool = False,
-        score_weights: Optional[Dict[str, float]] = None
+        score_weights: Optional[Dict[str, float]] = None,
+        max_concurrency: Optional[int] = None,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        batch_mode: bool = False,
+        rpm_map: Optional[Dict[str, int]] = None,
+        tpm_map: Optional[Dict[str, int]] = None,
+        cache_dir: Optional[Path] = None
     ):
         """
         Initialize 4-layer editorial adapter
 
         Args:
             api_key: OpenAI API key
-            model: Base model to use (default: gpt-4o)
+            model: Model for Layer 2 boundary analysis (default: gpt-4o); Layers 1
+                and 3-4 use gpt-4o-mini
             export_layers: Whether to export intermediate layer results for debugging
             score_weights: Custom scoring weights (default: {'interest': 0.6, 'standalone': 0.4})
+            max_concurrency: Max API calls in flight per model in Layers 2-4 (default: 5)
+            requests_per_minute: Account RPM limit to pace all layers' calls under
+            tokens_per_minute: Account TPM limit to pace all layers' calls under
+            batch_mode: Package clips through the OpenAI Batch API (half price,
+                up to 24h turnaround) - for offline runs only
+            rpm_map: Per-model RPM limits, e.g. {'gpt-4o': 500, 'gpt-4o-mini': 5000}.
+                Models listed here (or in tpm_map) get their own limiter instead
+                of the shared requests_per_minute/tokens_per_minute one
+            tpm_map: Per-model TPM limits, keyed like rpm_map
+            cache_dir: Optional directory to cache Layer 1 responses in, so
+                re-running the same transcript skips moment detection calls
         """
         self.api_key = api_key
         self.model = model
         self.export_layers = export_layers
+        self.max_concurrency = max_concurrency or self.DEFAULT_MAX_CONCURRENCY
+        self.batch_mode = batch_mode
+        self.cache_dir = cache_dir
         self.layer_outputs = {}  # Store for export
+        self._segment_index = None  # TranscriptIndex of the last transcript, shared by the layers
+        self._cached_transcript_block = None  # (segments, count, block) shared by Layers 2-3
+        self._client = None  # OpenAI client shared by every layer, created on first use
+
+        # One budget shared by every layer whose model has no limits of its own,
+        # so a busy layer can't push the others into 429s
+        self.rate_limiter = (
+            RateLimiter(requests_per_minute, tokens_per_minute)
+            if requests_per_minute or tokens_per_minute else None
+        )
+
+        # OpenAI meters each model separately, so models with known limits
+        # are paced on their own and don't hold each other back
+        rpm_map = rpm_map or {}
+        tpm_map = tpm_map or {}
+        self._limiters = {
+            model_name: RateLimiter(rpm_map.get(model_name), tpm_map.get(model_name))
+            for model_name in rpm_map.keys() | tpm_map.keys()
+        }
 
         # Default scoring weights (60% interest, 40% standalone)
         self.score_weights = score_weights or {
@@ -58,7 +206,11 @@ class FourLayerAdapter:
         }
 
         # Layers will be initialized on first use
-        # (lazy initialization to avoid loading if not needed)
+        # (lazy initialization to avoid loading if not needed); their imports
+        # warm up in the background meanwhile
+        threading.Thread(
+            target=_get_layer_classes, name='arena-editorial-imports', daemon=True
+        ).start()
 
     def analyze_transcript(
         self,
@@ -98,87 +250,108 @@ class FourLayerAdapter:
                 }
             }
         """
-        from .layer1_moment_detector import MomentDetector
-        from .layer2_boundary_analyzer import ThoughtBoundaryAnalyzer
-        from .layer3_context_refiner import StandaloneContextRefiner
-        from .layer4_packaging import PackagingLayer
+        MomentDetector = _get_layer_classes()[0]
 
-        print("\n🎬 4-LAYER EDITORIAL ANALYSIS")
-        print("="*70)
+        logger.info("\n🎬 4-LAYER EDITORIAL ANALYSIS\n%s", "=" * 70)
 
         # Layer 1: Find interesting moments (over-detect 2.5x)
-        print("\n[1/4] 🔍 Detecting interesting moments...")
-        self.moment_detector = MomentDetector(self.api_key, model=self.model)
-        moments = self.moment_detector.detect(
-            transcript_data,
-            target_moments=int(target_clips * 2.5)
+        logger.info("\n[1/4] 🔍 Detecting interesting moments...")
+        self.moment_detector = MomentDetector(
+            self.api_key, model="gpt-4o-mini", client=self._get_client(),
+            rate_limiter=self._get_rate_limiter("gpt-4o-mini"),
+            cache_dir=self.cache_dir
         )
-        print(f"      ✓ Found {len(moments)} candidate moments")
+        segments = transcript_data.get('segments', [])
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='arena-editorial-setup') as setup:
+            # Set up Layers 2-4 (transcript index, prompt prefix, tokenizer)
+            # while Layer 1 waits on the API
+            downstream = setup.submit(self._create_downstream_layers, segments)
+            moments = self.moment_detector.detect(
+                transcript_data,
+                target_moments=int(target_clips * 2.5)
+            )
+        logger.info("      ✓ Found %d candidate moments", len(moments))
 
         if not moments:
-            print("      ❌ No interesting moments found")
+            logger.info("      ❌ No interesting moments found")
             return []
 
         # Store Layer 1 output
         if self.export_layers:
             self.layer_outputs['layer1_moments'] = moments
 
-        # Layer 2: Expand to complete thought boundaries
-        print("\n[2/4] 🧠 Analyzing thought boundaries...")
-        self.boundary_analyzer = ThoughtBoundaryAnalyzer(self.api_key, model=self.model)
-        thoughts = self.boundary_analyzer.analyze_all(
+        # Layers 2-3: each moment flows through boundary analysis and
+        # validation on its own, so Layer 3 doesn't wait for the whole batch
+        logger.info("\n[2-3/4] 🧠 Analyzing boundaries and validating...")
+        self.boundary_analyzer, self.context_refiner, self.packager = downstream.result()
+
+        # Moments already too long for max_duration would only fail Layer 3
+        moments = self.boundary_analyzer.filter_by_duration(moments, max_duration)
+        if not moments:
+            logger.info("      ❌ No moments fit the maximum duration")
+            return []
+
+        thoughts, validated_clips = asyncio.run(self._run_pipeline(
             moments,
             transcript_data,
-            parallel=True
-        )
-        print(f"      ✓ Analyzed {len(thoughts)} complete thoughts")
+            min_duration,
+            max_duration
+        ))
+
+        self.boundary_analyzer.update_metrics(thoughts)
+        self.context_refiner.update_pass_rate()
+        logger.info("      ✓ Analyzed %d complete thoughts", len(thoughts))
 
         if not thoughts:
-            print("      ❌ No complete thoughts identified")
+            logger.info("      ❌ No complete thoughts identified")
             return []
 
         # Store Layer 2 output
         if self.export_layers:
             self.layer_outputs['layer2_boundaries'] = thoughts
 
-        # Layer 3: Validate standalone context (QUALITY GATE)
-        print("\n[3/4] ✂️  Validating standalone context...")
-        self.context_refiner = StandaloneContextRefiner(self.api_key, model="gpt-4o-mini")
-        validated_clips = self.context_refiner.refine_all(
-            thoughts,
-            transcript_data,
-            min_duration,
-            max_duration
-        )
-
-        # Filter to only PASS clips
+        # Layer 3 is the quality gate: only PASS clips get packaged
         passed_clips = [c for c in validated_clips if c['verdict'] == 'PASS']
-        print(f"      ✓ {len(passed_clips)} clips passed validation")
-        print(f"      ✗ {len(validated_clips) - len(passed_clips)} clips rejected/revised")
+        logger.info("      ✓ %d clips passed validation", len(passed_clips))
+        logger.info("      ✗ %d clips rejected/revised", len(validated_clips) - len(passed_clips))
 
         if not passed_clips:
-            print("      ❌ No clips passed standalone validation")
+            logger.info("      ❌ No clips passed standalone validation")
             return []
 
         # Store Layer 3 output
         if self.export_layers:
             self.layer_outputs['layer3_validated'] = validated_clips
 
-        # Layer 4: Package top clips
-        print("\n[4/4] 📦 Packaging clips...")
-        self.packager = PackagingLayer(self.api_key, model="gpt-4o-mini")
-        packaged_clips = self.packager.package_all(passed_clips, transcript_data)
-
         # Select top N by combined score (configurable weights)
-        def combined_score(c):
-            return (
-                c['interest_score'] * self.score_weights['interest'] +
-                c['standalone_score'] * self.score_weights['standalone']
-            )
+        interest_weight = self.score_weights['interest']
+        standalone_weight = self.score_weights['standalone']
+
+        # Both scores are known after Layer 3, so shortlist before paying
+        # for packaging clips that wouldn't make the cut
+        def validated_score(c, _iw=interest_weight, _sw=standalone_weight):
+            moment = c['complete_thought']['original_moment']
+            return moment['interest_score'] * _iw + c['standalone_score'] * _sw
+
+        shortlist = heapq.nlargest(target_clips, passed_clips, key=validated_score)
+
+        # Layer 4: Package the shortlisted clips
+        logger.info("\n[4/4] 📦 Packaging top %d clips...", len(shortlist))
+        if self.batch_mode:
+            # One offline Batch API job for all of them
+            packaged_clips = self.packager.package_all(shortlist, transcript_data)
+        else:
+            packaged_clips = asyncio.run(self._package_clips(shortlist, segments))
+
+        # Defaults bind the getter and weights as fast locals for the heap's key calls
+        def combined_score(c, _scores=attrgetter('interest_score', 'standalone_score'),
+                           _iw=interest_weight, _sw=standalone_weight):
+            interest, standalone = _scores(c)
+            return interest * _iw + standalone * _sw
 
-        top_clips = sorted(packaged_clips, key=combined_score, reverse=True)[:target_clips]
+        top_clips = heapq.nlargest(target_clips, packaged_clips, key=combined_score)
 
-        print(f"      ✓ Packaged {len(top_clips)} final clips")
+        logger.info("      ✓ Packaged %d final clips", len(top_clips))
 
         # Store Layer 4 output
         if self.export_layers:
@@ -192,6 +365,176 @@ class FourLayerAdapter:
 
         return legacy_clips
 
+    def _create_downstream_layers(self, segments: List[Dict]) -> Tuple:
+        """
+        Create Layers 2-4 for a transcript
+
+        Runs in a background thread during Layer 1, so the shared client
+        must already exist.
+
+        Returns:
+            Tuple of (ThoughtBoundaryAnalyzer, StandaloneContextRefiner, PackagingLayer)
+        """
+        (_, ThoughtBoundaryAnalyzer,
+         StandaloneContextRefiner, PackagingLayer) = _get_layer_classes()
+
+        transcript_block = self._get_transcript_block(segments)
+        transcript_index = self._get_transcript_index(segments)
+        boundary_analyzer = ThoughtBoundaryAnalyzer(
+            self.api_key, model=self.model, client=self._client,
+            rate_limiter=self._get_rate_limiter(self.model),
+            cached_transcript_block=transcript_block, transcript_index=transcript_index
+        )
+        context_refiner = StandaloneContextRefiner(
+            self.api_key, model="gpt-4o-mini", client=self._client,
+            rate_limiter=self._get_rate_limiter("gpt-4o-mini"),
+            cached_transcript_block=transcript_block, transcript_index=transcript_index
+        )
+        packager = PackagingLayer(
+            self.api_key, model="gpt-4o-mini", client=self._client,
+            rate_limiter=self._get_rate_limiter("gpt-4o-mini"), batch_mode=self.batch_mode,
+            transcript_index=transcript_index
+        )
+        return boundary_analyzer, context_refiner, packager
+
+    async def _run_pipeline(
+        self,
+        moments: List[Dict],
+        transcript_data: Dict,
+        min_duration: Optional[int],
+        max_duration: Optional[int]
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Push every moment through Layers 2-3 concurrently
+
+        Args:
+            moments: Moments from Layer 1
+            transcript_data: Full transcript data with segments
+            min_duration: Optional minimum clip duration in seconds
+            max_duration: Optional maximum clip duration in seconds
+
+        Returns:
+            Tuple of (thoughts, validated clips), each in moment order
+        """
+        segments = transcript_data.get('segments', [])
+        if not segments:
+            logger.warning("      ⚠️  No segments in transcript")
+            return [], []
+
+        # One thread-safe client for both layers' worker threads
+        client = self._get_client()
+        total = len(moments)
+
+        # One worker pool per model: gpt-4o-mini validation keeps going
+        # while the base model's boundary analysis is saturated
+        pools = {}
+
+        def pool(layer) -> asyncio.Semaphore:
+            if layer.model not in pools:
+                pools[layer.model] = asyncio.Semaphore(self.max_concurrency)
+            return pools[layer.model]
+
+        thoughts = {}
+        validated_clips = {}
+
+        # Thoughts are validated in small batches that share one prompt;
+        # a batch starts as soon as enough thoughts are ready
+        pending = []
+        batch_tasks = []
+
+        async def validate(batch: List[Tuple[int, Dict]]):
+            async with pool(self.context_refiner):
+                clips = await self.context_refiner.refine_batch_async(
+                    client, [thought for _, thought in batch], segments,
+                    min_duration, max_duration
+                )
+            for (idx, _), clip in zip(batch, clips):
+                if clip:
+                    validated_clips[idx] = clip
+
+        def start_batch():
+            batch_tasks.append(asyncio.create_task(validate(pending[:])))
+            pending.clear()
+
+        async def analyze(batch: List[Tuple[int, Dict]]):
+            async with pool(self.boundary_analyzer):
+                batch_thoughts = await self.boundary_analyzer.analyze_batch_async(
+                    client, batch, total, segments, max_duration
+                )
+            for idx, thought in self.boundary_analyzer.fan_out(batch, batch_thoughts, duplicates):
+                if thought:
+                    thoughts[idx] = thought
+                    pending.append((idx, thought))
+                    if len(pending) >= self.context_refiner.BATCH_SIZE:
+                        start_batch()
+
+        # Moments are analyzed in small batches too (neighbouring moments
+        # share one prompt and their overlapping context)
+        batches, duplicates = self.boundary_analyzer.make_batches(moments)
+        logger.info("      Processing %d moments in %d batches with %d parallel workers per model...",
+                    total, len(batches), self.max_concurrency)
+        await asyncio.gather(*(analyze(batch) for batch in batches))
+        if pending:
+            start_batch()
+        await asyncio.gather(*batch_tasks)
+
+        return (
+            [thoughts[i] for i in sorted(thoughts)],
+            [validated_clips[i] for i in sorted(validated_clips)]
+        )
+
+    async def _package_clips(
+        self,
+        clips: List[Dict],
+        segments: List[Dict]
+    ) -> List['PackagedClip']:
+        """
+        Package clips with Layer 4, several batches at a time
+
+        Args:
+            clips: Validated clips to package
+            segments: Transcript segments
+
+        Returns:
+            Packaged clips (failures dropped), in input order
+        """
+        client = self._get_client()
+        sem = asyncio.Semaphore(self.max_concurrency)
+        size = self.packager.BATCH_SIZE
+
+        async def package(start: int):
+            chunk = clips[start:start + size]
+            async with sem:
+                return await self.packager.package_batch_async(
+                    client, chunk, list(range(start + 1, start + len(chunk) + 1)), segments
+                )
+
+        batches = await asyncio.gather(*(
+            package(start) for start in range(0, len(clips), size)
+        ))
+        return [clip for batch in batches for clip in batch if clip]
+
+    def _get_rate_limiter(self, model: str) -> Optional[RateLimiter]:
+        """Limiter for a model's calls: its own if configured, else the shared one"""
+        return self._limiters.get(model, self.rate_limiter)
+
+    def _get_client(self):
+        """
+        Return the OpenAI client shared by all four layers
+
+        One pooled client means one set of TLS connections (multiplexed over
+        HTTP/2 when h2 is installed) instead of a fresh pool per layer.
+        """
+        if self._client is None:
+            self._client = create_openai_client(self.api_key)
+        return self._client
+
+    def close(self):
+        """Close the shared OpenAI client's connection pool"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
     def generate_clip_title(self, transcript_segment: str) -> str:
         """
         Generate title for clip (called by ProfessionalClipAligner).
@@ -207,8 +550,11 @@ class FourLayerAdapter:
         """
         # Initialize packager if not already done
         if not hasattr(self, 'packager'):
-            from .layer4_packaging import PackagingLayer
-            self.packager = PackagingLayer(self.api_key, model="gpt-4o-mini")
+            PackagingLayer = _get_layer_classes()[3]
+            self.packager = PackagingLayer(
+                self.api_key, model="gpt-4o-mini", client=self._get_client(),
+                rate_limiter=self._get_rate_limiter("gpt-4o-mini")
+            )
 
         # Use Layer 4 to generate title
         return self.packager.generate_title_only(transcript_segment)
@@ -233,19 +579,48 @@ class FourLayerAdapter:
         Returns:
             Concatenated transcript text for the time range
         """
-        text_parts = []
+        index = self._get_transcript_index(transcript_segments)
+        texts = index.texts
+        return ' '.join([texts[i] for i in index.overlapping(start_time, end_time)])
 
-        for segment in transcript_segments:
-            seg_start = segment.get('start', 0)
-            seg_end = segment.get('end', 0)
-
-            # Check if segment overlaps with our time range
-            if seg_start < end_time and seg_end > start_time:
-                text_parts.append(segment.get('text', '').strip())
-
-        return ' '.join(text_parts)
+    def _get_transcript_block(self, transcript_segments: List[Dict]) -> Optional[str]:
+        """
+        Full timestamped transcript shared as a prompt-cache prefix, built once per transcript
 
-    def export_layer_outputs(self, output_dir: Path):
+        Returns:
+            Transcript block, or None if the transcript is longer than
+            PROMPT_CACHE_MAX_TOKENS (Layers 2-3 then see only their local windows)
+        """
+        cached = self._cached_transcript_block
+        if (cached is not None and cached[0] is transcript_segments
+                and cached[1] == len(transcript_segments)):
+            return cached[2]
+
+        block = None
+        if transcript_segments:
+            transcript = format_transcript_with_timestamps(transcript_segments)
+            if fits_token_budget(transcript, self.PROMPT_CACHE_MAX_TOKENS, self.model):
+                block = f"FULL VIDEO TRANSCRIPT (reference only - the task follows):\n{transcript}"
+
+        self._cached_transcript_block = (transcript_segments, len(transcript_segments), block)
+        return block
+
+    def _get_transcript_index(self, transcript_segments: List[Dict]) -> TranscriptIndex:
+        """TranscriptIndex for the segments, cached for repeat calls on the same list"""
+        cached = self._segment_index
+        if (cached is not None and cached.segments is transcript_segments
+                and len(cached.texts) == len(transcript_segments)):
+            return cached
+
+        self._segment_index = TranscriptIndex(transcript_segments)
+        return self._segment_index
+
+    def export_layer_outputs(
+        self,
+        output_dir: Path,
+        compact: bool = False,
+        wait: bool = True
+    ) -> List[Future]:
         """
         Export intermediate layer results for debugging
 
@@ -255,22 +630,57 @@ class FourLayerAdapter:
             - output_dir/editorial/layer3_validated.json
             - output_dir/editorial/layer4_packaged.json
 
+        The files are serialized and written in parallel on a background
+        thread pool.
+
         Args:
             output_dir: Directory to export results to
+            compact: Write minified JSON instead of indenting it
+            wait: Block until every file is written (default). Pass False to
+                return immediately and collect the futures later.
+
+        Returns:
+            One future per file (empty if export_layers is off)
         """
         if not self.export_layers:
-            return
+            return []
 
         layer_dir = output_dir / "editorial"
         layer_dir.mkdir(exist_ok=True, parents=True)
 
-        for layer_name, data in self.layer_outputs.items():
-            output_file = layer_dir / f"{layer_name}.json"
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            print(f"   ✓ Exported {layer_name}.json")
-
-    def _convert_to_legacy_format(self, clips: List[Dict]) -> List[Dict]:
+        executor = _get_export_executor()
+        futures = [
+            executor.submit(self._write_layer, layer_dir, layer_name, data, compact)
+            for layer_name, data in self.layer_outputs.items()
+        ]
+        if wait:
+            for future in futures:
+                future.result()  # Re-raise write errors in the caller
+        return futures
+
+    @classmethod
+    def _write_layer(cls, layer_dir: Path, layer_name: str, data, compact: bool):
+        """Serialize one layer's output and write it to layer_dir"""
+        with open(layer_dir / f"{layer_name}.json", 'wb') as f:
+            f.write(cls._dumps(data, compact))
+        logger.info("   ✓ Exported %s.json", layer_name)
+
+    @staticmethod
+    def _dumps(data, compact: bool = False) -> bytes:
+        """Serialize layer output to JSON bytes (orjson when installed)"""
+        if HAS_ORJSON:
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if not compact:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(data, option=option)
+            except TypeError:
+                pass  # Types orjson can't handle; let the stdlib try
+        if compact:
+            return json.dumps(data, separators=(',', ':'), default=_to_json).encode('utf-8')
+        return json.dumps(data, indent=2, default=_to_json).encode('utf-8')
+
+    def _convert_to_legacy_format(self, clips: List['PackagedClip']) -> List[Dict]:
         """
         Convert 4-layer output to format expected by HybridAnalyzer
 
@@ -280,82 +690,71 @@ class FourLayerAdapter:
         Returns:
             List[Dict] in TranscriptAnalyzer format
         """
-        legacy_clips = []
-        for i, clip in enumerate(clips, 1):
-            legacy_clips.append({
+        return [
+            {
                 # Required fields (HybridAnalyzer expects these)
                 'id': f"clip_{i:03d}",
-                'start_time': clip['start_time'],
-                'end_time': clip['end_time'],
-                'duration': clip['duration'],
-                'title': clip['title'],
-                'reason': clip['description'],  # Use description as reason
-                'interest_score': clip['interest_score'],
-                'content_type': clip['content_type'],
+                'start_time': clip.start_time,
+                'end_time': clip.end_time,
+                'duration': clip.duration,
+                'title': clip.title,
+                'reason': clip.description,  # Use description as reason
+                'interest_score': clip.interest_score,
+                'content_type': clip.content_type,
                 # Extra metadata (preserved through pipeline)
                 '_4layer_metadata': {
-                    'standalone_score': clip['standalone_score'],
-                    'hashtags': clip['hashtags'],
-                    'thumbnail_time': clip['thumbnail_time'],
-                    'layer1': clip.get('_layer1'),
-                    'layer2': clip.get('_layer2'),
-                    'layer3': clip.get('_layer3')
+                    'standalone_score': clip.standalone_score,
+                    'hashtags': clip.hashtags,
+                    'thumbnail_time': clip.thumbnail_time,
+                    'layer1': clip._layer1,
+                    'layer2': clip._layer2,
+                    'layer3': clip._layer3
                 }
-            })
-        return legacy_clips
+            }
+            for i, clip in enumerate(clips, 1)
+        ]
 
     def _print_summary(self, clips: List[Dict]):
         """
-        Print summary of 4-layer analysis
+        Log summary of 4-layer analysis
 
         Args:
             clips: Final clips in legacy format
         """
-        print("\n" + "="*70)
-        print("📊 EDITORIAL SUMMARY")
-        print("="*70)
-        print(f"Final clips: {len(clips)}")
+        buf = io.StringIO()
+        rule = "=" * 70
+        buf.write(f"\n{rule}\n📊 EDITORIAL SUMMARY\n{rule}\n")
+        buf.write(f"Final clips: {len(clips)}\n")
 
         # Calculate total cost from all layers
-        total_cost = 0.0
-        total_tokens = 0
-        total_api_calls = 0
-
-        if hasattr(self, 'moment_detector'):
-            total_cost += self.moment_detector.metrics.get('cost_usd', 0)
-            total_tokens += self.moment_detector.metrics.get('tokens_used', 0)
-            total_api_calls += self.moment_detector.metrics.get('api_calls', 0)
-
-        if hasattr(self, 'boundary_analyzer'):
-            total_cost += self.boundary_analyzer.metrics.get('cost_usd', 0)
-            total_tokens += self.boundary_analyzer.metrics.get('tokens_used', 0)
-            total_api_calls += self.boundary_analyzer.metrics.get('api_calls', 0)
-
-        if hasattr(self, 'context_refiner'):
-            total_cost += self.context_refiner.metrics.get('cost_usd', 0)
-            total_tokens += self.context_refiner.metrics.get('tokens_used', 0)
-            total_api_calls += self.context_refiner.metrics.get('api_calls', 0)
-
-        if hasattr(self, 'packager'):
-            total_cost += self.packager.metrics.get('cost_usd', 0)
-            total_tokens += self.packager.metrics.get('tokens_used', 0)
-            total_api_calls += self.packager.metrics.get('api_calls', 0)
-
-        print(f"Total cost: ${total_cost:.2f}")
-        print(f"Total tokens: {total_tokens:,}")
-        print(f"Total API calls: {total_api_calls}")
+        get_totals = itemgetter('cost_usd', 'tokens_used', 'api_calls')
+        total_cost, total_tokens, total_api_calls = 0.0, 0, 0
+        for attr in self.LAYER_ATTRS:
+            layer = getattr(self, attr, None)
+            if layer is not None:
+                cost, tokens, api_calls = get_totals(layer.metrics)
+                total_cost += cost
+                total_tokens += tokens
+                total_api_calls += api_calls
+
+        buf.write(f"Total cost: ${total_cost:.2f}\n")
+        buf.write(f"Total tokens: {total_tokens:,}\n")
+        buf.write(f"Total API calls: {total_api_calls}\n")
 
         # Show layer breakdown
         if hasattr(self, 'context_refiner'):
             pass_rate = self.context_refiner.metrics.get('pass_rate', 0)
-            print(f"Layer 3 pass rate: {pass_rate:.1%}")
+            buf.write(f"Layer 3 pass rate: {pass_rate:.1%}\n")
 
         # Show top 3 clips
-        print("\nTop 3 Clips:")
+        buf.write("\nTop 3 Clips:\n")
         for i, clip in enumerate(clips[:3], 1):
-            print(f"  {i}. [{clip['duration']:.1f}s] {clip['title']}")
+            buf.write(f"  {i}. [{clip['duration']:.1f}s] {clip['title']}\n")
             if '_4layer_metadata' in clip:
                 score = (clip['interest_score'] * 0.6) + (clip['_4layer_metadata']['standalone_score'] * 0.4)
-                print(f"     Combined Score: {score:.2f} (Interest: {clip['interest_score']:.2f}, Standalone: {clip['_4layer_metadata']['standalone_score']:.2f})")
+                buf.write(f"     Combined Score: {score:.2f} (Interest: {clip['interest_score']:.2f}, Standalone: {clip['_4layer_metadata']['standalone_score']:.2f})\n")
+
+        buf.write(f"{rule}\n")
 
-        print("="*70 + "\n")
+        # One record, so concurrent output can't interleave with the summary
+        logger.info(buf.getvalue())
@@ -8,10 +8,80 @@ Includes chunking support for large transcripts (>21k tokens) based on the
 rate limit fix we implemented for the single-layer analyzer.
 """
 
-from typing import List, Dict
+from typing import List, Dict, NamedTuple, Optional, Tuple
+from pathlib import Path
+import asyncio
+import hashlib
+from itertools import accumulate
+from operator import attrgetter
 import json
+import os
+import threading
 import time
-from .utils import format_transcript_with_timestamps
+from .utils import (
+    COMPLETION_TOKEN_RESERVE,
+    RATE_LIMIT_MARKERS,
+    RATE_LIMIT_WAIT_RE,
+    RateLimiter,
+    create_openai_client,
+    estimate_tokens,
+    fits_token_budget,
+    format_segment_lines,
+    run_batch_job
+)
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+
+class Moment(NamedTuple):
+    """Candidate moment while Layer 1 works on it (detect() returns dicts)"""
+    rough_start: float
+    rough_end: float
+    core_idea: str
+    why_interesting: str
+    interest_score: float
+    content_type: str
+
+
+# Well-formed compact response (see MomentDetector.SYSTEM_PROMPT)
+COMPACT_RESPONSE_SCHEMA = {
+    "type": "object",
+    "required": ["c"],
+    "properties": {
+        "c": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["s", "e", "i", "w", "x"],
+                "properties": {
+                    "s": {"type": "number"},
+                    "e": {"type": "number"},
+                    "i": {"type": "string"},
+                    "w": {"type": "string"},
+                    "x": {"type": "number"},
+                    "t": {"type": "string"}
+                }
+            }
+        }
+    }
+}
+
+# Parses GPT responses (orjson when installed; its JSONDecodeError subclasses json's)
+_loads = orjson.loads if HAS_ORJSON else json.loads
+
+_validate_compact_response = (
+    fastjsonschema.compile(COMPACT_RESPONSE_SCHEMA) if HAS_FASTJSONSCHEMA else None
+)
 
 
 class MomentDetector:
@@ -27,7 +97,7 @@ class MomentDetector:
     Handles large transcripts via chunking:
         - Detects when transcript exceeds token limits
         - Splits into manageable chunks with overlap
-        - Processes sequentially with rate limit delays
+        - Processes chunks concurrently, paced by a TPM token bucket
         - Merges and deduplicates results
     """
 
@@ -37,17 +107,101 @@ class MomentDetector:
     MAX_TRANSCRIPT_TOKENS = 21000       # Max for transcript content
     DEFAULT_OVERLAP_RATIO = 0.10        # 10% segment overlap
     DEDUP_THRESHOLD = 0.5               # 50% time overlap = duplicate moment
+    MAX_CONCURRENT_CHUNKS = 4           # Chunk requests in flight at once
+    DEFAULT_TOKENS_PER_MINUTE = 200000  # gpt-4o-mini tier-1 TPM, for chunks when no rate_limiter is given
+    TOKENS_PER_CHAR = 0.30              # GPT-4o(-mini) on English text, when not calibrated
+    TEMPERATURE = 0.7
+
+    # Short output keys (fewer generated tokens) -> moment dict keys
+    COMPACT_KEYS = {
+        'rough_start': 's',
+        'rough_end': 'e',
+        'core_idea': 'i',
+        'why_interesting': 'w',
+        'interest_score': 'x',
+        'content_type': 't'
+    }
+
+    # Static instructions, identical for every chunk and retry so OpenAI's
+    # automatic prompt caching can reuse the prefix. Only the target count
+    # and transcript go in the user message (see _create_prompt).
+    SYSTEM_PROMPT = """You are a senior content analyst identifying interesting moments in video content.
 
-    def __init__(self, api_key: str, model: str = "gpt-4o"):
+TASK:
+Identify the most interesting and valuable moments in the transcript you are given
+that are strong candidates for short-form clips.
+
+IMPORTANT:
+You are identifying *candidate regions*, not final clip boundaries.
+Rough timestamps are acceptable at this stage.
+
+LOOK FOR MOMENTS THAT CONTAIN:
+1. Strong hooks or pattern interrupts
+2. Key insights or "aha" realizations
+3. Clear opinions or contrarian takes
+4. Actionable advice or lessons
+5. Emotional or personal moments
+6. Clear problem → realization → outcome patterns
+7. Statements a viewer would want to quote or share
+8. Surprising facts or statistics
+9. Relatable struggles or experiences
+
+DO NOT:
+- Try to perfectly align sentence boundaries
+- Optimize for standalone completeness (that's Layer 3's job)
+- Over-expand clips for context
+
+OUTPUT JSON ONLY, using these short keys:
+s = rough start (seconds), e = rough end (seconds), i = core idea,
+w = why it's interesting, x = interest score, t = content type
+{
+  "c": [
+    {
+      "s": 123.4,
+      "e": 152.8,
+      "i": "Why cloud tools are inefficient for developers in emerging markets",
+      "w": "Strong opinion rooted in personal frustration",
+      "x": 0.85,
+      "t": "insight"
+    }
+  ]
+}
+
+RULES:
+- Return exactly the number of candidates requested
+- Rank by interest score (highest first)
+- Timestamps may be imprecise (we refine in Layer 2)
+- Focus on *idea density*, not polish
+- Content types: "hook", "insight", "advice", "story", "controversial", "emotional", "problem-solution"
+- Interest scores should range 0.5-1.0 (we're only looking at good content)"""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        client=None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache_dir: Optional[Path] = None
+    ):
         """
         Initialize moment detector
 
         Args:
             api_key: OpenAI API key
-            model: Model to use (default: gpt-4o)
+            model: Model to use (default: gpt-4o-mini - a wide net with rough
+                timestamps doesn't need the larger model; Layers 2-3 refine)
+            client: Optional shared OpenAI client (created on first use if None)
+            rate_limiter: Optional RateLimiter shared with other layers
+            cache_dir: Optional directory to cache responses in, so re-running
+                the same transcript skips the API calls
         """
         self.api_key = api_key
         self.model = model
+        self.client = client
+        self.rate_limiter = rate_limiter
+        self.cache_dir = Path(cache_dir) / "moments" if cache_dir else None
+        self._system_tokens = estimate_tokens(self.SYSTEM_PROMPT, model)
+        self._metrics_lock = threading.Lock()  # Chunk calls finish on worker threads
         self.metrics = {
             'api_calls': 0,
             'tokens_used': 0,
@@ -64,7 +218,21 @@ class MomentDetector:
         """
         Detect interesting moments in transcript.
 
-        Automatically handles chunking for large transcripts.
+        Synchronous wrapper around detect_async(); see it for details.
+        """
+        return asyncio.run(self.detect_async(transcript_data, target_moments))
+
+    async def detect_async(
+        self,
+        transcript_data: Dict,
+        target_moments: int = 25
+    ) -> List[Dict]:
+        """
+        Detect interesting moments in transcript.
+
+        Automatically handles chunking for large transcripts. Chunks are
+        sent concurrently (up to MAX_CONCURRENT_CHUNKS), waiting only when
+        the TPM budget is used up.
 
         Args:
             transcript_data: Transcript dict with 'segments', 'text', 'duration'
@@ -81,28 +249,23 @@ class MomentDetector:
                 'content_type': str        # "hook", "insight", "advice", "story"
             }
         """
-        try:
-            from openai import OpenAI
-        except ImportError:
-            raise ImportError("openai package required. Install with: pip install openai")
-
-        client = OpenAI(api_key=self.api_key)
+        client = self._get_client()
         segments = transcript_data.get('segments', [])
 
         if not segments:
             print("      ⚠️  No segments in transcript")
             return []
 
-        # Format transcript with timestamps
-        formatted_transcript = format_transcript_with_timestamps(segments)
+        # Format transcript with timestamps (lines are reused for chunks)
+        lines = format_segment_lines(segments)
+        formatted_transcript = '\n'.join(filter(None, lines))
 
         # Check if chunking is needed
-        total_tokens = self._estimate_tokens(formatted_transcript)
-
-        if total_tokens <= self.MAX_TRANSCRIPT_TOKENS:
+        if fits_token_budget(formatted_transcript, self.MAX_TRANSCRIPT_TOKENS, self.model):
             # No chunking needed
-            print(f"      Transcript size: {total_tokens:,} tokens (no chunking needed)")
-            moments = self._detect_single_chunk(
+            print("      Transcript fits in a single request (no chunking needed)")
+            moments = await asyncio.to_thread(
+                self._detect_single_chunk,
                 client,
                 formatted_transcript,
                 target_moments
@@ -110,59 +273,169 @@ class MomentDetector:
             self.metrics['chunks_processed'] = 1
         else:
             # Chunking needed
+            total_tokens = self._estimate_tokens(formatted_transcript)
             print(f"      ⚠️  Large transcript: {total_tokens:,} tokens")
             print(f"      Splitting into chunks (max {self.MAX_TRANSCRIPT_TOKENS:,} tokens each)")
 
-            chunks = self._chunk_segments(segments, self.MAX_TRANSCRIPT_TOKENS)
+            chunks = self._chunk_segments(
+                lines,
+                self.MAX_TRANSCRIPT_TOKENS,
+                total_tokens / len(formatted_transcript)
+            )
             print(f"      Created {len(chunks)} chunks")
 
-            chunk_results = []
-            for i, chunk_segments in enumerate(chunks, 1):
-                print(f"      Processing chunk {i}/{len(chunks)}...")
+            # Without a shared limiter, pace chunks against the default TPM tier
+            # (each chunk is close to the whole budget)
+            limiter = self.rate_limiter or RateLimiter(
+                tokens_per_minute=self.DEFAULT_TOKENS_PER_MINUTE
+            )
+            sem = asyncio.Semaphore(self.MAX_CONCURRENT_CHUNKS)
 
-                chunk_transcript = format_transcript_with_timestamps(chunk_segments)
-                chunk_tokens = self._estimate_tokens(chunk_transcript)
-                print(f"      Chunk {i}: {len(chunk_segments)} segments, {chunk_tokens:,} tokens")
+            # Detect moments in each chunk
+            chunk_target = target_moments if len(chunks) == 1 else int(target_moments * 1.5)
 
-                # Detect moments in this chunk
-                chunk_target = target_moments if len(chunks) == 1 else int(target_moments * 1.5)
+            async def detect_chunk(i: int, lo: int, hi: int) -> List[Moment]:
+                chunk_transcript = '\n'.join(filter(None, lines[lo:hi]))
+                chunk_tokens = self._estimate_tokens(chunk_transcript)
+                print(f"      Chunk {i}: {hi - lo} segments, {chunk_tokens:,} tokens")
 
                 try:
-                    chunk_moments = self._detect_single_chunk(
-                        client,
-                        chunk_transcript,
-                        chunk_target
-                    )
-                    chunk_results.append(chunk_moments)
+                    async with sem:
+                        chunk_moments = await asyncio.to_thread(
+                            self._detect_single_chunk,
+                            client,
+                            chunk_transcript,
+                            chunk_target,
+                            limiter
+                        )
                     print(f"      ✓ Found {len(chunk_moments)} moments in chunk {i}")
+                    return chunk_moments
                 except Exception as e:
                     print(f"      ⚠️  Chunk {i} failed: {e}")
-                    chunk_results.append([])
+                    return []
 
-                # Rate limit: Wait between chunks
-                if i < len(chunks):
-                    print(f"      ⏳ Waiting 60s for rate limit...")
-                    time.sleep(60)
+            print(f"      Processing {len(chunks)} chunks ({self.MAX_CONCURRENT_CHUNKS} at a time)...")
+            chunk_results = await asyncio.gather(*(
+                detect_chunk(i, lo, hi) for i, (lo, hi) in enumerate(chunks, 1)
+            ))
 
             self.metrics['chunks_processed'] = len(chunks)
+            moments = self._combine_chunk_results(chunk_results, target_moments)
+
+        self.metrics['moments_found'] = len(moments)
+        return [moment._asdict() for moment in moments]
+
+    def detect_batch(
+        self,
+        transcript_data: Dict,
+        target_moments: int = 25,
+        poll_interval: float = 30.0
+    ) -> List[Dict]:
+        """
+        Detect interesting moments through the OpenAI Batch API.
+
+        For offline runs: every chunk prompt goes into one batch job, billed
+        at half the online price and free of per-request rate limiting, but
+        results can take up to 24 hours. Chunks that fail in the job yield
+        no moments (there is no online retry).
+
+        Args:
+            transcript_data: Transcript dict with 'segments', 'text', 'duration'
+            target_moments: Number of candidate moments to find (default: 25)
+            poll_interval: Initial seconds between batch status checks
+
+        Returns:
+            List of moment dicts sorted by interest_score (see detect_async)
+        """
+        segments = transcript_data.get('segments', [])
+
+        if not segments:
+            print("      ⚠️  No segments in transcript")
+            return []
+
+        lines = format_segment_lines(segments)
+        formatted_transcript = '\n'.join(filter(None, lines))
+        if fits_token_budget(formatted_transcript, self.MAX_TRANSCRIPT_TOKENS, self.model):
+            chunk_transcripts = [formatted_transcript]
+            chunk_target = target_moments
+        else:
+            tokens_per_char = self._estimate_tokens(formatted_transcript) / len(formatted_transcript)
+            chunk_transcripts = [
+                '\n'.join(filter(None, lines[lo:hi]))
+                for lo, hi in self._chunk_segments(lines, self.MAX_TRANSCRIPT_TOKENS, tokens_per_char)
+            ]
+            chunk_target = target_moments if len(chunk_transcripts) == 1 else int(target_moments * 1.5)
+
+        requests = [
+            {
+                "custom_id": f"chunk-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": self.SYSTEM_PROMPT},
+                        {"role": "user", "content": self._create_prompt(chunk_transcript, chunk_target)}
+                    ],
+                    "temperature": self.TEMPERATURE,
+                    "response_format": {"type": "json_object"}
+                }
+            }
+            for i, chunk_transcript in enumerate(chunk_transcripts)
+        ]
+
+        bodies = run_batch_job(self._get_client(), requests, "layer1_moments.jsonl", poll_interval)
 
-            # Merge results from all chunks
-            print(f"      Merging {len(chunk_results)} chunks...")
-            moments = self._merge_chunk_results(chunk_results)
-            print(f"      ✓ After deduplication: {len(moments)} unique moments")
+        chunk_results = []
+        for i in range(len(chunk_transcripts)):
+            body = bodies.get(f"chunk-{i}")
+            if body is None:
+                print(f"      ⚠️  Chunk {i + 1} failed in batch")
+                chunk_results.append([])
+                continue
+
+            # Track metrics (Batch API bills GPT-4o-mini at half price: $0.075/1M input, $0.30/1M output)
+            usage = body['usage']
+            self.metrics['api_calls'] += 1
+            self.metrics['tokens_used'] += usage['total_tokens']
+            input_cost = (usage['prompt_tokens'] / 1_000_000) * 0.075
+            output_cost = (usage['completion_tokens'] / 1_000_000) * 0.30
+            self.metrics['cost_usd'] += input_cost + output_cost
 
-            # Take top N by interest_score
-            moments = sorted(moments, key=lambda m: m['interest_score'], reverse=True)[:target_moments]
+            try:
+                result = _loads(body['choices'][0]['message']['content'])
+                chunk_results.append(self._parse_moments(result))
+            except (json.JSONDecodeError, KeyError, IndexError) as e:
+                print(f"      ⚠️  Failed to parse GPT response for chunk {i + 1}: {e}")
+                chunk_results.append([])
+
+        self.metrics['chunks_processed'] = len(chunk_transcripts)
+        if len(chunk_results) == 1:
+            moments = chunk_results[0]
+        else:
+            moments = self._combine_chunk_results(chunk_results, target_moments)
 
         self.metrics['moments_found'] = len(moments)
+        return [moment._asdict() for moment in moments]
+
+    def _combine_chunk_results(
+        self,
+        chunk_results: List[List[Moment]],
+        target_moments: int
+    ) -> List[Moment]:
+        """Merge per-chunk moments, deduplicate, and keep the top target_moments"""
+        print(f"      Merging {len(chunk_results)} chunks...")
+        moments = self._merge_chunk_results(chunk_results, target_moments)
+        print(f"      ✓ Kept {len(moments)} unique moments after deduplication")
         return moments
 
     def _detect_single_chunk(
         self,
         client,
         formatted_transcript: str,
-        target_moments: int
-    ) -> List[Dict]:
+        target_moments: int,
+        rate_limiter: Optional[RateLimiter] = None
+    ) -> List[Moment]:
         """
         Detect moments in a single transcript chunk with retry logic for rate limits
 
@@ -170,49 +443,69 @@ class MomentDetector:
             client: OpenAI client
             formatted_transcript: Formatted transcript with timestamps
             target_moments: Number of moments to find
+            rate_limiter: Limiter to pace this call with (default: self.rate_limiter)
 
         Returns:
-            List of moment dicts
+            List of Moments
         """
         # Create prompt
         prompt = self._create_prompt(formatted_transcript, target_moments)
 
+        cache_path = self._cache_path(prompt)
+        if cache_path is not None and cache_path.exists():
+            try:
+                return self._parse_moments(_loads(cache_path.read_bytes()))
+            except (OSError, json.JSONDecodeError):
+                pass  # Unreadable entry: call the API and overwrite it
+
         # Retry configuration
         max_retries = 5
         base_delay = 2.0  # Start with 2 second delay
 
+        rate_limiter = rate_limiter or self.rate_limiter
+
         for attempt in range(max_retries):
             try:
-                # Call GPT-4o
+                charged = self._throttle(prompt, rate_limiter)
+                # Call GPT-4o-mini
                 response = client.chat.completions.create(
                     model=self.model,
                     messages=[
                         {
                             "role": "system",
-                            "content": "You are a senior content analyst identifying interesting moments in video content."
+                            "content": self.SYSTEM_PROMPT
                         },
                         {
                             "role": "user",
                             "content": prompt
                         }
                     ],
-                    temperature=0.7,
-                    response_format={"type": "json_object"}
+                    temperature=self.TEMPERATURE,
+                    response_format={"type": "json_object"},
+                    stream=True,
+                    stream_options={"include_usage": True}
                 )
+                content, usage = self._read_stream(response)
+                if rate_limiter is not None and usage is not None:
+                    # Settle the estimate against what the call really used
+                    rate_limiter.reconcile(charged, usage.total_tokens)
 
                 # Track metrics
-                self.metrics['api_calls'] += 1
-                self.metrics['tokens_used'] += response.usage.total_tokens
-
-                # Calculate cost (GPT-4o pricing: $2.50/1M input, $10/1M output tokens)
-                input_cost = (response.usage.prompt_tokens / 1_000_000) * 2.50
-                output_cost = (response.usage.completion_tokens / 1_000_000) * 10.00
-                self.metrics['cost_usd'] += input_cost + output_cost
+                with self._metrics_lock:
+                    self.metrics['api_calls'] += 1
+                    if usage is not None:
+                        # Calculate cost (GPT-4o-mini pricing: $0.15/1M input, $0.60/1M output)
+                        input_cost = (usage.prompt_tokens / 1_000_000) * 0.15
+                        output_cost = (usage.completion_tokens / 1_000_000) * 0.60
+                        self.metrics['tokens_used'] += usage.total_tokens
+                        self.metrics['cost_usd'] += input_cost + output_cost
 
                 # Parse response
                 try:
-                    result = json.loads(response.choices[0].message.content)
+                    result = _loads(content)
                     moments = self._parse_moments(result)
+                    if cache_path is not None:
+                        self._write_cache(cache_path, content)
                     return moments
                 except (json.JSONDecodeError, KeyError) as e:
                     print(f"      ⚠️  Failed to parse GPT response: {e}")
@@ -222,13 +515,12 @@ class MomentDetector:
                 error_str = str(e)
 
                 # Check if this is a rate limit error (429)
-                if "rate_limit_exceeded" in error_str or "429" in error_str:
+                if any(marker in error_str for marker in RATE_LIMIT_MARKERS):
                     # Try to extract wait time from error message
                     wait_time = base_delay * (2 ** attempt)  # Exponential backoff
 
                     # Try to parse suggested wait time from error
-                    import re
-                    match = re.search(r'try again in (\d+\.?\d*)s', error_str)
+                    match = RATE_LIMIT_WAIT_RE.search(error_str)
                     if match:
                         wait_time = float(match.group(1)) + 1.0  # Add 1 second buffer
 
@@ -246,11 +538,71 @@ class MomentDetector:
         # Should not reach here, but return empty list as fallback
         return []
 
+    @staticmethod
+    def _read_stream(stream):
+        """
+        Collect a streamed chat completion
+
+        Args:
+            stream: Iterator of chat completion chunks (stream_options include_usage)
+
+        Returns:
+            Tuple of (full message content, usage or None)
+        """
+        parts = []
+        usage = None
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+            if getattr(chunk, 'usage', None) is not None:
+                # Final chunk: empty choices, usage for the whole request
+                usage = chunk.usage
+        return ''.join(parts), usage
+
+    def _throttle(self, prompt: str, rate_limiter: Optional[RateLimiter] = None) -> int:
+        """Wait for the rate limiter (if any) before sending a prompt; returns tokens charged"""
+        rate_limiter = rate_limiter or self.rate_limiter
+        if rate_limiter is None:
+            return 0
+        return rate_limiter.acquire(
+            estimate_tokens(prompt, self.model) + self._system_tokens + COMPLETION_TOKEN_RESERVE
+        )
+
+    def _cache_path(self, prompt: str) -> Optional[Path]:
+        """Response cache file for a prompt (None if caching is off)"""
+        if self.cache_dir is None:
+            return None
+        key = hashlib.sha256(
+            json.dumps([self.model, self.TEMPERATURE, self.SYSTEM_PROMPT, prompt]).encode('utf-8')
+        ).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _write_cache(cache_path: Path, content: str):
+        """Store a response atomically, so an interrupted run can't leave a truncated entry"""
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_text(content, encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _get_client(self):
+        """Return the shared OpenAI client, creating it on first use"""
+        if self.client is None:
+            self.client = create_openai_client(self.api_key)
+        return self.client
+
     def _create_prompt(self, transcript: str, target_moments: int) -> str:
         """
-        Create Layer 1 prompt for moment detection
+        Create the Layer 1 user message for moment detection
 
-        Based on EDITORIAL_ARCHITECTURE.md lines 214-261
+        Based on EDITORIAL_ARCHITECTURE.md lines 214-261. The instructions
+        live in SYSTEM_PROMPT; this is only the per-chunk part.
 
         Args:
             transcript: Formatted transcript with timestamps
@@ -259,84 +611,64 @@ class MomentDetector:
         Returns:
             Prompt string
         """
-        return f"""ROLE: Senior content analyst.
-
-TASK:
-Identify the {target_moments} most interesting and valuable moments in this transcript
-that are strong candidates for short-form clips.
-
-IMPORTANT:
-You are identifying *candidate regions*, not final clip boundaries.
-Rough timestamps are acceptable at this stage.
-
-LOOK FOR MOMENTS THAT CONTAIN:
-1. Strong hooks or pattern interrupts
-2. Key insights or "aha" realizations
-3. Clear opinions or contrarian takes
-4. Actionable advice or lessons
-5. Emotional or personal moments
-6. Clear problem → realization → outcome patterns
-7. Statements a viewer would want to quote or share
-8. Surprising facts or statistics
-9. Relatable struggles or experiences
-
-DO NOT:
-- Try to perfectly align sentence boundaries
-- Optimize for standalone completeness (that's Layer 3's job)
-- Over-expand clips for context
+        return f"""Identify the {target_moments} most interesting moments in this transcript.
 
 Transcript (with timestamps):
 {transcript}
 
-OUTPUT JSON ONLY:
-{{
-  "candidates": [
-    {{
-      "rough_start": 123.4,
-      "rough_end": 152.8,
-      "core_idea": "Why cloud tools are inefficient for developers in emerging markets",
-      "why_interesting": "Strong opinion rooted in personal frustration",
-      "interest_score": 0.85,
-      "content_type": "insight"
-    }}
-  ]
-}}
+Return exactly {target_moments} candidates."""
 
-RULES:
-- Return exactly {target_moments} candidates
-- Rank by interest_score (highest first)
-- Timestamps may be imprecise (we refine in Layer 2)
-- Focus on *idea density*, not polish
-- Content types: "hook", "insight", "advice", "story", "controversial", "emotional", "problem-solution"
-- Interest scores should range 0.5-1.0 (we're only looking at good content)"""
-
-    def _parse_moments(self, result: Dict) -> List[Dict]:
+    def _parse_moments(self, result: Dict) -> List[Moment]:
         """
-        Parse API response into moment dicts
+        Parse API response into Moments
 
         Args:
             result: Parsed JSON response from GPT
 
         Returns:
-            List of moment dicts
+            List of Moments sorted by interest_score (highest first)
         """
+        if _validate_compact_response is not None:
+            try:
+                _validate_compact_response(result)
+            except fastjsonschema.JsonSchemaException:
+                pass  # Something is malformed: check candidates one by one below
+            else:
+                moments = [
+                    Moment(
+                        float(c['s']), float(c['e']), c['i'], c['w'], float(c['x']),
+                        c.get('t', 'general')
+                    )
+                    for c in result['c']
+                ]
+                return sorted(moments, key=attrgetter('interest_score'), reverse=True)
+
+        candidates = result['c'] if 'c' in result else result.get('candidates', [])
+
         moments = []
-        for idx, candidate in enumerate(result.get('candidates', [])):
+        for idx, candidate in enumerate(candidates):
             try:
-                moment = {
-                    'rough_start': float(candidate['rough_start']),
-                    'rough_end': float(candidate['rough_end']),
-                    'core_idea': candidate['core_idea'],
-                    'why_interesting': candidate['why_interesting'],
-                    'interest_score': float(candidate['interest_score']),
-                    'content_type': candidate.get('content_type', 'general')
-                }
+                # Accept the compact keys the prompt asks for, or the long names
+                if 's' in candidate:
+                    candidate = {
+                        long_key: candidate[short_key]
+                        for long_key, short_key in self.COMPACT_KEYS.items()
+                        if short_key in candidate
+                    }
+                moment = Moment(
+                    float(candidate['rough_start']),
+                    float(candidate['rough_end']),
+                    candidate['core_idea'],
+                    candidate['why_interesting'],
+                    float(candidate['interest_score']),
+                    candidate.get('content_type', 'general')
+                )
                 moments.append(moment)
             except (KeyError, ValueError, TypeError) as e:
                 print(f"      ⚠️  Skipping invalid moment {idx}: {e}")
                 continue
 
-        return sorted(moments, key=lambda m: m['interest_score'], reverse=True)
+        return sorted(moments, key=attrgetter('interest_score'), reverse=True)
 
     def _estimate_tokens(self, text: str) -> int:
         """
@@ -348,153 +680,123 @@ RULES:
         Returns:
             Estimated token count
         """
-        try:
-            import tiktoken
-            encoding = tiktoken.encoding_for_model(self.model)
-            return len(encoding.encode(text))
-        except ImportError:
-            # Fallback: rough estimation (1 token ~= 4 characters)
-            return len(text) // 4
-        except Exception:
-            # Fallback for unknown models
-            return len(text) // 4
+        return estimate_tokens(text, self.model)
 
     def _chunk_segments(
         self,
-        segments: List[Dict],
-        max_tokens: int
-    ) -> List[List[Dict]]:
+        lines: List[str],
+        max_tokens: int,
+        tokens_per_char: Optional[float] = None
+    ) -> List[Tuple[int, int]]:
         """
         Split segments into chunks based on token count with overlap
 
-        Based on chunking logic from analyzer.py rate limit fix.
+        Based on chunking logic from analyzer.py rate limit fix. Segment
+        sizes are estimated from their length rather than tokenized; pass
+        tokens_per_char measured on the whole transcript for accuracy.
 
         Args:
-            segments: List of transcript segments
+            lines: Formatted segment lines (from format_segment_lines)
             max_tokens: Maximum tokens per chunk
+            tokens_per_char: Token/character ratio (default: TOKENS_PER_CHAR)
 
         Returns:
-            List of segment chunks
+            List of (lo, hi) segment index ranges, one per chunk
         """
-        chunks = []
-        current_chunk = []
-        current_tokens = 0
+        ratio = tokens_per_char or self.TOKENS_PER_CHAR
+        # +2 per segment keeps the estimate on the safe side of the exact count
+        token_counts = [int(len(line) * ratio) + 2 if line else 0 for line in lines]
 
-        for segment in segments:
-            # Format segment to estimate tokens
-            from .utils import format_timestamp
-            formatted = f"[{format_timestamp(segment['start'])}] {segment['text']}\n"
-            segment_tokens = self._estimate_tokens(formatted)
+        # prefix[i] = tokens in segments[:i], so any run's total is O(1)
+        prefix = [0, *accumulate(token_counts)]
 
+        chunks = []
+        chunk_start = 0
+
+        for i in range(len(lines)):
             # Check if adding this segment would exceed limit
-            if current_tokens + segment_tokens > max_tokens and current_chunk:
+            if prefix[i + 1] - prefix[chunk_start] > max_tokens and i > chunk_start:
                 # Save current chunk
-                chunks.append(current_chunk)
+                chunks.append((chunk_start, i))
 
-                # Calculate overlap: last 10% of segments
-                overlap_size = int(len(current_chunk) * self.DEFAULT_OVERLAP_RATIO)
-                overlap_segments = current_chunk[-overlap_size:] if overlap_size > 0 else []
-
-                # Start new chunk with overlap
-                current_chunk = overlap_segments.copy()
-                current_tokens = sum(
-                    self._estimate_tokens(
-                        f"[{format_timestamp(s['start'])}] {s['text']}\n"
-                    )
-                    for s in current_chunk
-                )
-
-            # Add segment to current chunk
-            current_chunk.append(segment)
-            current_tokens += segment_tokens
+                # Start new chunk with overlap: last 10% of segments
+                overlap_size = int((i - chunk_start) * self.DEFAULT_OVERLAP_RATIO)
+                chunk_start = i - overlap_size
 
         # Add final chunk
-        if current_chunk:
-            chunks.append(current_chunk)
+        if chunk_start < len(lines):
+            chunks.append((chunk_start, len(lines)))
 
         return chunks
 
     def _merge_chunk_results(
         self,
-        chunk_results: List[List[Dict]]
-    ) -> List[Dict]:
+        chunk_results: List[List[Moment]],
+        target_moments: Optional[int] = None
+    ) -> List[Moment]:
         """
         Merge moments from multiple chunks, removing duplicates
 
+        Moments are taken best-first; one is a duplicate if it overlaps an
+        already kept (higher-scoring) moment by more than DEDUP_THRESHOLD,
+        measured against the shorter of the two. Stops as soon as
+        target_moments are kept, so lower-scoring moments are never compared.
+
         Args:
             chunk_results: List of moment lists from each chunk
+            target_moments: Stop after keeping this many (default: keep all)
 
         Returns:
-            Merged and deduplicated list of moments
+            Merged and deduplicated moments, sorted by interest_score (highest first)
         """
-        all_moments = []
-        for chunk_idx, moments in enumerate(chunk_results):
-            for moment in moments:
-                moment['source_chunk'] = chunk_idx
-                all_moments.append(moment)
-
-        # Sort by start time
-        all_moments.sort(key=lambda m: m['rough_start'])
-
-        # Deduplicate based on temporal overlap
-        deduped = []
-        skip_indices = set()
-
-        for i, moment1 in enumerate(all_moments):
-            if i in skip_indices:
-                continue
-
-            # Check for overlaps with later moments
-            for j in range(i + 1, len(all_moments)):
-                if j in skip_indices:
+        candidates = sorted(
+            (moment for moments in chunk_results for moment in moments),
+            key=attrgetter('interest_score'),
+            reverse=True
+        )
+        limit = target_moments if target_moments is not None else len(candidates)
+        threshold = self.DEDUP_THRESHOLD
+
+        kept: List[Moment] = []
+        kept_spans = []  # (start, end) of each kept moment
+
+        for moment in candidates:
+            if len(kept) >= limit:
+                break
+
+            start, end = moment.rough_start, moment.rough_end
+            is_duplicate = False
+            for other_start, other_end in kept_spans:
+                min_duration = min(end - start, other_end - other_start)
+                if min_duration <= 0:
                     continue
-
-                moment2 = all_moments[j]
-
-                # If moment2 starts after moment1 ends, no more overlaps possible
-                if moment2['rough_start'] > moment1['rough_end']:
+                overlap = max(0.0, min(end, other_end) - max(start, other_start)) / min_duration
+                if overlap > threshold:
+                    is_duplicate = True
                     break
 
-                # Calculate overlap
-                overlap = self._calculate_overlap(moment1, moment2)
-
-                if overlap > self.DEDUP_THRESHOLD:
-                    # Keep the one with higher score
-                    if moment2['interest_score'] > moment1['interest_score']:
-                        skip_indices.add(i)
-                        break  # moment1 is duplicate, move to next
-                    else:
-                        skip_indices.add(j)  # moment2 is duplicate
-
-            if i not in skip_indices:
-                # Remove source_chunk metadata before returning
-                moment_copy = {k: v for k, v in moment1.items() if k != 'source_chunk'}
-                deduped.append(moment_copy)
+            if not is_duplicate:
+                kept.append(moment)
+                kept_spans.append((start, end))
 
-        return deduped
+        return kept
 
-    def _calculate_overlap(self, moment1: Dict, moment2: Dict) -> float:
+    def _calculate_overlap(self, moment1: Moment, moment2: Moment) -> float:
         """
         Calculate temporal overlap ratio between two moments
 
+        Same measure _merge_chunk_results computes inline.
+
         Args:
             moment1: First moment with rough_start and rough_end
             moment2: Second moment with rough_start and rough_end
 
         Returns:
-            Overlap ratio (0.0 to 1.0)
+            Overlap ratio (0.0 to 1.0), relative to the shorter moment
         """
-        start = max(moment1['rough_start'], moment2['rough_start'])
-        end = min(moment1['rough_end'], moment2['rough_end'])
-
-        if start >= end:
+        s1, e1 = moment1.rough_start, moment1.rough_end
+        s2, e2 = moment2.rough_start, moment2.rough_end
+        min_duration = min(e1 - s1, e2 - s2)
+        if min_duration <= 0:
             return 0.0
-
-        overlap_duration = end - start
-        moment1_duration = moment1['rough_end'] - moment1['rough_start']
-        moment2_duration = moment2['rough_end'] - moment2['rough_start']
-
-        # Use smaller moment duration as denominator
-        min_duration = min(moment1_duration, moment2_duration)
-
-        return overlap_duration / min_duration if min_duration > 0 else 0.0
+        return max(0.0, min(e1, e2) - max(s1, s2)) / min_duration
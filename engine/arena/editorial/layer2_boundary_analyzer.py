@@ -7,11 +7,22 @@ Looks backward for setup and forward for payoff/resolution.
 Uses parallel processing to analyze multiple moments simultaneously.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import asyncio
 import json
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from .utils import format_transcript_with_timestamps, format_timestamp
+from functools import lru_cache
+from .utils import (
+    COMPLETION_TOKEN_RESERVE,
+    RATE_LIMIT_MARKERS,
+    RATE_LIMIT_WAIT_RE,
+    RateLimiter,
+    TranscriptIndex,
+    create_openai_client,
+    estimate_tokens,
+    format_transcript_with_timestamps,
+    format_timestamp
+)
 
 
 class ThoughtBoundaryAnalyzer:
@@ -39,15 +50,92 @@ class ThoughtBoundaryAnalyzer:
         - Return confidence score for boundary quality
 
     Parallel Processing:
-        - Uses ThreadPoolExecutor for concurrent API calls
+        - Moments are analyzed in batches of BATCH_SIZE per API call, grouped
+          by time so neighbouring context windows are sent only once
+        - Batches run concurrently on an asyncio event loop, bounded by a semaphore
         - Default 5 workers for balance of speed and rate limits
-        - Processes multiple moments simultaneously
     """
 
     CONTEXT_WINDOW_SECONDS = 60.0  # Extract ±60s around moment for context
     DEFAULT_MAX_WORKERS = 5         # Parallel API calls
+    MAX_DURATION_SLACK = 1.5        # Keep moments up to 1.5x max_duration (Layer 3 may trim)
+    BATCH_SIZE = 6                  # Moments analyzed per batched API call
 
-    def __init__(self, api_key: str, model: str = "gpt-4o"):
+    # Everything that does not depend on the moment lives here, byte-identical
+    # across calls, so it forms a cacheable prompt prefix
+    SYSTEM_PROMPT = """You are a senior video editor analyzing complete thought boundaries in spoken content.
+
+You will be given one or more interesting moments identified in a video, each
+with its rough timestamps, followed by the transcript around them. Analyze every
+moment on its own; they are separate clips even when their context overlaps.
+
+TASK:
+Find the COMPLETE THOUGHT BOUNDARIES for each moment.
+
+YOUR FOCUS: Narrative structure ONLY
+- Where does the idea BEGIN (setup)?
+- Where does the idea END (payoff)?
+
+DO NOT WORRY ABOUT:
+- Whether pronouns are clear (Layer 3's job)
+- Whether viewers understand context (Layer 3's job)
+- Missing background information (Layer 3's job)
+
+ONLY FOCUS ON:
+- Narrative flow: Does it have beginning/middle/end?
+- Topical coherence: Does it stay on one idea?
+
+STRATEGY (for each moment):
+1. Look BACKWARD from its rough start:
+   - Where does the speaker BEGIN setting up this idea?
+   - Include setup or framing needed for the narrative
+   - Don't include unrelated prior content
+
+2. Look FORWARD from its rough end:
+   - Where does this idea reach COMPLETION or PAYOFF?
+   - Include resolution, conclusion, or impact
+   - Don't extend into next unrelated topic
+
+3. Ensure STRUCTURAL COMPLETENESS:
+   - Does the expanded clip have a clear beginning (setup)?
+   - Does it have a clear middle (core idea)?
+   - Does it have a clear end (payoff/resolution)?
+
+OUTPUT JSON ONLY:
+{
+  "thoughts": [
+    {
+      "id": "moment_001",
+      "expanded_start": 123.4,
+      "expanded_end": 198.6,
+      "thought_summary": "Complete one-sentence summary of the full thought from setup to payoff",
+      "confidence": 0.85
+    }
+  ]
+}
+
+HARD CONSTRAINTS:
+- Return exactly one entry per moment, using the moment's id
+- expanded_start should be ≤ the moment's rough_start (earlier or same)
+- expanded_end should be ≥ the moment's rough_end (later or same)
+- NEVER expand more than 30 seconds backward from rough_start
+- NEVER expand more than 30 seconds forward from rough_end
+- NEVER expand beyond topically-related content
+- If idea needs >60s total expansion, confidence should be <0.5
+- Typical expansion: 20-50% longer than rough timestamps
+- Confidence 0.0-1.0 (0.7+ means high confidence in boundaries)
+- Focus on COMPLETE THOUGHTS, not arbitrary time windows
+- Stop expanding when thought is complete, not when context is perfect"""
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o",
+        client=None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cached_transcript_block: Optional[str] = None,
+        transcript_index: Optional[TranscriptIndex] = None
+    ):
         """
         Initialize thought boundary analyzer
 
@@ -55,15 +143,31 @@ class ThoughtBoundaryAnalyzer:
             api_key: OpenAI API key
             model: Model to use (default: gpt-4o, can use gpt-4o-mini for cost savings)
                   Note: gpt-4o-mini may require validation to ensure quality maintained
+            client: Optional shared OpenAI client (created on first use if None)
+            rate_limiter: Optional RateLimiter shared with other layers
+            cached_transcript_block: Optional full transcript, sent unchanged
+                ahead of every prompt so OpenAI can serve it from its prompt cache
+            transcript_index: Optional TranscriptIndex over the segments that
+                will be passed in, for fast time-range lookups
         """
         self.api_key = api_key
         self.model = model
+        self.client = client
+        self.rate_limiter = rate_limiter
+        self.cached_transcript_block = cached_transcript_block
+        self.transcript_index = transcript_index
+        self._segment_index = None  # TranscriptIndex built here when none was shared
+        self._context_formatter = None  # (index, memoized window formatter)
+        self._prefix_tokens = estimate_tokens(self.SYSTEM_PROMPT, model) + (
+            estimate_tokens(cached_transcript_block, model) if cached_transcript_block else 0
+        )
         self.metrics = {
             'api_calls': 0,
             'tokens_used': 0,
             'cost_usd': 0.0,
             'thoughts_analyzed': 0,
-            'avg_expansion_ratio': 0.0  # How much boundaries expand on average
+            'avg_expansion_ratio': 0.0,  # How much boundaries expand on average
+            'deduped_calls_saved': 0     # Duplicate moments answered by another's analysis
         }
 
     def analyze_all(
@@ -71,7 +175,8 @@ class ThoughtBoundaryAnalyzer:
         moments: List[Dict],
         transcript_data: Dict,
         parallel: bool = True,
-        max_workers: Optional[int] = None
+        max_workers: Optional[int] = None,
+        max_duration: Optional[float] = None
     ) -> List[Dict]:
         """
         Analyze thought boundaries for all moments.
@@ -81,6 +186,8 @@ class ThoughtBoundaryAnalyzer:
             transcript_data: Full transcript data with segments
             parallel: Whether to process in parallel (default: True)
             max_workers: Number of parallel workers (default: 5)
+            max_duration: Optional maximum clip duration in seconds. Moments
+                that can't fit are skipped and expansion is capped to it.
 
         Returns:
             List of thought boundary dicts:
@@ -93,67 +200,248 @@ class ThoughtBoundaryAnalyzer:
                 'original_moment': Dict     # Preserve Layer 1 data
             }
         """
+        moments = self.filter_by_duration(moments, max_duration)
         if not moments:
             print("      ⚠️  No moments to analyze")
             return []
 
-        try:
-            from openai import OpenAI
-        except ImportError:
-            raise ImportError("openai package required. Install with: pip install openai")
-
-        client = OpenAI(api_key=self.api_key)
+        client = self._get_client()
         segments = transcript_data.get('segments', [])
 
         if not segments:
             print("      ⚠️  No segments in transcript")
             return []
 
+        # Index once up front rather than lazily from the worker threads
+        self._get_transcript_index(segments)
+
         thoughts = []
+        batches, duplicates = self.make_batches(moments)
 
-        if parallel and len(moments) > 1:
+        if parallel and len(batches) > 1:
             # Parallel processing
             workers = max_workers or self.DEFAULT_MAX_WORKERS
-            print(f"      Processing {len(moments)} moments with {workers} parallel workers...")
-
-            with ThreadPoolExecutor(max_workers=workers) as executor:
-                # Submit all tasks
-                future_to_moment = {
-                    executor.submit(
-                        self._analyze_single,
-                        client,
-                        moment,
-                        idx,
-                        segments
-                    ): (idx, moment)
-                    for idx, moment in enumerate(moments, 1)
-                }
-
-                # Collect results as they complete
-                for future in as_completed(future_to_moment):
-                    idx, moment = future_to_moment[future]
-                    try:
-                        thought = future.result()
-                        if thought:
-                            thoughts.append(thought)
-                            print(f"      ✓ Moment {idx}/{len(moments)} analyzed")
-                    except Exception as e:
-                        print(f"      ⚠️  Moment {idx} failed: {e}")
-                        continue
+            print(f"      Processing {len(moments)} moments in {len(batches)} batches with {workers} parallel workers...")
+
+            results = asyncio.run(self._analyze_batches_async(
+                client, batches, len(moments), segments, max_duration, workers
+            ))
+            for batch, batch_thoughts in zip(batches, results):
+                for _, thought in self.fan_out(batch, batch_thoughts, duplicates):
+                    if thought:
+                        thoughts.append(thought)
         else:
             # Sequential processing
             print(f"      Processing {len(moments)} moments sequentially...")
-            for idx, moment in enumerate(moments, 1):
+            for batch in batches:
                 try:
-                    thought = self._analyze_single(client, moment, idx, segments)
+                    batch_thoughts = self.analyze_batch(client, batch, segments, max_duration)
+                except Exception as e:
+                    print(f"      ⚠️  Batch of moments {', '.join(str(idx) for idx, _ in batch)} failed: {e}")
+                    continue
+                for idx, thought in self.fan_out(batch, batch_thoughts, duplicates):
                     if thought:
                         thoughts.append(thought)
                         print(f"      ✓ Moment {idx}/{len(moments)} analyzed")
+
+        self.update_metrics(thoughts)
+
+        return thoughts
+
+    def make_batches(
+        self,
+        moments: List[Dict]
+    ) -> Tuple[List[List[Tuple[int, Dict]]], Dict[int, List[Tuple[int, Dict]]]]:
+        """
+        Group moments into batches for analyze_batch()
+
+        Moments keep their 1-based position as moment_id; batches are
+        formed in time order so each batch's context windows overlap and
+        the shared transcript is sent once. Moments with the same rough
+        window (to 0.1s) and core idea are analyzed once: only the first is
+        batched, and fan_out() copies its thought to the others.
+
+        Args:
+            moments: Moments from Layer 1
+
+        Returns:
+            Tuple of (batches of (moment_id, moment) pairs, dict mapping a
+            batched moment_id to its duplicates' (moment_id, moment) pairs)
+        """
+        unique = {}
+        duplicates = {}
+        for moment_id, moment in enumerate(moments, 1):
+            key = (
+                round(moment['rough_start'], 1),
+                round(moment['rough_end'], 1),
+                moment['core_idea'].strip().lower()
+            )
+            if key in unique:
+                duplicates.setdefault(unique[key][0], []).append((moment_id, moment))
+            else:
+                unique[key] = (moment_id, moment)
+
+        saved = len(moments) - len(unique)
+        self.metrics['deduped_calls_saved'] = saved
+        if saved:
+            print(f"      ♻️  {saved} duplicate moments will reuse another moment's analysis")
+
+        ordered = sorted(unique.values(), key=lambda pair: pair[1]['rough_start'])
+        batches = [ordered[i:i + self.BATCH_SIZE] for i in range(0, len(ordered), self.BATCH_SIZE)]
+        return batches, duplicates
+
+    @staticmethod
+    def fan_out(
+        batch: List[Tuple[int, Dict]],
+        thoughts: List[Optional[Dict]],
+        duplicates: Dict[int, List[Tuple[int, Dict]]]
+    ) -> List[Tuple[int, Optional[Dict]]]:
+        """
+        Pair a batch's thoughts with moment ids, copying each to its duplicates
+
+        Args:
+            batch: (moment_id, moment) pairs passed to analyze_batch()
+            thoughts: analyze_batch() results for the batch
+            duplicates: Duplicate map from make_batches()
+
+        Returns:
+            (moment_id, thought or None) for the batch's moments and their duplicates
+        """
+        results = []
+        for (moment_id, _), thought in zip(batch, thoughts):
+            results.append((moment_id, thought))
+            for duplicate_id, duplicate in duplicates.get(moment_id, ()):
+                results.append((duplicate_id, thought and {
+                    **thought,
+                    'moment_id': f"moment_{duplicate_id:03d}",
+                    'original_moment': duplicate
+                }))
+        return results
+
+    def analyze_batch(
+        self,
+        client,
+        batch: List[Tuple[int, Dict]],
+        segments: List[Dict],
+        max_duration: Optional[float] = None
+    ) -> List[Optional[Dict]]:
+        """
+        Analyze several moments with one API call.
+
+        Moments missing from the batched response (or whose entry can't be
+        used) are analyzed on their own. Call update_metrics() with the
+        collected thoughts afterwards.
+
+        Args:
+            client: OpenAI client (thread-safe, may be shared)
+            batch: (moment_id, moment) pairs, e.g. from make_batches()
+            segments: Full transcript segments
+            max_duration: Optional maximum clip duration to cap expansion at
+
+        Returns:
+            Thought boundary dict (or None if failed) for each moment, in order
+        """
+        batch_thoughts = self._analyze_batch(client, batch, segments, max_duration)
+
+        thoughts = []
+        for moment_id, moment in batch:
+            thought = batch_thoughts.get(moment_id)
+            if thought is None:
+                try:
+                    thought = self._analyze_single(client, moment, moment_id, segments, max_duration)
                 except Exception as e:
-                    print(f"      ⚠️  Moment {idx} failed: {e}")
-                    continue
+                    print(f"      ⚠️  Moment {moment_id} failed: {e}")
+            thoughts.append(thought)
+
+        return thoughts
+
+    async def analyze_batch_async(
+        self,
+        client,
+        batch: List[Tuple[int, Dict]],
+        total: int,
+        segments: List[Dict],
+        max_duration: Optional[float] = None
+    ) -> List[Optional[Dict]]:
+        """
+        Run analyze_batch() in a worker thread so the event loop stays free
+
+        Args:
+            client: OpenAI client (thread-safe, may be shared)
+            batch: (moment_id, moment) pairs, e.g. from make_batches()
+            total: Total number of moments (for progress output)
+            segments: Full transcript segments
+            max_duration: Optional maximum clip duration to cap expansion at
 
-        # Calculate metrics
+        Returns:
+            Thought boundary dict (or None if failed) for each moment, in order
+        """
+        try:
+            thoughts = await asyncio.to_thread(
+                self.analyze_batch, client, batch, segments, max_duration
+            )
+        except Exception as e:
+            print(f"      ⚠️  Batch of moments {', '.join(str(idx) for idx, _ in batch)} failed: {e}")
+            return [None] * len(batch)
+
+        for (moment_id, _), thought in zip(batch, thoughts):
+            if thought:
+                print(f"      ✓ Moment {moment_id}/{total} analyzed")
+        return thoughts
+
+    async def _analyze_batches_async(
+        self,
+        client,
+        batches: List[List[Tuple[int, Dict]]],
+        total: int,
+        segments: List[Dict],
+        max_duration: Optional[float],
+        max_workers: int
+    ) -> List[List[Optional[Dict]]]:
+        """Run analyze_batch_async() on every batch, at most max_workers at a time"""
+        sem = asyncio.Semaphore(max_workers)
+
+        async def run(batch: List[Tuple[int, Dict]]) -> List[Optional[Dict]]:
+            async with sem:
+                return await self.analyze_batch_async(client, batch, total, segments, max_duration)
+
+        return await asyncio.gather(*(run(batch) for batch in batches))
+
+    def filter_by_duration(
+        self,
+        moments: List[Dict],
+        max_duration: Optional[float]
+    ) -> List[Dict]:
+        """
+        Drop moments whose rough span is already too long to become a clip
+
+        Layer 2 only expands boundaries, so such moments would just be
+        rejected by Layer 3 after paying for their analysis. Allows
+        MAX_DURATION_SLACK headroom since Layer 3 can still trim.
+
+        Args:
+            moments: Moments from Layer 1
+            max_duration: Maximum clip duration in seconds (None keeps all)
+
+        Returns:
+            Moments that can still fit
+        """
+        if not max_duration:
+            return moments
+
+        limit = max_duration * self.MAX_DURATION_SLACK
+        kept = [m for m in moments if m['rough_end'] - m['rough_start'] <= limit]
+        if len(kept) < len(moments):
+            print(f"      ✂️  Skipped {len(moments) - len(kept)} moments longer than {limit:.0f}s")
+        return kept
+
+    def update_metrics(self, thoughts: List[Dict]):
+        """
+        Recalculate thought metrics from the analyzed thoughts
+
+        Args:
+            thoughts: All thoughts produced in this run
+        """
         self.metrics['thoughts_analyzed'] = len(thoughts)
         if thoughts:
             expansion_ratios = [
@@ -163,14 +451,13 @@ class ThoughtBoundaryAnalyzer:
             ]
             self.metrics['avg_expansion_ratio'] = sum(expansion_ratios) / len(expansion_ratios)
 
-        return thoughts
-
     def _analyze_single(
         self,
         client,
         moment: Dict,
         moment_id: int,
-        segments: List[Dict]
+        segments: List[Dict],
+        max_duration: Optional[float] = None
     ) -> Optional[Dict]:
         """
         Analyze thought boundaries for a single moment
@@ -180,6 +467,7 @@ class ThoughtBoundaryAnalyzer:
             moment: Moment dict from Layer 1
             moment_id: Numeric ID for this moment
             segments: Full transcript segments
+            max_duration: Optional maximum clip duration to cap expansion at
 
         Returns:
             Thought boundary dict or None if failed
@@ -187,25 +475,17 @@ class ThoughtBoundaryAnalyzer:
         # Extract context window around moment
         rough_start = moment['rough_start']
         rough_end = moment['rough_end']
-        rough_center = (rough_start + rough_end) / 2
-
-        context_start = max(0, rough_center - self.CONTEXT_WINDOW_SECONDS)
-        context_end = rough_center + self.CONTEXT_WINDOW_SECONDS
+        window = self._context_window(moment)
 
-        context_segments = [
-            seg for seg in segments
-            if seg['start'] >= context_start and seg['end'] <= context_end
-        ]
-
-        if not context_segments:
+        if not self._context_segments(segments, *window):
             print(f"      ⚠️  No context segments found for moment {moment_id}")
             return None
 
         # Format context with timestamps
-        context_transcript = format_transcript_with_timestamps(context_segments)
+        context_transcript = self._format_context(segments, *window)
 
         # Create prompt
-        prompt = self._create_prompt(moment, context_transcript, rough_start, rough_end)
+        prompt = self._create_prompt(moment, context_transcript, rough_start, rough_end, moment_id)
 
         # Retry configuration for rate limits
         max_retries = 5
@@ -213,19 +493,11 @@ class ThoughtBoundaryAnalyzer:
 
         for attempt in range(max_retries):
             try:
+                self._throttle(prompt)
                 # Call GPT-4o
                 response = client.chat.completions.create(
                     model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a senior video editor analyzing complete thought boundaries in spoken content."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
+                    messages=self._build_messages(prompt),
                     temperature=0.5,  # Lower temp for more consistent boundary detection
                     response_format={"type": "json_object"}
                 )
@@ -239,22 +511,15 @@ class ThoughtBoundaryAnalyzer:
                 output_cost = (response.usage.completion_tokens / 1_000_000) * 10.00
                 self.metrics['cost_usd'] += input_cost + output_cost
 
-                # Parse response
+                # Parse response (same shape as a batch of one; accept a bare object too)
                 result = json.loads(response.choices[0].message.content)
+                if 'thoughts' in result:
+                    result = result['thoughts'][0]
 
                 # Validate and create thought dict
-                thought = {
-                    'moment_id': f"moment_{moment_id:03d}",
-                    'expanded_start': float(result['expanded_start']),
-                    'expanded_end': float(result['expanded_end']),
-                    'thought_summary': result['thought_summary'],
-                    'confidence': float(result['confidence']),
-                    'original_moment': moment
-                }
-
-                return thought
-
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
+                return self._make_thought(result, moment, moment_id, max_duration)
+
+            except (json.JSONDecodeError, KeyError, IndexError, TypeError, ValueError) as e:
                 print(f"      ⚠️  Failed to parse response for moment {moment_id}: {e}")
                 return None
 
@@ -262,13 +527,12 @@ class ThoughtBoundaryAnalyzer:
                 error_str = str(e)
 
                 # Check if this is a rate limit error
-                if "rate_limit_exceeded" in error_str or "429" in error_str:
+                if any(marker in error_str for marker in RATE_LIMIT_MARKERS):
                     # Calculate wait time
                     wait_time = base_delay * (2 ** attempt)
 
                     # Try to parse suggested wait time from error
-                    import re
-                    match = re.search(r'try again in (\d+\.?\d*)s', error_str)
+                    match = RATE_LIMIT_WAIT_RE.search(error_str)
                     if match:
                         wait_time = float(match.group(1)) + 1.0
 
@@ -287,94 +551,338 @@ class ThoughtBoundaryAnalyzer:
 
         return None
 
+    def _analyze_batch(
+        self,
+        client,
+        batch: List[Tuple[int, Dict]],
+        segments: List[Dict],
+        max_duration: Optional[float] = None
+    ) -> Dict[int, Dict]:
+        """
+        Analyze thought boundaries for several moments in one API call
+
+        Overlapping context windows are merged, so transcript shared by
+        neighbouring moments appears in the prompt only once.
+
+        Args:
+            client: OpenAI client
+            batch: (moment_id, moment) pairs
+            segments: Full transcript segments
+            max_duration: Optional maximum clip duration to cap expansion at
+
+        Returns:
+            Dict mapping moment_id to its thought dict. Moments without
+            context, or missing from the response, are left out.
+        """
+        items = []
+        for moment_id, moment in batch:
+            window = self._context_window(moment)
+            if self._context_segments(segments, *window):
+                items.append((moment_id, moment, window))
+
+        # A batch of one gains nothing over the single-moment prompt
+        if len(items) < 2:
+            return {}
+
+        excerpts = []
+        for context_start, context_end in self._merge_windows([window for _, _, window in items]):
+            excerpts.append(self._format_context(segments, context_start, context_end))
+
+        prompt = self._create_batch_prompt(items, excerpts)
+
+        # Retry configuration for rate limits
+        max_retries = 5
+        base_delay = 2.0
+
+        for attempt in range(max_retries):
+            try:
+                self._throttle(prompt)
+                response = client.chat.completions.create(
+                    model=self.model,
+                    messages=self._build_messages(prompt),
+                    temperature=0.5,  # Lower temp for more consistent boundary detection
+                    response_format={"type": "json_object"}
+                )
+
+                # Track metrics
+                self.metrics['api_calls'] += 1
+                self.metrics['tokens_used'] += response.usage.total_tokens
+
+                # Calculate cost (GPT-4o pricing)
+                input_cost = (response.usage.prompt_tokens / 1_000_000) * 2.50
+                output_cost = (response.usage.completion_tokens / 1_000_000) * 10.00
+                self.metrics['cost_usd'] += input_cost + output_cost
+
+                # Parse response, matching entries back to moments by id
+                entries = json.loads(response.choices[0].message.content)['thoughts']
+                by_id = {entry.get('id'): entry for entry in entries if isinstance(entry, dict)}
+
+                results = {}
+                for moment_id, moment, _ in items:
+                    entry = by_id.get(f"moment_{moment_id:03d}")
+                    if entry is None:
+                        continue
+                    try:
+                        results[moment_id] = self._make_thought(entry, moment, moment_id, max_duration)
+                    except (KeyError, TypeError, ValueError):
+                        continue  # Analyzed on its own instead
+
+                return results
+
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                print(f"      ⚠️  Failed to parse batch boundary response: {e}")
+                return {}
+
+            except Exception as e:
+                error_str = str(e)
+
+                # Check if this is a rate limit error
+                if any(marker in error_str for marker in RATE_LIMIT_MARKERS):
+                    # Calculate wait time
+                    wait_time = base_delay * (2 ** attempt)
+
+                    # Try to parse suggested wait time from error
+                    match = RATE_LIMIT_WAIT_RE.search(error_str)
+                    if match:
+                        wait_time = float(match.group(1)) + 1.0
+
+                    if attempt < max_retries - 1:
+                        print(f"      ⚠️  API error during batch boundary analysis: {e}")
+                        print(f"      ⏳ Retrying in {wait_time:.1f}s (attempt {attempt + 2}/{max_retries})...")
+                        time.sleep(wait_time)
+                        continue
+                    else:
+                        print(f"      ❌ Batch boundary analysis failed after {max_retries} retries")
+                        return {}
+                else:
+                    # Non-rate-limit error (e.g. context length): moments go one by one
+                    print(f"      ⚠️  API error during batch boundary analysis: {e}")
+                    return {}
+
+        return {}
+
+    def _make_thought(
+        self,
+        result: Dict,
+        moment: Dict,
+        moment_id: int,
+        max_duration: Optional[float]
+    ) -> Dict:
+        """
+        Build a thought dict from one moment's parsed boundary fields
+
+        Args:
+            result: Parsed JSON object for the moment
+            moment: Moment from Layer 1
+            moment_id: Numeric ID for this moment
+            max_duration: Optional maximum clip duration to cap expansion at
+
+        Returns:
+            Thought boundary dict (see analyze_all)
+        """
+        expanded_start, expanded_end = self._cap_expansion(
+            float(result['expanded_start']), float(result['expanded_end']),
+            moment['rough_start'], moment['rough_end'], max_duration
+        )
+        return {
+            'moment_id': f"moment_{moment_id:03d}",
+            'expanded_start': expanded_start,
+            'expanded_end': expanded_end,
+            'thought_summary': result['thought_summary'],
+            'confidence': float(result['confidence']),
+            'original_moment': moment
+        }
+
+    def _context_window(self, moment: Dict) -> Tuple[float, float]:
+        """(start, end) of the ±CONTEXT_WINDOW_SECONDS window around a moment"""
+        rough_center = (moment['rough_start'] + moment['rough_end']) / 2
+        return (
+            max(0, rough_center - self.CONTEXT_WINDOW_SECONDS),
+            rough_center + self.CONTEXT_WINDOW_SECONDS
+        )
+
+    def _context_segments(
+        self,
+        segments: List[Dict],
+        context_start: float,
+        context_end: float
+    ) -> List[Dict]:
+        """Segments lying entirely inside [context_start, context_end]"""
+        return self._get_transcript_index(segments).within(context_start, context_end)
+
+    def _format_context(
+        self,
+        segments: List[Dict],
+        context_start: float,
+        context_end: float
+    ) -> str:
+        """
+        Formatted transcript of a context window, memoized per transcript
+
+        Neighbouring and duplicate moments often ask for the same window
+        (a batch and its per-moment fallbacks, or repeat runs), so the
+        formatted text is kept for each (context_start, context_end).
+        """
+        index = self._get_transcript_index(segments)
+        formatter = self._context_formatter
+        if formatter is None or formatter[0] is not index:
+            @lru_cache(maxsize=512)
+            def format_window(start: float, end: float) -> str:
+                return format_transcript_with_timestamps(index.within(start, end))
+
+            formatter = self._context_formatter = (index, format_window)
+
+        return formatter[1](context_start, context_end)
+
+    def _get_transcript_index(self, segments: List[Dict]) -> TranscriptIndex:
+        """The shared TranscriptIndex if it covers the segments, else one built here"""
+        for index in (self.transcript_index, self._segment_index):
+            if (index is not None and index.segments is segments
+                    and len(index.texts) == len(segments)):
+                return index
+
+        self._segment_index = TranscriptIndex(segments)
+        return self._segment_index
+
+    @staticmethod
+    def _merge_windows(windows: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+        """Merge overlapping (start, end) windows, in time order"""
+        merged = []
+        for start, end in sorted(windows):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    @staticmethod
+    def _cap_expansion(
+        expanded_start: float,
+        expanded_end: float,
+        rough_start: float,
+        rough_end: float,
+        max_duration: Optional[float]
+    ) -> Tuple[float, float]:
+        """
+        Shrink an expansion that overshoots max_duration
+
+        The setup/payoff added on each side is scaled down by the same
+        factor; the rough span itself is never cut (that's Layer 3's call).
+
+        Returns:
+            Tuple of (expanded_start, expanded_end)
+        """
+        if not max_duration or expanded_end - expanded_start <= max_duration:
+            return expanded_start, expanded_end
+
+        added_before = max(0.0, rough_start - expanded_start)
+        added_after = max(0.0, expanded_end - rough_end)
+        budget = max(0.0, max_duration - (rough_end - rough_start))
+        if added_before + added_after <= budget:
+            return expanded_start, expanded_end
+
+        scale = budget / (added_before + added_after)
+        return (
+            min(expanded_start, rough_start) + added_before * (1 - scale),
+            max(expanded_end, rough_end) - added_after * (1 - scale)
+        )
+
     def _create_prompt(
         self,
         moment: Dict,
         context_transcript: str,
         rough_start: float,
-        rough_end: float
+        rough_end: float,
+        moment_id: int = 1
     ) -> str:
         """
         Create Layer 2 prompt for boundary analysis
 
-        Based on EDITORIAL_ARCHITECTURE.md lines 468-505
+        Based on EDITORIAL_ARCHITECTURE.md lines 468-505. Instructions and
+        output format live in SYSTEM_PROMPT; this is only the per-moment input.
 
         Args:
             moment: Moment from Layer 1
             context_transcript: Formatted transcript with ±60s context
             rough_start: Rough start time
             rough_end: Rough end time
+            moment_id: Numeric ID the response entry should carry
 
         Returns:
             Prompt string
         """
-        rough_start_ts = format_timestamp(rough_start)
-        rough_end_ts = format_timestamp(rough_end)
-
-        return f"""ROLE: Senior video editor analyzing thought boundaries.
+        return f"""INPUT:
 
-CONTEXT:
-You identified an interesting moment in a video:
-- Core Idea: {moment['core_idea']}
-- Why Interesting: {moment['why_interesting']}
-- Rough Timestamps: [{rough_start_ts}] to [{rough_end_ts}]
-- Content Type: {moment['content_type']}
+{self._format_moment(moment_id, moment, rough_start, rough_end)}
 
-TASK:
-Find the COMPLETE THOUGHT BOUNDARIES for this moment.
+CONTEXT TRANSCRIPT (±60 seconds around the moment):
+{context_transcript}"""
 
-YOUR FOCUS: Narrative structure ONLY
-- Where does the idea BEGIN (setup)?
-- Where does the idea END (payoff)?
+    def _create_batch_prompt(
+        self,
+        items: List[Tuple[int, Dict, Tuple[float, float]]],
+        excerpts: List[str]
+    ) -> str:
+        """
+        Create a Layer 2 boundary prompt covering several moments
 
-DO NOT WORRY ABOUT:
-- Whether pronouns are clear (Layer 3's job)
-- Whether viewers understand context (Layer 3's job)
-- Missing background information (Layer 3's job)
+        Args:
+            items: (moment_id, moment, context window) for each moment
+            excerpts: Formatted transcript of each merged context window
 
-ONLY FOCUS ON:
-- Narrative flow: Does it have beginning/middle/end?
-- Topical coherence: Does it stay on one idea?
+        Returns:
+            Prompt string
+        """
+        moments_block = "\n\n".join(
+            self._format_moment(moment_id, moment, moment['rough_start'], moment['rough_end'])
+            for moment_id, moment, _ in items
+        )
+        transcript_block = "\n\n---\n\n".join(excerpts)
 
-STRATEGY:
-1. Look BACKWARD from [{rough_start_ts}]:
-   - Where does the speaker BEGIN setting up this idea?
-   - Include setup or framing needed for the narrative
-   - Don't include unrelated prior content
+        return f"""INPUT ({len(items)} moments):
 
-2. Look FORWARD from [{rough_end_ts}]:
-   - Where does this idea reach COMPLETION or PAYOFF?
-   - Include resolution, conclusion, or impact
-   - Don't extend into next unrelated topic
+{moments_block}
 
-3. Ensure STRUCTURAL COMPLETENESS:
-   - Does the expanded clip have a clear beginning (setup)?
-   - Does it have a clear middle (core idea)?
-   - Does it have a clear end (payoff/resolution)?
+CONTEXT TRANSCRIPT (±60 seconds around each moment; "---" separates excerpts):
+{transcript_block}"""
 
-CONTEXT TRANSCRIPT (±60 seconds around moment):
-{context_transcript}
+    @staticmethod
+    def _format_moment(moment_id: int, moment: Dict, rough_start: float, rough_end: float) -> str:
+        """Render one moment's fields for the INPUT section of a prompt"""
+        return f"""MOMENT id="moment_{moment_id:03d}"
+- Core Idea: {moment['core_idea']}
+- Why Interesting: {moment['why_interesting']}
+- Rough Timestamps: [{format_timestamp(rough_start)}] to [{format_timestamp(rough_end)}] (rough_start={rough_start}, rough_end={rough_end})
+- Content Type: {moment['content_type']}"""
 
-OUTPUT JSON ONLY:
-{{
-  "expanded_start": 123.4,
-  "expanded_end": 198.6,
-  "thought_summary": "Complete one-sentence summary of the full thought from setup to payoff",
-  "confidence": 0.85,
-  "reasoning": "Why these boundaries feel complete (optional debug field)"
-}}
+    def _build_messages(self, prompt: str) -> List[Dict]:
+        """
+        Chat messages for a prompt, with the constant parts first
 
-HARD CONSTRAINTS:
-- expanded_start should be ≤ {rough_start} (earlier or same)
-- expanded_end should be ≥ {rough_end} (later or same)
-- NEVER expand more than 30 seconds backward from rough_start
-- NEVER expand more than 30 seconds forward from rough_end
-- NEVER expand beyond topically-related content
-- If idea needs >60s total expansion, confidence should be <0.5
-- Typical expansion: 20-50% longer than rough timestamps
-- Confidence 0.0-1.0 (0.7+ means high confidence in boundaries)
-- Focus on COMPLETE THOUGHTS, not arbitrary time windows
-- Stop expanding when thought is complete, not when context is perfect"""
+        The system prompt (all instructions and the output format) and
+        (if set) the shared transcript block are
+        byte-identical on every call, so they form a cacheable prefix; only
+        the per-call prompt varies.
+        """
+        messages = [{"role": "system", "content": self.SYSTEM_PROMPT}]
+        if self.cached_transcript_block:
+            messages.append({"role": "user", "content": self.cached_transcript_block})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _throttle(self, prompt: str):
+        """Wait for the shared rate limiter (if any) before sending a prompt"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(
+                estimate_tokens(prompt, self.model) + self._prefix_tokens
+                + COMPLETION_TOKEN_RESERVE
+            )
+
+    def _get_client(self):
+        """Return the shared OpenAI client, creating it on first use"""
+        if self.client is None:
+            self.client = create_openai_client(self.api_key)
+        return self.client
 
     def get_metrics_summary(self) -> str:
         """
@@ -388,4 +896,5 @@ HARD CONSTRAINTS:
   Tokens Used: {self.metrics['tokens_used']:,}
   Cost: ${self.metrics['cost_usd']:.3f}
   Thoughts Analyzed: {self.metrics['thoughts_analyzed']}
-  Avg Expansion Ratio: {self.metrics['avg_expansion_ratio']:.2f}x"""
+  Avg Expansion Ratio: {self.metrics['avg_expansion_ratio']:.2f}x
+  Duplicate Calls Saved: {self.metrics['deduped_calls_saved']}"""
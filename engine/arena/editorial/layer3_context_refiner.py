@@ -10,9 +10,115 @@ Implements iterative refinement to adjust boundaries if needed.
 """
 
 from typing import List, Dict, Optional, Tuple
+import asyncio
 import json
 from enum import Enum
-from .utils import extract_clip_text, format_timestamp
+from .utils import (
+    COMPLETION_TOKEN_RESERVE,
+    RATE_LIMIT_MARKERS,
+    RATE_LIMIT_WAIT_RE,
+    RateLimiter,
+    TranscriptIndex,
+    create_openai_client,
+    estimate_tokens,
+    extract_clip_text,
+    format_timestamp
+)
+
+
+# Evaluation criteria shared by the single-clip and batched prompts
+_EVALUATION_GUIDE = """EVALUATION CRITERIA:
+
+1. **Who/What Context:**
+   - Is it clear WHO is speaking or who/what this is about?
+   - If pronouns are used ("he", "she", "they", "it"), is the referent clear?
+   - Score 0.0 if critical context is missing
+
+2. **Topic/Situation:**
+   - Is the topic or situation explained within the clip?
+   - Can a viewer understand what's being discussed?
+   - Score 0.0 if viewer would be confused about the topic
+
+3. **Stakes/Relevance:**
+   - Is it clear WHY this matters or why the viewer should care?
+   - Are the stakes or implications explained?
+   - Lower score if motivation is unclear
+
+4. **Unresolved References:**
+   - Are there references to "this", "that", "the problem", "the solution" without explanation?
+   - Are there assumed facts not stated in the clip?
+   - Significantly reduce score for vague references
+
+5. **Beginning/Middle/End:**
+   - Does the clip have a clear beginning (setup)?
+   - Does it have substance (middle)?
+   - Does it have resolution or payoff (end)?
+   - Reduce score if clip feels incomplete
+
+SCORING GUIDE WITH CONCRETE EXAMPLES:
+
+0.9-1.0: PERFECT STANDALONE
+Example: "Today I'm going to show you how to fix rate limit errors in Python.
+         The problem is when you make too many API calls, you get a 429 error.
+         Here's the solution: implement exponential backoff..."
+Why 0.9+: Topic stated, problem defined, solution clear. No prior knowledge needed.
+
+0.7-0.9: GOOD STANDALONE (Minor gaps acceptable)
+Example: "So after we implemented this caching system, our performance improved by 50%.
+         The key was using Redis instead of in-memory caching..."
+Why 0.7-0.9: Clear outcome and solution. Minor: doesn't explain why caching was needed,
+            but viewer can infer performance was a problem.
+
+0.5-0.7: MARGINAL (Some prior knowledge helpful)
+Example: "This approach solved our problem completely. We went from 30-second load times
+         to under 2 seconds by implementing this pattern..."
+Why 0.5-0.7: Clear improvement, but "this approach" and "this pattern" are vague.
+            Viewer gets value but would benefit from knowing what the approach was.
+
+0.3-0.5: POOR (Requires significant context)
+Example: "And that's why it didn't work. So we had to completely rethink our architecture
+         and move to a different pattern..."
+Why 0.3-0.5: "It", "that", "our architecture" - all undefined. Viewer lost without backstory.
+
+0.0-0.3: UNUSABLE (Completely dependent on prior context)
+Example: "After that failed, we tried the second approach, which also didn't work.
+         So then we moved to option three..."
+Why 0.0-0.3: No idea what "that", "second approach", or "option three" are.
+            Meaningless without full video context.
+
+SCORING INSTRUCTIONS:
+1. Compare clip to these examples
+2. Which example does it most resemble?
+3. Assign score in that range
+4. Be strict: When in doubt, score lower
+
+BOUNDARY REFINEMENT RULES:
+- You may suggest MINOR adjustments only
+- MAX ADJUSTMENT: ±2 sentences (±15 seconds)
+- Only adjust if standalone_score < 0.7
+- Focus on fixing missing context, NOT restructuring the clip
+- If major changes needed (>15s adjustment), REJECT instead
+
+Example acceptable adjustments:
+- Add 1 sentence at start to clarify "the problem" being discussed
+- Add 1 sentence at end to complete resolution
+
+Example unacceptable adjustments:
+- Expanding 20+ seconds backward for full backstory
+- Reworking the entire clip structure"""
+
+_FIELD_RULES = """FIELD DEFINITIONS:
+- changes_made: boolean - Did you adjust the boundaries at all?
+- adjustment_type: null | "expanded_start" | "expanded_end" | "both" - What changed?
+- rejection_reason: null | "missing_premise" | "dangling_reference" | "incomplete_resolution" | "topic_drift" | "duration_constraint" | "structural_issue" - Why rejected (if score < 0.4)
+
+RULES:
+- Be honest and strict - we want GREAT standalone clips, not mediocre ones
+- Default refined times to current times unless you have specific boundary suggestions
+- If no changes made, set changes_made=false and adjustment_type=null
+- Editor notes should be actionable and specific
+- Score based on what's IN the clip, not what COULD be added
+- REJECT clips needing >15s adjustment rather than expanding them"""
 
 
 class RejectionReason(Enum):
@@ -58,17 +164,40 @@ class StandaloneContextRefiner:
     PASS_THRESHOLD = 0.7      # Must score ≥0.7 to pass
     REVISE_THRESHOLD = 0.4    # Below 0.4 = auto-reject
     MAX_ITERATIONS = 2        # Try refinement up to 2 times
+    BATCH_SIZE = 6            # Thoughts validated per batched API call
+    SYSTEM_PROMPT = "You are a senior video editor evaluating whether clips can stand alone without prior context."
 
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        client=None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cached_transcript_block: Optional[str] = None,
+        transcript_index: Optional[TranscriptIndex] = None
+    ):
         """
         Initialize standalone context refiner
 
         Args:
             api_key: OpenAI API key
             model: Model to use (default: gpt-4o-mini for cost efficiency)
+            client: Optional shared OpenAI client (created on first use if None)
+            rate_limiter: Optional RateLimiter shared with other layers
+            cached_transcript_block: Optional full transcript, sent unchanged
+                ahead of every prompt so OpenAI can serve it from its prompt cache
+            transcript_index: Optional TranscriptIndex over the segments that
+                will be passed in, for fast time-range lookups
         """
         self.api_key = api_key
         self.model = model
+        self.client = client
+        self.rate_limiter = rate_limiter
+        self.cached_transcript_block = cached_transcript_block
+        self.transcript_index = transcript_index
+        self._prefix_tokens = (
+            estimate_tokens(cached_transcript_block, model) if cached_transcript_block else 0
+        )
         self.metrics = {
             'api_calls': 0,
             'tokens_used': 0,
@@ -113,12 +242,7 @@ class StandaloneContextRefiner:
             print("      ⚠️  No thoughts to refine")
             return []
 
-        try:
-            from openai import OpenAI
-        except ImportError:
-            raise ImportError("openai package required. Install with: pip install openai")
-
-        client = OpenAI(api_key=self.api_key)
+        client = self._get_client()
         segments = transcript_data.get('segments', [])
 
         if not segments:
@@ -141,33 +265,103 @@ class StandaloneContextRefiner:
 
                 if clip:
                     validated_clips.append(clip)
+                    self._record_verdict(clip, f"Thought {idx}/{len(thoughts)}")
+
+            except Exception as e:
+                print(f"      ⚠️  Thought {idx} validation failed: {e}")
+                continue
 
-                    # Track metrics
-                    if clip['verdict'] == 'PASS':
-                        self.metrics['passed'] += 1
+        self.update_pass_rate()
+
+        return validated_clips
 
-                        # Track if Layer 3 made changes to Layer 2 boundaries
-                        if not clip.get('changes_made', True):  # Default True for backward compat
-                            self.metrics['no_changes_needed'] += 1
+    def refine_batch(
+        self,
+        client,
+        thoughts: List[Dict],
+        segments: List[Dict],
+        min_duration: Optional[int] = None,
+        max_duration: Optional[int] = None
+    ) -> List[Optional[Dict]]:
+        """
+        Validate a batch of thoughts with one API call.
 
-                    elif clip['verdict'] == 'REVISE':
-                        self.metrics['revised'] += 1
-                    elif clip['verdict'] == 'REJECT':
-                        self.metrics['rejected'] += 1
+        The first validation pass for every thought shares a single prompt;
+        thoughts that come back REVISE continue their refinement one by one,
+        and any thought missing from the batched response is validated on
+        its own. Call update_pass_rate() once every batch is done.
 
-                    verdict_icon = {
-                        'PASS': '✓',
-                        'REVISE': '↻',
-                        'REJECT': '✗'
-                    }.get(clip['verdict'], '?')
+        Args:
+            client: OpenAI client (thread-safe, may be shared)
+            thoughts: Thoughts from Layer 2 (at most BATCH_SIZE is typical)
+            segments: Transcript segments
+            min_duration: Optional minimum clip duration in seconds
+            max_duration: Optional maximum clip duration in seconds
 
-                    print(f"      {verdict_icon} Thought {idx}/{len(thoughts)}: {clip['verdict']} "
-                          f"(score: {clip['standalone_score']:.2f})")
+        Returns:
+            Validated clip dict (or None if failed) for each thought, in order
+        """
+        first_results = self._validate_batch(client, thoughts, segments)
 
+        clips = []
+        for thought in thoughts:
+            try:
+                clip = self._validate_and_refine(
+                    client,
+                    thought,
+                    segments,
+                    min_duration,
+                    max_duration,
+                    first_result=first_results.get(thought['moment_id'])
+                )
             except Exception as e:
-                print(f"      ⚠️  Thought {idx} validation failed: {e}")
-                continue
+                print(f"      ⚠️  Thought {thought['moment_id']} validation failed: {e}")
+                clip = None
+
+            if clip:
+                self._record_verdict(clip, f"Thought {thought['moment_id']}")
+            clips.append(clip)
 
+        return clips
+
+    async def refine_batch_async(
+        self,
+        client,
+        thoughts: List[Dict],
+        segments: List[Dict],
+        min_duration: Optional[int] = None,
+        max_duration: Optional[int] = None
+    ) -> List[Optional[Dict]]:
+        """Run refine_batch() in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(
+            self.refine_batch, client, thoughts, segments, min_duration, max_duration
+        )
+
+    def _record_verdict(self, clip: Dict, label: str):
+        """Count a validated clip's verdict and print its progress line"""
+        if clip['verdict'] == 'PASS':
+            self.metrics['passed'] += 1
+
+            # Track if Layer 3 made changes to Layer 2 boundaries
+            if not clip.get('changes_made', True):  # Default True for backward compat
+                self.metrics['no_changes_needed'] += 1
+
+        elif clip['verdict'] == 'REVISE':
+            self.metrics['revised'] += 1
+        elif clip['verdict'] == 'REJECT':
+            self.metrics['rejected'] += 1
+
+        verdict_icon = {
+            'PASS': '✓',
+            'REVISE': '↻',
+            'REJECT': '✗'
+        }.get(clip['verdict'], '?')
+
+        print(f"      {verdict_icon} {label}: {clip['verdict']} "
+              f"(score: {clip['standalone_score']:.2f})")
+
+    def update_pass_rate(self):
+        """Recalculate pass rate and boundary quality from the verdict counts"""
         # Calculate pass rate
         total = self.metrics['passed'] + self.metrics['revised'] + self.metrics['rejected']
         if total > 0:
@@ -178,15 +372,14 @@ class StandaloneContextRefiner:
             if eligible > 0:
                 self.metrics['boundary_quality_rate'] = self.metrics['no_changes_needed'] / eligible
 
-        return validated_clips
-
     def _validate_and_refine(
         self,
         client,
         thought: Dict,
         segments: List[Dict],
         min_duration: Optional[int],
-        max_duration: Optional[int]
+        max_duration: Optional[int],
+        first_result: Optional[Tuple[float, float, float, str, Optional[str]]] = None
     ) -> Optional[Dict]:
         """
         Validate and iteratively refine a single thought
@@ -197,6 +390,8 @@ class StandaloneContextRefiner:
             segments: Transcript segments
             min_duration: Optional min duration
             max_duration: Optional max duration
+            first_result: Result of the first validation pass, if it was
+                already obtained (see refine_batch)
 
         Returns:
             Validated clip dict or None if failed
@@ -210,19 +405,22 @@ class StandaloneContextRefiner:
             iteration += 1
 
             # Extract clip text
-            clip_text = extract_clip_text(segments, current_start, current_end)
+            clip_text = self._clip_text(segments, current_start, current_end)
 
             if not clip_text:
                 return None
 
             # Validate standalone quality
-            result = self._validate_single(
-                client,
-                clip_text,
-                current_start,
-                current_end,
-                thought
-            )
+            if iteration == 1 and first_result:
+                result = first_result
+            else:
+                result = self._validate_single(
+                    client,
+                    clip_text,
+                    current_start,
+                    current_end,
+                    thought
+                )
 
             if not result:
                 return None
@@ -402,18 +600,10 @@ class StandaloneContextRefiner:
 
         for attempt in range(max_retries):
             try:
+                self._throttle(prompt)
                 response = client.chat.completions.create(
                     model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a senior video editor evaluating whether clips can stand alone without prior context."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
+                    messages=self._build_messages(prompt),
                     temperature=0.3,  # Low temp for consistent evaluation
                     response_format={"type": "json_object"}
                 )
@@ -430,13 +620,7 @@ class StandaloneContextRefiner:
                 # Parse response
                 result = json.loads(response.choices[0].message.content)
 
-                refined_start = float(result.get('refined_start', start))
-                refined_end = float(result.get('refined_end', end))
-                standalone_score = float(result['standalone_score'])
-                editor_notes = result['editor_notes']
-                rejection_reason = result.get('rejection_reason')
-
-                return (refined_start, refined_end, standalone_score, editor_notes, rejection_reason)
+                return self._parse_validation(result, start, end)
 
             except (json.JSONDecodeError, KeyError, ValueError) as e:
                 print(f"      ⚠️  Failed to parse validation response: {e}")
@@ -446,13 +630,12 @@ class StandaloneContextRefiner:
                 error_str = str(e)
 
                 # Check if this is a rate limit error
-                if "rate_limit_exceeded" in error_str or "429" in error_str:
+                if any(marker in error_str for marker in RATE_LIMIT_MARKERS):
                     # Calculate wait time
                     wait_time = base_delay * (2 ** attempt)
 
                     # Try to parse suggested wait time from error
-                    import re
-                    match = re.search(r'try again in (\d+\.?\d*)s', error_str)
+                    match = RATE_LIMIT_WAIT_RE.search(error_str)
                     if match:
                         wait_time = float(match.group(1)) + 1.0
 
@@ -472,6 +655,135 @@ class StandaloneContextRefiner:
 
         return None
 
+    def _validate_batch(
+        self,
+        client,
+        thoughts: List[Dict],
+        segments: List[Dict]
+    ) -> Dict[str, Tuple[float, float, float, str, Optional[str]]]:
+        """
+        Run the first validation pass for several thoughts in one API call
+
+        Args:
+            client: OpenAI client
+            thoughts: Thoughts from Layer 2
+            segments: Transcript segments
+
+        Returns:
+            Dict mapping moment_id to the same tuple _validate_single returns.
+            Thoughts without text, or missing from the response, are left out.
+        """
+        items = []
+        for thought in thoughts:
+            start = thought['expanded_start']
+            end = thought['expanded_end']
+            clip_text = self._clip_text(segments, start, end)
+            if clip_text:
+                items.append((thought, clip_text, start, end))
+
+        # A batch of one gains nothing over the single-clip prompt
+        if len(items) < 2:
+            return {}
+
+        prompt = self._create_batch_prompt(items)
+
+        # Retry configuration for rate limits
+        max_retries = 5
+        base_delay = 2.0
+
+        for attempt in range(max_retries):
+            try:
+                self._throttle(prompt)
+                response = client.chat.completions.create(
+                    model=self.model,
+                    messages=self._build_messages(prompt),
+                    temperature=0.3,  # Low temp for consistent evaluation
+                    response_format={"type": "json_object"}
+                )
+
+                # Track metrics
+                self.metrics['api_calls'] += 1
+                self.metrics['tokens_used'] += response.usage.total_tokens
+
+                # Calculate cost (GPT-4o-mini pricing: $0.15/1M input, $0.60/1M output)
+                input_cost = (response.usage.prompt_tokens / 1_000_000) * 0.15
+                output_cost = (response.usage.completion_tokens / 1_000_000) * 0.60
+                self.metrics['cost_usd'] += input_cost + output_cost
+
+                # Parse response, matching entries back to thoughts by id
+                entries = json.loads(response.choices[0].message.content)['clips']
+                by_id = {entry.get('id'): entry for entry in entries if isinstance(entry, dict)}
+
+                results = {}
+                for thought, _, start, end in items:
+                    entry = by_id.get(thought['moment_id'])
+                    if entry is None:
+                        continue
+                    try:
+                        results[thought['moment_id']] = self._parse_validation(entry, start, end)
+                    except (KeyError, TypeError, ValueError):
+                        continue  # Validated on its own instead
+
+                return results
+
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                print(f"      ⚠️  Failed to parse batch validation response: {e}")
+                return {}
+
+            except Exception as e:
+                error_str = str(e)
+
+                # Check if this is a rate limit error
+                if any(marker in error_str for marker in RATE_LIMIT_MARKERS):
+                    # Calculate wait time
+                    wait_time = base_delay * (2 ** attempt)
+
+                    # Try to parse suggested wait time from error
+                    match = RATE_LIMIT_WAIT_RE.search(error_str)
+                    if match:
+                        wait_time = float(match.group(1)) + 1.0
+
+                    if attempt < max_retries - 1:
+                        print(f"      ⚠️  API error during batch validation: {e}")
+                        print(f"      ⏳ Retrying in {wait_time:.1f}s (attempt {attempt + 2}/{max_retries})...")
+                        import time
+                        time.sleep(wait_time)
+                        continue
+                    else:
+                        print(f"      ❌ Batch validation failed after {max_retries} retries")
+                        return {}
+                else:
+                    # Non-rate-limit error
+                    print(f"      ⚠️  API error during batch validation: {e}")
+                    return {}
+
+        return {}
+
+    def _parse_validation(
+        self,
+        result: Dict,
+        start: float,
+        end: float
+    ) -> Tuple[float, float, float, str, Optional[str]]:
+        """
+        Read one clip's validation fields from a parsed JSON response
+
+        Args:
+            result: Parsed JSON object for the clip
+            start: Current start time (default for refined_start)
+            end: Current end time (default for refined_end)
+
+        Returns:
+            Tuple of (refined_start, refined_end, standalone_score, editor_notes, rejection_reason)
+        """
+        refined_start = float(result.get('refined_start', start))
+        refined_end = float(result.get('refined_end', end))
+        standalone_score = float(result['standalone_score'])
+        editor_notes = result['editor_notes']
+        rejection_reason = result.get('rejection_reason')
+
+        return (refined_start, refined_end, standalone_score, editor_notes, rejection_reason)
+
     def _create_prompt(
         self,
         clip_text: str,
@@ -511,85 +823,7 @@ Can someone who JUST clicked on this clip understand it without any prior contex
 CLIP TRANSCRIPT:
 {clip_text}
 
-EVALUATION CRITERIA:
-
-1. **Who/What Context:**
-   - Is it clear WHO is speaking or who/what this is about?
-   - If pronouns are used ("he", "she", "they", "it"), is the referent clear?
-   - Score 0.0 if critical context is missing
-
-2. **Topic/Situation:**
-   - Is the topic or situation explained within the clip?
-   - Can a viewer understand what's being discussed?
-   - Score 0.0 if viewer would be confused about the topic
-
-3. **Stakes/Relevance:**
-   - Is it clear WHY this matters or why the viewer should care?
-   - Are the stakes or implications explained?
-   - Lower score if motivation is unclear
-
-4. **Unresolved References:**
-   - Are there references to "this", "that", "the problem", "the solution" without explanation?
-   - Are there assumed facts not stated in the clip?
-   - Significantly reduce score for vague references
-
-5. **Beginning/Middle/End:**
-   - Does the clip have a clear beginning (setup)?
-   - Does it have substance (middle)?
-   - Does it have resolution or payoff (end)?
-   - Reduce score if clip feels incomplete
-
-SCORING GUIDE WITH CONCRETE EXAMPLES:
-
-0.9-1.0: PERFECT STANDALONE
-Example: "Today I'm going to show you how to fix rate limit errors in Python.
-         The problem is when you make too many API calls, you get a 429 error.
-         Here's the solution: implement exponential backoff..."
-Why 0.9+: Topic stated, problem defined, solution clear. No prior knowledge needed.
-
-0.7-0.9: GOOD STANDALONE (Minor gaps acceptable)
-Example: "So after we implemented this caching system, our performance improved by 50%.
-         The key was using Redis instead of in-memory caching..."
-Why 0.7-0.9: Clear outcome and solution. Minor: doesn't explain why caching was needed,
-            but viewer can infer performance was a problem.
-
-0.5-0.7: MARGINAL (Some prior knowledge helpful)
-Example: "This approach solved our problem completely. We went from 30-second load times
-         to under 2 seconds by implementing this pattern..."
-Why 0.5-0.7: Clear improvement, but "this approach" and "this pattern" are vague.
-            Viewer gets value but would benefit from knowing what the approach was.
-
-0.3-0.5: POOR (Requires significant context)
-Example: "And that's why it didn't work. So we had to completely rethink our architecture
-         and move to a different pattern..."
-Why 0.3-0.5: "It", "that", "our architecture" - all undefined. Viewer lost without backstory.
-
-0.0-0.3: UNUSABLE (Completely dependent on prior context)
-Example: "After that failed, we tried the second approach, which also didn't work.
-         So then we moved to option three..."
-Why 0.0-0.3: No idea what "that", "second approach", or "option three" are.
-            Meaningless without full video context.
-
-SCORING INSTRUCTIONS:
-1. Compare clip to these examples
-2. Which example does it most resemble?
-3. Assign score in that range
-4. Be strict: When in doubt, score lower
-
-BOUNDARY REFINEMENT RULES:
-- You may suggest MINOR adjustments only
-- MAX ADJUSTMENT: ±2 sentences (±15 seconds)
-- Only adjust if standalone_score < 0.7
-- Focus on fixing missing context, NOT restructuring the clip
-- If major changes needed (>15s adjustment), REJECT instead
-
-Example acceptable adjustments:
-- Add 1 sentence at start to clarify "the problem" being discussed
-- Add 1 sentence at end to complete resolution
-
-Example unacceptable adjustments:
-- Expanding 20+ seconds backward for full backstory
-- Reworking the entire clip structure
+{_EVALUATION_GUIDE}
 
 OUTPUT JSON ONLY:
 {{
@@ -605,20 +839,98 @@ OUTPUT JSON ONLY:
   "weaknesses": ["What's", "problematic"]
 }}
 
-FIELD DEFINITIONS:
-- changes_made: boolean - Did you adjust the boundaries at all?
-- adjustment_type: null | "expanded_start" | "expanded_end" | "both" - What changed?
-- rejection_reason: null | "missing_premise" | "dangling_reference" | "incomplete_resolution" | "topic_drift" | "duration_constraint" | "structural_issue" - Why rejected (if score < 0.4)
+{_FIELD_RULES}
+"""
 
-RULES:
-- Be honest and strict - we want GREAT standalone clips, not mediocre ones
-- Default refined times to current times unless you have specific boundary suggestions
-- If no changes made, set changes_made=false and adjustment_type=null
-- Editor notes should be actionable and specific
-- Score based on what's IN the clip, not what COULD be added
-- REJECT clips needing >15s adjustment rather than expanding them
+    def _create_batch_prompt(self, items: List[Tuple[Dict, str, float, float]]) -> str:
+        """
+        Create a Layer 3 validation prompt covering several clips
+
+        Args:
+            items: (thought, clip_text, start, end) for each clip
+
+        Returns:
+            Prompt string
+        """
+        clip_sections = []
+        for thought, clip_text, start, end in items:
+            clip_sections.append(f"""CLIP id="{thought['moment_id']}"
+Duration: {end - start:.1f}s
+Clip timestamps: [{format_timestamp(start)}] to [{format_timestamp(end)}] (refined_start={start}, refined_end={end})
+Original core idea: {thought['original_moment']['core_idea']}
+Transcript:
+{clip_text}""")
+        clips_block = "\n\n".join(clip_sections)
+
+        return f"""ROLE: Senior video editor evaluating standalone clip quality.
+
+CONTEXT:
+You're evaluating {len(items)} clips for a short-form video platform (YouTube Shorts, TikTok, Instagram Reels).
+Evaluate every clip on its own; the clips are unrelated to each other.
+
+CRITICAL QUESTION:
+For each clip: can someone who JUST clicked on it understand it without any prior context from the video?
+
+CLIPS:
+
+{clips_block}
+
+{_EVALUATION_GUIDE}
+
+OUTPUT JSON ONLY:
+{{
+  "clips": [
+    {{
+      "id": "moment_001",
+      "standalone_score": 0.75,
+      "refined_start": 123.4,
+      "refined_end": 198.6,
+      "changes_made": false,
+      "adjustment_type": null,
+      "rejection_reason": null,
+      "editor_notes": "Brief explanation of score and any issues"
+    }}
+  ]
+}}
+
+{_FIELD_RULES}
+- Return exactly one entry per clip, using the clip's id
 """
 
+    def _build_messages(self, prompt: str) -> List[Dict]:
+        """
+        Chat messages for a prompt, with the constant parts first
+
+        The system prompt and (if set) the shared transcript block are
+        byte-identical on every call, so they form a cacheable prefix; only
+        the per-call prompt varies.
+        """
+        messages = [{"role": "system", "content": self.SYSTEM_PROMPT}]
+        if self.cached_transcript_block:
+            messages.append({"role": "user", "content": self.cached_transcript_block})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _clip_text(self, segments: List[Dict], start_time: float, end_time: float) -> str:
+        """Transcript text for a time range, via the shared index when there is one"""
+        if self.transcript_index is not None:
+            return self.transcript_index.text_between(start_time, end_time)
+        return extract_clip_text(segments, start_time, end_time)
+
+    def _throttle(self, prompt: str):
+        """Wait for the shared rate limiter (if any) before sending a prompt"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(
+                estimate_tokens(prompt, self.model) + self._prefix_tokens
+                + COMPLETION_TOKEN_RESERVE
+            )
+
+    def _get_client(self):
+        """Return the shared OpenAI client, creating it on first use"""
+        if self.client is None:
+            self.client = create_openai_client(self.api_key)
+        return self.client
+
     def get_metrics_summary(self) -> str:
         """
         Get formatted metrics summary
@@ -7,9 +7,105 @@ This layer takes clips that have passed standalone validation and adds
 all the marketing/presentation elements needed for publishing.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+import asyncio
 import json
-from .utils import extract_clip_text, format_timestamp
+import threading
+import time
+from .utils import (
+    COMPLETION_TOKEN_RESERVE,
+    RATE_LIMIT_MARKERS,
+    RATE_LIMIT_WAIT_RE,
+    RateLimiter,
+    TranscriptIndex,
+    create_openai_client,
+    estimate_tokens,
+    extract_clip_text,
+    format_timestamp,
+    run_batch_job
+)
+
+
+@dataclass(frozen=True)
+class PackagedClip:
+    """
+    A clip ready for publishing (Layer 4 output)
+
+    Slotted (no per-instance __dict__) to keep the in-flight clip set small;
+    FourLayerAdapter converts these to legacy dicts at its boundary.
+    """
+    __slots__ = (
+        'clip_id', 'start_time', 'end_time', 'duration',
+        'title', 'description', 'hashtags', 'thumbnail_time', 'thumbnail_reasoning',
+        'interest_score', 'standalone_score', 'content_type',
+        '_layer1', '_layer2', '_layer3'
+    )
+
+    # Core identifiers
+    clip_id: str
+    start_time: float
+    end_time: float
+    duration: float
+
+    # Packaging metadata
+    title: str
+    description: str
+    hashtags: List[str]
+    thumbnail_time: float
+    thumbnail_reasoning: str
+
+    # Quality scores
+    interest_score: float
+    standalone_score: float
+    content_type: str
+
+    # Preserve layer outputs for debugging
+    _layer1: Dict
+    _layer2: Dict
+    _layer3: Dict
+
+
+# Title/description/hashtag/thumbnail guidance shared by the single-clip and batched prompts
+_PACKAGING_GUIDE = """TITLE GUIDELINES:
+- Max 60 characters (strict limit)
+- Be SPECIFIC, not generic
+  ❌ "Important Life Lesson"
+  ✅ "Why I Stopped Using Cloud Services"
+- Use strong hooks when appropriate
+  ✅ "The Problem Nobody Talks About"
+  ✅ "How I Saved $10K on Development"
+- Match the content type:
+  * insight/advice → Direct statement or "How to..."
+  * controversial → Question or provocative statement
+  * story → Focus on outcome or surprise
+  * hook → Lead with the surprise/contradiction
+
+DESCRIPTION GUIDELINES:
+- 2-3 sentences total
+- Sentence 1: Hook or question to grab attention
+- Sentence 2: Context or main point
+- Sentence 3 (optional): Value or takeaway
+- Natural, conversational tone
+- Don't oversell or use excessive emojis
+
+HASHTAG GUIDELINES:
+- Exactly 5 hashtags
+- Mix of:
+  * Broad reach: #tech #business #entrepreneur
+  * Niche specific: #softwareengineering #cloudcomputing
+  * Content type: #lifelessons #techadvice #startup
+- Avoid generic/useless tags: #content #video #viral #fyp
+
+THUMBNAIL GUIDELINES:
+- Choose best visual moment within clip
+- Look for:
+  * Speaker making strong point (hand gestures, emphasis)
+  * Peak emotional moment
+  * Beginning of key insight
+  * Avoid: mid-sentence, transitions, awkward expressions"""
 
 
 class PackagingLayer:
@@ -27,17 +123,49 @@ class PackagingLayer:
     """
 
     MAX_TITLE_LENGTH = 60  # Platform constraint for short-form video
-
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini"):
+    BATCH_SIZE = 6         # Clips packaged per batched API call
+    TITLE_CACHE_SIZE = 256  # Regenerated titles kept per instance (LRU)
+    FALLBACK_TITLE = "Untitled Clip"
+    SYSTEM_PROMPT = (
+        "You are a social media expert creating compelling titles and "
+        "descriptions for short-form video content."
+    )
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        client=None,
+        rate_limiter: Optional[RateLimiter] = None,
+        batch_mode: bool = False,
+        poll_interval: float = 30.0,
+        transcript_index: Optional[TranscriptIndex] = None
+    ):
         """
         Initialize packaging layer
 
         Args:
             api_key: OpenAI API key
             model: Model to use (default: gpt-4o-mini for cost efficiency)
+            client: Optional shared OpenAI client (created on first use if None)
+            rate_limiter: Optional RateLimiter shared with other layers
+            batch_mode: Have package_all() submit one OpenAI Batch API job
+                (half price, up to 24h turnaround) instead of online calls
+            poll_interval: Initial seconds between Batch API status checks
+                (doubles up to 10 minutes)
+            transcript_index: Optional TranscriptIndex over the segments that
+                will be passed in, for fast clip-text lookups
         """
         self.api_key = api_key
         self.model = model
+        self.client = client
+        self.rate_limiter = rate_limiter
+        self.batch_mode = batch_mode
+        self._title_cache = OrderedDict()  # Normalized text -> title
+        self._title_pending = {}  # Normalized text -> Future of an in-flight title call
+        self._title_lock = threading.Lock()  # Guards both; titles are requested from threads
+        self.poll_interval = poll_interval
+        self.transcript_index = transcript_index
         self.metrics = {
             'api_calls': 0,
             'tokens_used': 0,
@@ -49,7 +177,7 @@ class PackagingLayer:
         self,
         validated_clips: List[Dict],
         transcript_data: Dict
-    ) -> List[Dict]:
+    ) -> List[PackagedClip]:
         """
         Package all validated clips with titles, descriptions, and metadata.
 
@@ -58,35 +186,13 @@ class PackagingLayer:
             transcript_data: Full transcript data with segments
 
         Returns:
-            List of packaged clip dicts:
-            {
-                'clip_id': str,
-                'start_time': float,
-                'end_time': float,
-                'duration': float,
-                'title': str,
-                'description': str,
-                'hashtags': List[str],
-                'thumbnail_time': float,
-                'thumbnail_reasoning': str,
-                'interest_score': float,
-                'standalone_score': float,
-                'content_type': str,
-                '_layer1': Dict,
-                '_layer2': Dict,
-                '_layer3': Dict
-            }
+            List of PackagedClip records
         """
         if not validated_clips:
             print("      ⚠️  No validated clips to package")
             return []
 
-        try:
-            from openai import OpenAI
-        except ImportError:
-            raise ImportError("openai package required. Install with: pip install openai")
-
-        client = OpenAI(api_key=self.api_key)
+        client = self._get_client()
         segments = transcript_data.get('segments', [])
 
         if not segments:
@@ -97,13 +203,20 @@ class PackagingLayer:
 
         print(f"      Packaging {len(validated_clips)} validated clips...")
 
+        # Clips the batch job doesn't return are packaged online below
+        packagings = {}
+        if self.batch_mode:
+            packagings = self._generate_packaging_via_batch_api(client, validated_clips, segments)
+
         for idx, clip in enumerate(validated_clips, 1):
             try:
-                packaged = self._package_single(client, clip, idx, segments)
+                packaged = self._package_single(
+                    client, clip, idx, segments, packaging=packagings.get(idx)
+                )
 
                 if packaged:
                     packaged_clips.append(packaged)
-                    print(f"      ✓ Clip {idx}/{len(validated_clips)}: \"{packaged['title'][:50]}...\"")
+                    print(f"      ✓ Clip {idx}/{len(validated_clips)}: \"{packaged.title[:50]}...\"")
 
             except Exception as e:
                 print(f"      ⚠️  Clip {idx} packaging failed: {e}")
@@ -113,13 +226,65 @@ class PackagingLayer:
 
         return packaged_clips
 
+    def package_batch(
+        self,
+        client,
+        clips: List[Dict],
+        clip_ids: List[int],
+        segments: List[Dict]
+    ) -> List[Optional[PackagedClip]]:
+        """
+        Package a batch of validated clips with one API call.
+
+        Clips missing from the batched response are packaged on their own.
+
+        Args:
+            client: OpenAI client (thread-safe, may be shared)
+            clips: Validated clips from Layer 3
+            clip_ids: Numeric ID for each clip
+            segments: Transcript segments
+
+        Returns:
+            PackagedClip (or None if failed) for each clip, in order
+        """
+        packagings = self._generate_packaging_batch(client, clips, clip_ids, segments)
+
+        packaged_clips = []
+        for clip, clip_id in zip(clips, clip_ids):
+            try:
+                packaged = self._package_single(
+                    client, clip, clip_id, segments,
+                    packaging=packagings.get(clip_id)
+                )
+            except Exception as e:
+                print(f"      ⚠️  Clip {clip_id} packaging failed: {e}")
+                packaged = None
+
+            if packaged:
+                self.metrics['clips_packaged'] += 1
+                print(f"      ✓ Clip {clip_id}: \"{packaged.title[:50]}...\"")
+            packaged_clips.append(packaged)
+
+        return packaged_clips
+
+    async def package_batch_async(
+        self,
+        client,
+        clips: List[Dict],
+        clip_ids: List[int],
+        segments: List[Dict]
+    ) -> List[Optional[PackagedClip]]:
+        """Run package_batch() in a worker thread so the event loop stays free"""
+        return await asyncio.to_thread(self.package_batch, client, clips, clip_ids, segments)
+
     def _package_single(
         self,
         client,
         clip: Dict,
         clip_id: int,
-        segments: List[Dict]
-    ) -> Dict:
+        segments: List[Dict],
+        packaging: Optional[Dict] = None
+    ) -> Optional[PackagedClip]:
         """
         Package a single clip with all metadata
 
@@ -128,63 +293,65 @@ class PackagingLayer:
             clip: Validated clip from Layer 3
             clip_id: Numeric ID for this clip
             segments: Transcript segments
+            packaging: Packaging metadata, if already generated (see package_batch)
 
         Returns:
-            Packaged clip dict with all metadata
+            PackagedClip with all metadata, or None if failed
         """
         # Extract clip text
         start_time = clip['refined_start']
         end_time = clip['refined_end']
-        clip_text = extract_clip_text(segments, start_time, end_time)
+        clip_text = self._clip_text(segments, start_time, end_time)
 
         if not clip_text:
             print(f"      ⚠️  No text found for clip {clip_id}")
             return None
 
         # Generate packaging metadata
-        packaging = self._generate_packaging(client, clip_text, start_time, end_time, clip)
+        if packaging is None:
+            packaging = self._generate_packaging(client, clip_text, start_time, end_time, clip)
 
         if not packaging:
             return None
 
-        # Assemble final clip dict
-        packaged_clip = {
+        # Assemble final clip
+        thought = clip['complete_thought']
+        moment = thought['original_moment']
+        return PackagedClip(
             # Core identifiers
-            'clip_id': f"clip_{clip_id:03d}",
-            'start_time': start_time,
-            'end_time': end_time,
-            'duration': end_time - start_time,
+            clip_id=f"clip_{clip_id:03d}",
+            start_time=start_time,
+            end_time=end_time,
+            duration=end_time - start_time,
 
             # Packaging metadata
-            'title': packaging['title'],
-            'description': packaging['description'],
-            'hashtags': packaging['hashtags'],
-            'thumbnail_time': packaging['thumbnail_time'],
-            'thumbnail_reasoning': packaging.get('thumbnail_reasoning', ''),
+            title=packaging['title'],
+            description=packaging['description'],
+            hashtags=packaging['hashtags'],
+            thumbnail_time=packaging['thumbnail_time'],
+            thumbnail_reasoning=packaging.get('thumbnail_reasoning', ''),
 
             # Quality scores
-            'interest_score': clip['complete_thought']['original_moment']['interest_score'],
-            'standalone_score': clip['standalone_score'],
-            'content_type': clip['complete_thought']['original_moment']['content_type'],
+            interest_score=moment['interest_score'],
+            standalone_score=clip['standalone_score'],
+            content_type=moment['content_type'],
 
             # Preserve layer outputs for debugging
-            '_layer1': clip['complete_thought']['original_moment'],
-            '_layer2': {
-                'expanded_start': clip['complete_thought']['expanded_start'],
-                'expanded_end': clip['complete_thought']['expanded_end'],
-                'thought_summary': clip['complete_thought']['thought_summary'],
-                'confidence': clip['complete_thought']['confidence']
+            _layer1=moment,
+            _layer2={
+                'expanded_start': thought['expanded_start'],
+                'expanded_end': thought['expanded_end'],
+                'thought_summary': thought['thought_summary'],
+                'confidence': thought['confidence']
             },
-            '_layer3': {
+            _layer3={
                 'refined_start': clip['refined_start'],
                 'refined_end': clip['refined_end'],
                 'standalone_score': clip['standalone_score'],
                 'verdict': clip['verdict'],
                 'editor_notes': clip['editor_notes']
             }
-        }
-
-        return packaged_clip
+        )
 
     def _generate_packaging(
         self,
@@ -215,12 +382,13 @@ class PackagingLayer:
 
         for attempt in range(max_retries):
             try:
+                self._throttle(prompt)
                 response = client.chat.completions.create(
                     model=self.model,
                     messages=[
                         {
                             "role": "system",
-                            "content": "You are a social media expert creating compelling titles and descriptions for short-form video content."
+                            "content": self.SYSTEM_PROMPT
                         },
                         {
                             "role": "user",
@@ -243,24 +411,7 @@ class PackagingLayer:
                 # Parse response
                 result = json.loads(response.choices[0].message.content)
 
-                # Validate and truncate title if needed
-                title = result['title']
-                if len(title) > self.MAX_TITLE_LENGTH:
-                    title = title[:self.MAX_TITLE_LENGTH-3] + "..."
-
-                # Ensure thumbnail is within clip bounds
-                thumbnail_time = float(result['thumbnail_time'])
-                thumbnail_time = max(start_time, min(end_time, thumbnail_time))
-
-                packaging = {
-                    'title': title,
-                    'description': result['description'],
-                    'hashtags': result['hashtags'][:5],  # Limit to 5 hashtags
-                    'thumbnail_time': thumbnail_time,
-                    'thumbnail_reasoning': result.get('thumbnail_reasoning', '')
-                }
-
-                return packaging
+                return self._parse_packaging(result, start_time, end_time)
 
             except (json.JSONDecodeError, KeyError, ValueError) as e:
                 print(f"      ⚠️  Failed to parse packaging response: {e}")
@@ -270,13 +421,12 @@ class PackagingLayer:
                 error_str = str(e)
 
                 # Check if this is a rate limit error
-                if "rate_limit_exceeded" in error_str or "429" in error_str:
+                if any(marker in error_str for marker in RATE_LIMIT_MARKERS):
                     # Calculate wait time
                     wait_time = base_delay * (2 ** attempt)
 
                     # Try to parse suggested wait time from error
-                    import re
-                    match = re.search(r'try again in (\d+\.?\d*)s', error_str)
+                    match = RATE_LIMIT_WAIT_RE.search(error_str)
                     if match:
                         wait_time = float(match.group(1)) + 1.0
 
@@ -296,6 +446,228 @@ class PackagingLayer:
 
         return None
 
+    def _generate_packaging_batch(
+        self,
+        client,
+        clips: List[Dict],
+        clip_ids: List[int],
+        segments: List[Dict]
+    ) -> Dict[int, Dict]:
+        """
+        Generate packaging metadata for several clips in one API call
+
+        Args:
+            client: OpenAI client
+            clips: Validated clips from Layer 3
+            clip_ids: Numeric ID for each clip
+            segments: Transcript segments
+
+        Returns:
+            Dict mapping clip ID to packaging metadata. Clips without text,
+            or missing from the response, are left out.
+        """
+        items = []
+        for clip, clip_id in zip(clips, clip_ids):
+            start_time = clip['refined_start']
+            end_time = clip['refined_end']
+            clip_text = self._clip_text(segments, start_time, end_time)
+            if clip_text:
+                items.append((clip_id, clip, clip_text, start_time, end_time))
+
+        # A batch of one gains nothing over the single-clip prompt
+        if len(items) < 2:
+            return {}
+
+        prompt = self._create_batch_prompt(items)
+
+        # Retry configuration for rate limits
+        max_retries = 5
+        base_delay = 2.0
+
+        for attempt in range(max_retries):
+            try:
+                self._throttle(prompt)
+                response = client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": self.SYSTEM_PROMPT
+                        },
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    temperature=0.7,  # Moderate creativity for titles
+                    response_format={"type": "json_object"}
+                )
+
+                # Track metrics
+                self.metrics['api_calls'] += 1
+                self.metrics['tokens_used'] += response.usage.total_tokens
+
+                # Calculate cost (GPT-4o-mini pricing)
+                input_cost = (response.usage.prompt_tokens / 1_000_000) * 0.15
+                output_cost = (response.usage.completion_tokens / 1_000_000) * 0.60
+                self.metrics['cost_usd'] += input_cost + output_cost
+
+                # Parse response, matching entries back to clips by id
+                entries = json.loads(response.choices[0].message.content)['clips']
+                by_id = {entry.get('id'): entry for entry in entries if isinstance(entry, dict)}
+
+                packagings = {}
+                for clip_id, _, _, start_time, end_time in items:
+                    entry = by_id.get(f"clip_{clip_id:03d}")
+                    if entry is None:
+                        continue
+                    try:
+                        packagings[clip_id] = self._parse_packaging(entry, start_time, end_time)
+                    except (KeyError, TypeError, ValueError):
+                        continue  # Packaged on its own instead
+
+                return packagings
+
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                print(f"      ⚠️  Failed to parse batch packaging response: {e}")
+                return {}
+
+            except Exception as e:
+                error_str = str(e)
+
+                # Check if this is a rate limit error
+                if any(marker in error_str for marker in RATE_LIMIT_MARKERS):
+                    # Calculate wait time
+                    wait_time = base_delay * (2 ** attempt)
+
+                    # Try to parse suggested wait time from error
+                    match = RATE_LIMIT_WAIT_RE.search(error_str)
+                    if match:
+                        wait_time = float(match.group(1)) + 1.0
+
+                    if attempt < max_retries - 1:
+                        print(f"      ⚠️  API error during batch packaging: {e}")
+                        print(f"      ⏳ Retrying in {wait_time:.1f}s (attempt {attempt + 2}/{max_retries})...")
+                        import time
+                        time.sleep(wait_time)
+                        continue
+                    else:
+                        print(f"      ❌ Batch packaging failed after {max_retries} retries")
+                        return {}
+                else:
+                    # Non-rate-limit error
+                    print(f"      ⚠️  API error during batch packaging: {e}")
+                    return {}
+
+        return {}
+
+    def _generate_packaging_via_batch_api(
+        self,
+        client,
+        clips: List[Dict],
+        segments: List[Dict]
+    ) -> Dict[int, Dict]:
+        """
+        Generate packaging metadata for all clips as one OpenAI Batch API job
+
+        One /v1/chat/completions request per clip (see run_batch_job).
+
+        Args:
+            client: OpenAI client
+            clips: Validated clips from Layer 3
+            segments: Transcript segments
+
+        Returns:
+            Dict mapping clip index (1-based) to packaging metadata. Clips
+            without text, or that failed in the job, are left out.
+        """
+        requests = []
+        bounds = {}
+        for idx, clip in enumerate(clips, 1):
+            start_time = clip['refined_start']
+            end_time = clip['refined_end']
+            clip_text = self._clip_text(segments, start_time, end_time)
+            if not clip_text:
+                continue
+
+            bounds[idx] = (start_time, end_time)
+            requests.append({
+                "custom_id": f"clip_{idx:03d}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": self.SYSTEM_PROMPT},
+                        {
+                            "role": "user",
+                            "content": self._create_prompt(clip_text, start_time, end_time, clip)
+                        }
+                    ],
+                    "temperature": 0.7,
+                    "response_format": {"type": "json_object"}
+                }
+            })
+
+        if not requests:
+            return {}
+
+        try:
+            bodies = run_batch_job(client, requests, "layer4_packaging.jsonl", self.poll_interval)
+        except Exception as e:
+            print(f"      ⚠️  Batch API packaging failed: {e}")
+            return {}
+
+        packagings = {}
+        for custom_id, body in bodies.items():
+            try:
+                idx = int(custom_id.rsplit('_', 1)[1])
+
+                # Track metrics (Batch API bills at half the online price)
+                usage = body['usage']
+                self.metrics['api_calls'] += 1
+                self.metrics['tokens_used'] += usage['total_tokens']
+                input_cost = (usage['prompt_tokens'] / 1_000_000) * 0.075
+                output_cost = (usage['completion_tokens'] / 1_000_000) * 0.30
+                self.metrics['cost_usd'] += input_cost + output_cost
+
+                result = json.loads(body['choices'][0]['message']['content'])
+                packagings[idx] = self._parse_packaging(result, *bounds[idx])
+            except (json.JSONDecodeError, KeyError, IndexError, TypeError, ValueError) as e:
+                print(f"      ⚠️  Failed to parse batch result: {e}")
+                continue
+
+        return packagings
+
+    def _parse_packaging(self, result: Dict, start_time: float, end_time: float) -> Dict:
+        """
+        Read one clip's packaging fields from a parsed JSON response
+
+        Args:
+            result: Parsed JSON object for the clip
+            start_time: Clip start time
+            end_time: Clip end time
+
+        Returns:
+            Dict with packaging metadata
+        """
+        # Validate and truncate title if needed
+        title = result['title']
+        if len(title) > self.MAX_TITLE_LENGTH:
+            title = title[:self.MAX_TITLE_LENGTH-3] + "..."
+
+        # Ensure thumbnail is within clip bounds
+        thumbnail_time = float(result['thumbnail_time'])
+        thumbnail_time = max(start_time, min(end_time, thumbnail_time))
+
+        return {
+            'title': title,
+            'description': result['description'],
+            'hashtags': result['hashtags'][:5],  # Limit to 5 hashtags
+            'thumbnail_time': thumbnail_time,
+            'thumbnail_reasoning': result.get('thumbnail_reasoning', '')
+        }
+
     def _create_prompt(
         self,
         clip_text: str,
@@ -341,43 +713,7 @@ CLIP TRANSCRIPT:
 TASK:
 Generate compelling packaging for this clip to maximize engagement.
 
-TITLE GUIDELINES:
-- Max 60 characters (strict limit)
-- Be SPECIFIC, not generic
-  ❌ "Important Life Lesson"
-  ✅ "Why I Stopped Using Cloud Services"
-- Use strong hooks when appropriate
-  ✅ "The Problem Nobody Talks About"
-  ✅ "How I Saved $10K on Development"
-- Match the content type:
-  * insight/advice → Direct statement or "How to..."
-  * controversial → Question or provocative statement
-  * story → Focus on outcome or surprise
-  * hook → Lead with the surprise/contradiction
-
-DESCRIPTION GUIDELINES:
-- 2-3 sentences total
-- Sentence 1: Hook or question to grab attention
-- Sentence 2: Context or main point
-- Sentence 3 (optional): Value or takeaway
-- Natural, conversational tone
-- Don't oversell or use excessive emojis
-
-HASHTAG GUIDELINES:
-- Exactly 5 hashtags
-- Mix of:
-  * Broad reach: #tech #business #entrepreneur
-  * Niche specific: #softwareengineering #cloudcomputing
-  * Content type: #lifelessons #techadvice #startup
-- Avoid generic/useless tags: #content #video #viral #fyp
-
-THUMBNAIL GUIDELINES:
-- Choose best visual moment within clip
-- Look for:
-  * Speaker making strong point (hand gestures, emphasis)
-  * Peak emotional moment
-  * Beginning of key insight
-  * Avoid: mid-sentence, transitions, awkward expressions
+{_PACKAGING_GUIDE}
 - Provide timestamp (must be between {start_time:.1f} and {end_time:.1f})
 
 OUTPUT JSON ONLY:
@@ -395,13 +731,80 @@ RULES:
 - Exactly 5 hashtags, no generic tags
 - Thumbnail time must be within [{start_time:.1f}, {end_time:.1f}]
 - Be authentic and specific, not clickbait-y
+"""
+
+    def _create_batch_prompt(self, items: List[tuple]) -> str:
+        """
+        Create a Layer 4 packaging prompt covering several clips
+
+        Args:
+            items: (clip_id, clip, clip_text, start_time, end_time) for each clip
+
+        Returns:
+            Prompt string
+        """
+        clip_sections = []
+        for clip_id, clip, clip_text, start_time, end_time in items:
+            moment = clip['complete_thought']['original_moment']
+            clip_sections.append(f"""CLIP id="clip_{clip_id:03d}"
+- Type: {moment['content_type']}
+- Core idea: {moment['core_idea']}
+- Duration: {end_time - start_time:.1f}s
+- Timestamps: [{format_timestamp(start_time)}] to [{format_timestamp(end_time)}]
+- Thumbnail time must be between {start_time:.1f} and {end_time:.1f}
+- Standalone score: {clip['standalone_score']:.2f}/1.0
+Transcript:
+{clip_text}""")
+        clips_block = "\n\n".join(clip_sections)
+
+        return f"""ROLE: Social media expert creating content for short-form video platforms.
+
+CONTEXT:
+You're packaging {len(items)} clips for YouTube Shorts, TikTok, Instagram Reels.
+Package every clip on its own; the clips are unrelated to each other.
+
+CLIPS:
+
+{clips_block}
+
+TASK:
+Generate compelling packaging for each clip to maximize engagement.
+
+{_PACKAGING_GUIDE}
+- Provide timestamp (must be within that clip's thumbnail range)
+
+OUTPUT JSON ONLY:
+{{
+  "clips": [
+    {{
+      "id": "clip_001",
+      "title": "Specific compelling title under 60 chars",
+      "description": "Hook sentence. Main point context. Optional value statement.",
+      "hashtags": ["#relevant", "#specific", "#tags", "#only", "#five"],
+      "thumbnail_time": 42.0,
+      "thumbnail_reasoning": "Why this frame (optional debug field)"
+    }}
+  ]
+}}
+
+RULES:
+- Title MUST be under 60 characters
+- Description should be 2-3 sentences, natural tone
+- Exactly 5 hashtags, no generic tags
+- Thumbnail time must be within the clip's own range
+- Be authentic and specific, not clickbait-y
+- Return exactly one entry per clip, using the clip's id
 """
 
     def generate_title_only(self, transcript_segment: str) -> str:
         """
         Generate just a title for a transcript segment.
 
-        Used by ProfessionalClipAligner when clip boundaries change.
+        Used by ProfessionalClipAligner when clip boundaries change, from
+        several threads at once. Titles are cached by whitespace-normalized
+        text, and concurrent requests for the same text wait for the call
+        already in flight, so realigning several clips onto the same
+        sentences costs one API call.
 
         Args:
             transcript_segment: Text content of aligned clip
@@ -409,12 +812,42 @@ RULES:
         Returns:
             Generated title (max 60 chars)
         """
+        text = ' '.join(transcript_segment.split())
+        cache = self._title_cache
+        with self._title_lock:
+            if text in cache:
+                cache.move_to_end(text)
+                return cache[text]
+            pending = self._title_pending.get(text)
+            if pending is None:
+                future = self._title_pending[text] = Future()
+
+        if pending is not None:
+            return pending.result()
+
+        try:
+            title = self._generate_title(text)
+        except BaseException as e:
+            with self._title_lock:
+                del self._title_pending[text]
+            future.set_exception(e)
+            raise
+
+        with self._title_lock:
+            if title != self.FALLBACK_TITLE:  # Don't pin a transient failure
+                cache[text] = title
+                if len(cache) > self.TITLE_CACHE_SIZE:
+                    cache.popitem(last=False)
+            del self._title_pending[text]
+        future.set_result(title)
+        return title
+
+    def _generate_title(self, transcript_segment: str) -> str:
+        """Generate a title with one (retried) API call; FALLBACK_TITLE on failure"""
         try:
-            from openai import OpenAI
+            client = self._get_client()
         except ImportError:
-            return "Untitled Clip"
-
-        client = OpenAI(api_key=self.api_key)
+            return self.FALLBACK_TITLE
 
         prompt = f"""Generate a compelling title (max 60 characters) for this video clip:
 
@@ -434,6 +867,7 @@ Return only the title, nothing else."""
 
         for attempt in range(max_retries):
             try:
+                self._throttle(prompt)
                 response = client.chat.completions.create(
                     model=self.model,
                     messages=[
@@ -459,13 +893,12 @@ Return only the title, nothing else."""
                 error_str = str(e)
 
                 # Check if this is a rate limit error
-                if "rate_limit_exceeded" in error_str or "429" in error_str:
+                if any(marker in error_str for marker in RATE_LIMIT_MARKERS):
                     # Calculate wait time
                     wait_time = base_delay * (2 ** attempt)
 
                     # Try to parse suggested wait time from error
-                    import re
-                    match = re.search(r'try again in (\d+\.?\d*)s', error_str)
+                    match = RATE_LIMIT_WAIT_RE.search(error_str)
                     if match:
                         wait_time = float(match.group(1)) + 1.0
 
@@ -477,13 +910,32 @@ Return only the title, nothing else."""
                         continue
                     else:
                         print(f"      ❌ Title regeneration failed after {max_retries} retries")
-                        return "Untitled Clip"
+                        return self.FALLBACK_TITLE
                 else:
                     # Non-rate-limit error, return default title
                     print(f"      ⚠️  Failed to regenerate title: {e}")
-                    return "Untitled Clip"
-
-        return "Untitled Clip"
+                    return self.FALLBACK_TITLE
+
+        return self.FALLBACK_TITLE
+
+    def _clip_text(self, segments: List[Dict], start_time: float, end_time: float) -> str:
+        """Transcript text for a time range, via the shared index when there is one"""
+        if self.transcript_index is not None:
+            return self.transcript_index.text_between(start_time, end_time)
+        return extract_clip_text(segments, start_time, end_time)
+
+    def _throttle(self, prompt: str):
+        """Wait for the shared rate limiter (if any) before sending a prompt"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(
+                estimate_tokens(prompt, self.model) + COMPLETION_TOKEN_RESERVE
+            )
+
+    def _get_client(self):
+        """Return the shared OpenAI client, creating it on first use"""
+        if self.client is None:
+            self.client = create_openai_client(self.api_key)
+        return self.client
 
     def get_metrics_summary(self) -> str:
         """
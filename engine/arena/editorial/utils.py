@@ -2,7 +2,281 @@
 Shared utilities for the editorial module
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
+from functools import lru_cache
+import json
+import re
+import threading
+import time
+import numpy as np
+
+
+@lru_cache(maxsize=None)
+def _import_openai():
+    """
+    Import the OpenAI SDK and optional HTTP/2 support once
+
+    Failed imports are not cached by Python (each retry searches sys.path
+    again), so the outcome is memoized here, failures included.
+
+    Returns:
+        Tuple of (OpenAI class or None, the ImportError if openai is missing,
+        (DefaultHttpxClient, httpx) if HTTP/2 is available else None)
+    """
+    try:
+        from openai import OpenAI
+    except ImportError as e:
+        return None, e, None
+
+    try:
+        import h2  # noqa: F401  (httpx needs it for HTTP/2)
+        import httpx
+        from openai import DefaultHttpxClient
+    except ImportError:
+        return OpenAI, None, None
+    return OpenAI, None, (DefaultHttpxClient, httpx)
+
+
+@lru_cache(maxsize=None)
+def _import_tiktoken():
+    """The tiktoken module, or None if not installed (import attempted once)"""
+    try:
+        import tiktoken
+        return tiktoken
+    except ImportError:
+        return None
+
+
+def create_openai_client(api_key: str, max_connections: int = 100):
+    """
+    Create a synchronous OpenAI client with a pooled connection
+
+    The client is thread-safe, so one instance can serve every worker
+    thread of a layer (or several layers). When the optional h2 package is
+    installed, requests are multiplexed over HTTP/2.
+
+    Args:
+        api_key: OpenAI API key
+        max_connections: Connection pool size
+
+    Returns:
+        openai.OpenAI client
+    """
+    OpenAI, import_error, http2 = _import_openai()
+    if OpenAI is None:
+        raise ImportError("openai package required. Install with: pip install openai") from import_error
+    if http2 is None:
+        return OpenAI(api_key=api_key)
+    DefaultHttpxClient, httpx = http2
+
+    # DefaultHttpxClient keeps the SDK's own timeout/redirect defaults
+    http_client = DefaultHttpxClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections // 2
+        )
+    )
+    return OpenAI(api_key=api_key, http_client=http_client)
+
+
+def run_batch_job(
+    client,
+    requests: List[Dict],
+    filename: str,
+    poll_interval: float = 30.0
+) -> Dict[str, Dict]:
+    """
+    Run chat completion requests as one OpenAI Batch API job
+
+    Uploads the requests as JSONL, submits the job (24h window, billed at
+    half the online price) and polls with a doubling interval (capped at
+    10 minutes) until it ends.
+
+    Args:
+        client: OpenAI client
+        requests: Batch request lines ({"custom_id", "method", "url", "body"})
+        filename: Name for the uploaded JSONL file
+        poll_interval: Initial seconds between status checks
+
+    Returns:
+        Dict mapping custom_id to the response body of each request that
+        succeeded; failed requests are left out
+
+    Raises:
+        RuntimeError: If the job fails, expires or is cancelled
+    """
+    payload = "\n".join(json.dumps(request) for request in requests).encode('utf-8')
+    batch_file = client.files.create(file=(filename, payload), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+    print(f"      ⏳ Submitted batch {batch.id} ({len(requests)} requests), waiting for results...")
+
+    delay = poll_interval
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(delay)
+        delay = min(delay * 2, 600.0)
+        batch = client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"batch {batch.id} ended with status '{batch.status}'")
+
+    bodies = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get('response') or {}
+        if response.get('status_code') == 200:
+            bodies[record['custom_id']] = response['body']
+    return bodies
+
+
+# Tokens reserved for the completion when budgeting a request against TPM
+COMPLETION_TOKEN_RESERVE = 500
+
+# Substrings identifying a rate limit (429) error, and the server's suggested wait
+RATE_LIMIT_MARKERS = ("rate_limit_exceeded", "429")
+RATE_LIMIT_WAIT_RE = re.compile(r'try again in (\d+\.?\d*)s')
+
+
+class RateLimiter:
+    """
+    Token bucket that keeps API calls within requests- and tokens-per-minute budgets
+
+    Thread-safe, so a single instance can throttle every layer's worker
+    threads against the account's shared limits. Both buckets start full
+    and refill continuously at limit/60 per second.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            requests_per_minute: RPM budget (None = unlimited)
+            tokens_per_minute: TPM budget (None = unlimited)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute or 0)
+        self._tokens = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0) -> int:
+        """
+        Block until one request and `tokens` tokens fit within the budget
+
+        Args:
+            tokens: Estimated tokens the request will consume (prompt + completion)
+
+        Returns:
+            Tokens charged to the budget (pass to reconcile() once usage is known)
+        """
+        rpm = self.requests_per_minute
+        tpm = self.tokens_per_minute
+        if tpm:
+            # A request larger than the whole budget still goes out once the bucket is full
+            tokens = min(tokens, tpm)
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._last_refill = now
+
+                wait = 0.0
+                if rpm:
+                    self._requests = min(rpm, self._requests + elapsed * rpm / 60)
+                    wait = max(wait, (1 - self._requests) * 60 / rpm)
+                if tpm:
+                    self._tokens = min(tpm, self._tokens + elapsed * tpm / 60)
+                    wait = max(wait, (tokens - self._tokens) * 60 / tpm)
+
+                if wait <= 0:
+                    if rpm:
+                        self._requests -= 1
+                    if tpm:
+                        self._tokens -= tokens
+                    return tokens
+
+            time.sleep(wait)
+
+    def reconcile(self, charged: int, used: int):
+        """
+        Correct the token budget once a request's actual usage is known
+
+        Refunds an over-estimate so the next call can go out sooner, or
+        charges an under-estimate so later calls wait for it.
+
+        Args:
+            charged: Tokens acquire() charged for the request
+            used: Tokens the request actually consumed (usage.total_tokens)
+        """
+        tpm = self.tokens_per_minute
+        if not tpm:
+            return
+        with self._lock:
+            self._tokens = min(tpm, self._tokens + charged - used)
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """tiktoken encoding for a model (None if tiktoken or the model is unknown)"""
+    tiktoken = _import_tiktoken()
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        return None
+
+
+def estimate_tokens(text: str, model: str = "gpt-4o") -> int:
+    """
+    Estimate token count for text, using tiktoken when installed
+
+    Args:
+        text: Text to estimate tokens for
+        model: Model whose tokenizer to use
+
+    Returns:
+        Estimated token count
+    """
+    encoding = _get_encoding(model)
+    if encoding is None:
+        # Fallback: rough estimation (1 token ~= 4 characters)
+        return len(text) // 4
+    # encode_ordinary skips the special-token scan; prompts never contain them
+    return len(encoding.encode_ordinary(text))
+
+
+def fits_token_budget(text: str, budget: int, model: str = "gpt-4o") -> bool:
+    """
+    Check whether text fits in a token budget, skipping the tokenizer when possible
+
+    Every BPE token covers at least one UTF-8 byte, so text whose byte length
+    is within the budget always fits; only larger text is tokenized.
+
+    Args:
+        text: Text to check
+        budget: Maximum token count
+        model: Model whose tokenizer to use
+
+    Returns:
+        True if the text's token count is within budget
+    """
+    if len(text) <= budget and len(text.encode('utf-8')) <= budget:
+        return True
+    return estimate_tokens(text, model) <= budget
 
 
 def format_timestamp(seconds: float) -> str:
@@ -81,6 +355,61 @@ def extract_clip_text(
     return ' '.join(text_parts)
 
 
+class TranscriptIndex:
+    """
+    Column arrays over a transcript's segments for fast time-range lookups
+
+    Built once per transcript by FourLayerAdapter and shared by every layer,
+    so none of them has to scan the segment list for each clip.
+
+    Example:
+        >>> index = TranscriptIndex([
+        ...     {'start': 0.0, 'end': 5.0, 'text': 'Hello world'},
+        ...     {'start': 5.0, 'end': 10.0, 'text': 'This is a test'}
+        ... ])
+        >>> index.text_between(2.0, 8.0)
+        'Hello world This is a test'
+    """
+
+    __slots__ = ('segments', 'starts', 'ends', 'max_ends', 'order', 'texts')
+
+    def __init__(self, segments: List[Dict]):
+        """
+        Args:
+            segments: List of segments with 'start', 'end', 'text'
+        """
+        count = len(segments)
+        starts = np.fromiter((s.get('start', 0) for s in segments), dtype=np.float64, count=count)
+        ends = np.fromiter((s.get('end', 0) for s in segments), dtype=np.float64, count=count)
+
+        self.segments = segments
+        self.order = np.argsort(starts, kind='stable')  # Original index of each sorted slot
+        self.starts = starts[self.order]
+        self.ends = ends[self.order]
+        self.max_ends = np.maximum.accumulate(self.ends) if count else self.ends
+        self.texts = [s.get('text', '').strip() for s in segments]
+
+    def overlapping(self, start_time: float, end_time: float) -> List[int]:
+        """Indices (in transcript order) of segments overlapping (start_time, end_time)"""
+        # Only [lo, hi) can overlap: earlier segments all end by start_time,
+        # later ones all begin at or after end_time
+        lo = np.searchsorted(self.max_ends, start_time, side='right')
+        hi = np.searchsorted(self.starts, end_time, side='left')
+        return np.sort(self.order[lo:hi][self.ends[lo:hi] > start_time]).tolist()
+
+    def within(self, start_time: float, end_time: float) -> List[Dict]:
+        """Segments (in transcript order) lying entirely inside [start_time, end_time]"""
+        lo = np.searchsorted(self.starts, start_time, side='left')
+        hi = np.searchsorted(self.starts, end_time, side='right')
+        matches = np.sort(self.order[lo:hi][self.ends[lo:hi] <= end_time])
+        return [self.segments[i] for i in matches.tolist()]
+
+    def text_between(self, start_time: float, end_time: float) -> str:
+        """Same result as extract_clip_text(segments, start_time, end_time)"""
+        texts = self.texts
+        return ' '.join([texts[i] for i in self.overlapping(start_time, end_time) if texts[i]])
+
+
 def format_transcript_with_timestamps(segments: List[Dict]) -> str:
     """
     Format transcript segments with timestamps for prompts
@@ -96,12 +425,23 @@ def format_transcript_with_timestamps(segments: List[Dict]) -> str:
         >>> format_transcript_with_timestamps(segments)
         '[00:00] Hello\\n[00:05] World'
     """
+    return '\n'.join(filter(None, format_segment_lines(segments)))
+
+
+def format_segment_lines(segments: List[Dict]) -> List[str]:
+    """
+    Format each segment as a timestamped transcript line
+
+    Args:
+        segments: List of transcript segments
+
+    Returns:
+        One line per segment ('' for segments without text), so slices line
+        up with segment indices; '\n'.join the non-empty lines of a slice
+        to get format_transcript_with_timestamps() of those segments
+    """
     lines = []
     for segment in segments:
-        start = segment.get('start', 0)
         text = segment.get('text', '').strip()
-        if text:
-            timestamp = format_timestamp(start)
-            lines.append(f"[{timestamp}] {text}")
-
-    return '\n'.join(lines)
+        lines.append(f"[{format_timestamp(segment.get('start', 0))}] {text}" if text else '')
+    return lines
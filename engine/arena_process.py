@@ -37,7 +37,7 @@ from arena.audio.energy import AudioEnergyAnalyzer
 from arena.audio.enhance import AudioEnhancer
 from arena.ai.analyzer import TranscriptAnalyzer
 from arena.ai.hybrid import HybridAnalyzer
-from arena.editorial import FourLayerAdapter
+from arena.editorial import FourLayerAdapter, setup_cli_logging
 from arena.clipping.generator import ClipGenerator
 from arena.clipping.professional import ProfessionalClipAligner
 from arena.ai.sentence_detector import SentenceBoundaryDetector
@@ -57,7 +57,8 @@ def run_arena_pipeline(
     use_scene_detection: bool = False,
     use_4layer: bool = False,
     export_editorial_layers: bool = False,
-    editorial_model: str = "gpt-4o"
+    editorial_model: str = "gpt-4o",
+    use_editorial_cache: bool = True
 ):
     """
     Run the complete Arena pipeline
@@ -74,6 +75,8 @@ def run_arena_pipeline(
         max_adjustment: Max seconds to adjust clip boundaries for sentence alignment
         enhance_audio: Apply AI-powered audio enhancement (default: True)
         use_scene_detection: Enable scene detection for cut point optimization (default: False)
+        use_editorial_cache: Reuse cached 4-layer moment detection responses
+            from earlier runs on the same transcript (default: True)
     """
 
     print(f"\n{'='*70}")
@@ -248,6 +251,9 @@ def run_arena_pipeline(
     print(f"{'='*70}\n")
 
     try:
+        if use_4layer:
+            setup_cli_logging()  # Editorial progress is logged, not printed
+
         # Initialize analyzers
         if HAS_TQDM:
             with tqdm(total=100, desc="🔧 Initializing", bar_format='{l_bar}{bar}') as pbar:
@@ -256,7 +262,8 @@ def run_arena_pipeline(
                     ai_analyzer = FourLayerAdapter(
                         api_key=api_key,
                         model=editorial_model,
-                        export_layers=export_editorial_layers
+                        export_layers=export_editorial_layers,
+                        cache_dir=cache_dir if use_editorial_cache else None
                     )
                 else:
                     ai_analyzer = TranscriptAnalyzer(api_key=api_key)
@@ -278,7 +285,8 @@ def run_arena_pipeline(
                 ai_analyzer = FourLayerAdapter(
                     api_key=api_key,
                     model=editorial_model,
-                    export_layers=export_editorial_layers
+                    export_layers=export_editorial_layers,
+                    cache_dir=cache_dir if use_editorial_cache else None
                 )
             else:
                 ai_analyzer = TranscriptAnalyzer(api_key=api_key)
@@ -333,6 +341,8 @@ def run_arena_pipeline(
     print(f"{'='*70}\n")
 
     try:
+        setup_cli_logging(name='arena.clipping')  # Alignment progress is logged, not printed
+
         # Initialize professional aligner
         aligner = ProfessionalClipAligner(
             max_adjustment=max_adjustment,
@@ -626,6 +636,11 @@ Environment:
         action='store_true',
         help='Export intermediate results from each editorial layer for debugging (requires --use-4layer)'
     )
+    parser.add_argument(
+        '--no-editorial-cache',
+        action='store_true',
+        help='Re-run 4-layer moment detection instead of reusing cached responses from earlier runs'
+    )
     parser.add_argument(
         '--editorial-model',
         choices=['gpt-4o', 'gpt-4o-mini'],
@@ -647,7 +662,8 @@ Environment:
         padding=args.padding,
         use_4layer=args.use_4layer,
         export_editorial_layers=args.export_editorial_layers,
-        editorial_model=args.editorial_model
+        editorial_model=args.editorial_model,
+        use_editorial_cache=not args.no_editorial_cache
     ))
 
 
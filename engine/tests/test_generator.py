@@ -0,0 +1,71 @@
+"""Tests for ClipGenerator.generate_clip_async failure handling"""
+
+import asyncio
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from arena.clipping import generator
+from arena.clipping.generator import ClipGenerator
+
+
+class GenerateClipAsyncFailureTest(unittest.TestCase):
+    """FFmpeg is never run: _run_ffmpeg_async is replaced per test"""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        video_path = self.tmpdir / "video.mp4"
+        video_path.write_bytes(b"")
+
+        with mock.patch.object(ClipGenerator, '_check_ffmpeg'):
+            self.gen = ClipGenerator(video_path)
+        self.gen._video_info = {'duration': 120.0}
+        self.output_path = self.tmpdir / "clip.mp4"
+        self.commands = []
+
+    def tearDown(self):
+        generator._failed_hw_encoders.clear()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _fake_ffmpeg(self, fail_when):
+        """_run_ffmpeg_async stand-in that fails for commands matching fail_when"""
+        async def run(command, outputs=()):
+            self.commands.append(command)
+            if fail_when(command):
+                raise RuntimeError("FFmpeg failed to generate clip: boom")
+            for output in outputs:
+                Path(output).write_bytes(b"clip")
+        return run
+
+    def _generate(self, **kwargs):
+        return asyncio.run(self.gen.generate_clip_async(10.0, 20.0, self.output_path, **kwargs))
+
+    def test_fast_mode_failure_keeps_ffmpeg_error(self):
+        with mock.patch.object(self.gen, '_run_ffmpeg_async', self._fake_ffmpeg(lambda c: True)):
+            with self.assertRaisesRegex(RuntimeError, "boom"):
+                self._generate(fast_mode=True)
+        self.assertEqual(len(self.commands), 1)
+
+    def test_software_encoder_failure_is_not_retried(self):
+        with mock.patch.object(generator, 'detect_hw_encoder', return_value=None), \
+                mock.patch.object(self.gen, '_run_ffmpeg_async', self._fake_ffmpeg(lambda c: True)):
+            with self.assertRaisesRegex(RuntimeError, "boom"):
+                self._generate()
+        self.assertEqual(len(self.commands), 1)
+
+    def test_hardware_encoder_failure_falls_back_to_libx264(self):
+        fail_on_hw = lambda command: "h264_nvenc" in command
+        with mock.patch.object(generator, 'detect_hw_encoder', return_value="h264_nvenc"), \
+                mock.patch.object(self.gen, '_run_ffmpeg_async', self._fake_ffmpeg(fail_on_hw)):
+            clip = self._generate()
+
+        self.assertEqual(clip['codec'], "libx264")
+        self.assertEqual(clip['size_bytes'], 4)
+        self.assertEqual(len(self.commands), 2)
+        self.assertIn("h264_nvenc", generator._failed_hw_encoders)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Tests for MomentDetector response parsing and chunk merging (no API calls)"""
+
+import unittest
+
+from arena.editorial.layer1_moment_detector import Moment, MomentDetector
+
+
+def moment(start, end, score, idea="idea"):
+    return Moment(start, end, idea, "why", score, "insight")
+
+
+class ParseMomentsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.detector = MomentDetector(api_key="test")
+
+    def test_compact_keys(self):
+        result = {'c': [
+            {'s': 10, 'e': 40, 'i': "low", 'w': "w", 'x': 0.4, 't': "story"},
+            {'s': 50, 'e': 80, 'i': "high", 'w': "w", 'x': 0.9}
+        ]}
+
+        moments = self.detector._parse_moments(result)
+
+        self.assertEqual([m.core_idea for m in moments], ["high", "low"])
+        self.assertEqual(moments[0], Moment(50.0, 80.0, "high", "w", 0.9, "general"))
+        self.assertEqual(moments[1].content_type, "story")
+
+    def test_long_keys(self):
+        result = {'candidates': [{
+            'rough_start': "12.5", 'rough_end': 30, 'core_idea': "idea",
+            'why_interesting': "why", 'interest_score': 0.7, 'content_type': "tip"
+        }]}
+
+        self.assertEqual(
+            self.detector._parse_moments(result),
+            [Moment(12.5, 30.0, "idea", "why", 0.7, "tip")]
+        )
+
+    def test_invalid_candidates_are_skipped(self):
+        result = {'c': [
+            {'s': 10, 'e': 40, 'i': "ok", 'w': "w", 'x': 0.5},
+            {'s': "soon", 'e': 40, 'i': "bad start", 'w': "w", 'x': 0.5},
+            {'s': 10, 'e': 40, 'w': "missing idea", 'x': 0.5}
+        ]}
+
+        moments = self.detector._parse_moments(result)
+
+        self.assertEqual([m.core_idea for m in moments], ["ok"])
+
+    def test_empty_response(self):
+        self.assertEqual(self.detector._parse_moments({}), [])
+
+
+class MergeChunkResultsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.detector = MomentDetector(api_key="test")
+
+    def test_overlapping_moments_keep_the_higher_score(self):
+        chunk_results = [
+            [moment(0, 30, 0.6, "a"), moment(100, 130, 0.5, "c")],
+            [moment(10, 35, 0.8, "b")]  # Overlaps "a" by 20s of its 25s
+        ]
+
+        merged = self.detector._merge_chunk_results(chunk_results)
+
+        self.assertEqual([m.core_idea for m in merged], ["b", "c"])
+
+    def test_small_overlap_is_kept(self):
+        chunk_results = [[moment(0, 30, 0.6, "a")], [moment(25, 60, 0.8, "b")]]
+
+        merged = self.detector._merge_chunk_results(chunk_results)
+
+        self.assertEqual([m.core_idea for m in merged], ["b", "a"])
+
+    def test_stops_at_target(self):
+        chunk_results = [[moment(i * 100, i * 100 + 30, i / 10, str(i)) for i in range(5)]]
+
+        merged = self.detector._merge_chunk_results(chunk_results, target_moments=2)
+
+        self.assertEqual([m.core_idea for m in merged], ["4", "3"])
+
+    def test_zero_length_moments_are_never_duplicates(self):
+        chunk_results = [[moment(10, 10, 0.9, "a"), moment(10, 10, 0.8, "b")]]
+
+        self.assertEqual(len(self.detector._merge_chunk_results(chunk_results)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Tests for ThoughtBoundaryAnalyzer batching and duplicate fan-out (no API calls)"""
+
+import unittest
+
+from arena.editorial.layer2_boundary_analyzer import ThoughtBoundaryAnalyzer
+
+
+def moment(start, end, idea="idea"):
+    return {
+        'rough_start': start,
+        'rough_end': end,
+        'core_idea': idea,
+        'why_interesting': "why",
+        'content_type': "insight",
+        'interest_score': 0.5
+    }
+
+
+class MakeBatchesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.analyzer = ThoughtBoundaryAnalyzer(api_key="test")
+
+    def test_batches_are_time_ordered_and_sized(self):
+        moments = [moment(start, start + 30, f"idea {start}") for start in (500, 100, 300, 200, 400)]
+        self.analyzer.BATCH_SIZE = 2
+
+        batches, duplicates = self.analyzer.make_batches(moments)
+
+        self.assertEqual(
+            [[moment_id for moment_id, _ in batch] for batch in batches],
+            [[2, 4], [3, 5], [1]]
+        )
+        self.assertEqual(duplicates, {})
+        self.assertEqual(self.analyzer.metrics['deduped_calls_saved'], 0)
+
+    def test_duplicates_are_batched_once(self):
+        moments = [
+            moment(100.0, 130.0, "Same idea"),
+            moment(200.0, 230.0, "Other idea"),
+            moment(100.04, 129.96, "  same IDEA "),  # Same window to 0.1s, same idea
+            moment(100.0, 130.0, "Different idea")
+        ]
+
+        batches, duplicates = self.analyzer.make_batches(moments)
+
+        batched_ids = [moment_id for batch in batches for moment_id, _ in batch]
+        self.assertEqual(sorted(batched_ids), [1, 2, 4])
+        self.assertEqual(duplicates, {1: [(3, moments[2])]})
+        self.assertEqual(self.analyzer.metrics['deduped_calls_saved'], 1)
+
+
+class FanOutTest(unittest.TestCase):
+
+    def test_thoughts_are_copied_to_duplicates(self):
+        first, duplicate, other = moment(100, 130), moment(100, 130), moment(200, 230)
+        thought = {
+            'moment_id': "moment_001",
+            'expanded_start': 95.0,
+            'expanded_end': 140.0,
+            'original_moment': first
+        }
+
+        results = ThoughtBoundaryAnalyzer.fan_out(
+            [(1, first), (2, other)], [thought, None], {1: [(3, duplicate)]}
+        )
+
+        self.assertEqual([moment_id for moment_id, _ in results], [1, 3, 2])
+        self.assertIs(results[0][1], thought)
+        copy = results[1][1]
+        self.assertEqual(copy['moment_id'], "moment_003")
+        self.assertIs(copy['original_moment'], duplicate)
+        self.assertEqual(copy['expanded_start'], 95.0)
+        self.assertEqual(thought['moment_id'], "moment_001")  # Original left alone
+        self.assertIsNone(results[2][1])
+
+    def test_failed_thought_stays_failed_for_duplicates(self):
+        first, duplicate = moment(100, 130), moment(100, 130)
+
+        results = ThoughtBoundaryAnalyzer.fan_out([(1, first)], [None], {1: [(2, duplicate)]})
+
+        self.assertEqual(results, [(1, None), (2, None)])
+
+
+if __name__ == '__main__':
+    unittest.main()
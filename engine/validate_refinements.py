@@ -56,6 +56,9 @@ def check_layer2_changes():
         rough_end=10.0
     )
 
+    # Instructions live in the system prompt; the user prompt carries only the moment
+    prompt = analyzer.SYSTEM_PROMPT + prompt
+
     if "NEVER expand more than 30 seconds" in prompt:
         print("  ✓ Hard constraints (30s) in prompt")
     else: